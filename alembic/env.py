@@ -15,7 +15,7 @@ sys.path.append(os.getcwd())
 # 2. Import Settings & Models
 from app.core.config import settings
 from app.core.database import Base
-from app.models import user, board, comment # 모든 모델 임포트 필수
+from app.models import user, board, comment, stored_file, outbox_message # 모든 모델 임포트 필수
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -1,11 +1,18 @@
 from celery import Celery
+from celery.signals import setup_logging, worker_process_init, worker_process_shutdown
 from app.core.config import settings
 
 celery_app = Celery(
     "worker",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_BROKER_URL,
-    include=["app.tasks.email_task"]
+    include=[
+        "app.tasks.email_task",
+        "app.tasks.board_task",
+        "app.tasks.user_task",
+        "app.tasks.image_task",
+        "app.tasks.file_task",
+    ]
 )
 
 celery_app.conf.update(
@@ -14,4 +21,47 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="Asia/Seoul",
     enable_utc=True,
+    # 결과가 필요한 태스크만 @celery_app.task(ignore_result=False)로 개별 지정
+    task_ignore_result=settings.CELERY_TASK_IGNORE_RESULT,
+    # [Spring: @Scheduled] celery beat로 실행되는 주기 작업
+    beat_schedule={
+        "reclaim-unreferenced-files": {
+            "task": "app.tasks.file_task.reclaim_unreferenced_files",
+            "schedule": settings.FILE_GC_INTERVAL_SECONDS,
+        },
+        "sweep-orphaned-files": {
+            "task": "app.tasks.file_task.sweep_orphaned_files",
+            "schedule": settings.FILE_ORPHAN_SWEEP_INTERVAL_SECONDS,
+        },
+        "reclaim-abandoned-uploads": {
+            "task": "app.tasks.file_task.reclaim_abandoned_uploads",
+            "schedule": settings.UPLOAD_SESSION_GC_INTERVAL_SECONDS,
+        },
+    },
 )
+
+# 워커 로그도 API와 같은 Loguru 포맷 사용 (Celery의 기본 로깅 설정 대신 한 번만 설정)
+@setup_logging.connect
+def configure_worker_logging(**kwargs):
+    from app.core.logger import setup_logger
+
+    setup_logger()
+
+# 트레이싱은 fork 이후 각 워커 프로세스에서 설정 (내보내기 스레드가 자식 프로세스에 복제되지 않음)
+@worker_process_init.connect
+def init_worker_tracing(**kwargs):
+    from app.core.tracing import setup_tracing
+
+    setup_tracing(service_name=f"{settings.OTEL_SERVICE_NAME}-worker")
+
+# 워커 프로세스 종료 시 재사용하던 SMTP 연결 정리 + 남은 트레이스 전송
+@worker_process_shutdown.connect
+def close_worker_resources(**kwargs):
+    from app.core.mailer import close_smtp_connection
+    from app.core.tracing import shutdown_tracing
+
+    close_smtp_connection()
+    shutdown_tracing()
+
+# 태스크 메트릭 시그널 등록 (발행 측 API 프로세스도 발행 시각 헤더를 붙이기 위해 함께 import)
+import app.core.celery_metrics  # noqa: E402,F401
@@ -0,0 +1,130 @@
+import os
+import time
+import redis
+from celery.signals import (
+    before_task_publish, task_prerun, task_postrun, task_retry, worker_init, worker_ready, worker_process_shutdown,
+)
+from prometheus_client import Counter, Histogram, CollectorRegistry, REGISTRY, start_http_server
+from prometheus_client.core import GaugeMetricFamily
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.metrics import MULTIPROC_DIR_ENV, LockedMultiProcessCollector, archive_dead_process, reset_multiprocess_dir
+
+# [Spring: Micrometer + Actuator] Celery 워커 메트릭
+# API는 prometheus_fastapi_instrumentator가 /metrics를 제공하고,
+# 워커는 Celery 시그널로 수집한 값을 CELERY_METRICS_PORT의 작은 HTTP 서버로 노출합니다.
+# prefork 풀은 태스크를 fork된 자식 프로세스에서 실행하므로, PROMETHEUS_MULTIPROC_DIR(docker-compose/Dockerfile에서 설정)에
+# 프로세스별 파일로 기록하고 메인 프로세스의 HTTP 서버가 합산합니다.
+
+PUBLISHED_AT_HEADER = "published_at"
+
+TASK_RUNTIME = Histogram(
+    "celery_task_runtime_seconds",
+    "태스크 실행 시간",
+    ["task"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300),
+)
+TASK_QUEUE_WAIT = Histogram(
+    "celery_task_queue_wait_seconds",
+    "발행부터 워커가 실행을 시작하기까지 걸린 시간",
+    ["task"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 1800),
+)
+TASK_COMPLETED = Counter(
+    "celery_tasks_total",
+    "태스크 처리 결과별 횟수 (state: success / failure / retry)",
+    ["task", "state"],
+)
+
+# task_id -> 실행 시작 시각 (prerun/postrun 사이)
+_started_at: dict[str, float] = {}
+
+@before_task_publish.connect
+def add_published_at_header(headers=None, **kwargs):
+    # 발행 시각을 메시지 헤더에 기록해 워커에서 대기 시간을 계산 (outbox 디스패처/태스크 모두 이 경로로 발행)
+    if headers is not None:
+        headers.setdefault(PUBLISHED_AT_HEADER, time.time())
+
+def _published_at(request) -> float | None:
+    # 프로토콜/실행 방식에 따라 커스텀 헤더가 request 속성 또는 request.headers에 들어옴
+    published_at = getattr(request, PUBLISHED_AT_HEADER, None)
+    if published_at is None:
+        published_at = (getattr(request, "headers", None) or {}).get(PUBLISHED_AT_HEADER)
+    return published_at
+
+@task_prerun.connect
+def record_task_start(task_id=None, task=None, **kwargs):
+    now = time.time()
+    _started_at[task_id] = time.perf_counter()
+
+    published_at = _published_at(task.request)
+    if published_at is not None:
+        TASK_QUEUE_WAIT.labels(task=task.name).observe(max(now - published_at, 0))
+
+@task_postrun.connect
+def record_task_end(task_id=None, task=None, state=None, **kwargs):
+    started_at = _started_at.pop(task_id, None)
+    if started_at is not None:
+        TASK_RUNTIME.labels(task=task.name).observe(time.perf_counter() - started_at)
+
+    # 재시도는 task_retry에서 따로 집계 (postrun의 state는 RETRY)
+    if state in ("SUCCESS", "FAILURE"):
+        TASK_COMPLETED.labels(task=task.name, state=state.lower()).inc()
+
+@task_retry.connect
+def record_task_retry(sender=None, **kwargs):
+    TASK_COMPLETED.labels(task=sender.name, state="retry").inc()
+
+class QueueLengthCollector:
+    """스크레이프 시점에 브로커(Redis) 큐 길이를 조회 (대기 중인 태스크 수)"""
+
+    def __init__(self, queues: list[str]):
+        self.queues = queues
+        self.client = redis.Redis(
+            host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB, socket_timeout=2
+        )
+
+    def collect(self):
+        metric = GaugeMetricFamily("celery_queue_length", "브로커에서 대기 중인 메시지 수", labels=["queue"])
+        try:
+            with self.client.pipeline(transaction=False) as pipe:
+                for queue in self.queues:
+                    pipe.llen(queue)
+                lengths = pipe.execute()
+        except redis.RedisError:
+            logger.warning("⚠️ Failed to read Celery queue length from broker")
+            return
+        for queue, length in zip(self.queues, lengths):
+            metric.add_metric([queue], length)
+        yield metric
+
+def _build_registry() -> CollectorRegistry:
+    # PROMETHEUS_MULTIPROC_DIR이 없으면 solo/threads 풀처럼 같은 프로세스의 값만 노출
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        registry = CollectorRegistry()
+        LockedMultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+@worker_init.connect
+def reset_metrics_dir(**kwargs):
+    # 풀 프로세스를 fork 하기 전(메인 프로세스)에 이전 실행의 파일 정리 (재시작 후 값이 이어지거나 pid가 겹치지 않도록)
+    path = os.environ.get(MULTIPROC_DIR_ENV)
+    if path:
+        reset_multiprocess_dir(path)
+
+@worker_ready.connect
+def start_metrics_server(sender=None, **kwargs):
+    if not settings.CELERY_METRICS_ENABLED:
+        return
+    registry = _build_registry()
+    queues = [queue.name for queue in sender.app.amqp.queues.values()] if sender else ["celery"]
+    registry.register(QueueLengthCollector(queues))
+    start_http_server(settings.CELERY_METRICS_PORT, registry=registry)
+    logger.info(f"📈 Celery metrics exposed on :{settings.CELERY_METRICS_PORT}/metrics")
+
+@worker_process_shutdown.connect
+def mark_metrics_process_dead(pid=None, **kwargs):
+    # 종료(max-tasks-per-child 교체 포함)된 자식의 누적값은 아카이브로 합치고 gauge 파일은 제거 (mark_process_dead)
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        archive_dead_process(pid or os.getpid())
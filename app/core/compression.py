@@ -0,0 +1,152 @@
+import gzip
+from typing import Callable
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.timing import span
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 (없으면 br은 협상 대상에서 빠짐)
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 (없으면 zstd는 협상 대상에서 빠짐)
+    zstandard = None
+
+# [Spring: server.compression.enabled + min-response-size]
+# JSON 응답(본문 전체가 들어 있는 게시글 목록 등)을 Accept-Encoding에 맞춰 br/zstd/gzip으로 압축합니다.
+# - CompressionMiddleware: 일반 응답을 응답 시점에 압축 (COMPRESSION_MIN_SIZE 미만은 압축 이득보다 비용이 커서 그대로)
+# - PrecompressedResponse: 캐시에 인코딩별로 미리 압축해 둔 본문을 그대로 응답 (미들웨어는 Content-Encoding이 있으면 건너뜀)
+#   -> 캐시 히트마다 같은 본문을 다시 압축하지 않음 (압축은 캐시를 채울 때 한 번)
+
+IDENTITY = "identity"
+# 이 크기 이상은 스레드풀에서 압축 (zlib/brotli/zstd는 GIL을 풀기 때문에 그동안 이벤트 루프가 다른 요청을 처리)
+THREADPOOL_MIN_SIZE = 64 * 1024
+# 압축할 Content-Type (이미지/동영상 등은 이미 압축된 형식이라 제외)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+def _gzip(body: bytes) -> bytes:
+    # mtime=0: 같은 본문이면 항상 같은 결과 (캐시/ETag에 유리)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+def _brotli(body: bytes) -> bytes:
+    return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+def _zstd(body: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compress(body)
+
+# q값이 같으면 앞에 있는 인코딩을 선택 (압축률: br > zstd > gzip)
+ENCODERS: dict[str, Callable[[bytes], bytes]] = {}
+if brotli is not None:
+    ENCODERS["br"] = _brotli
+if zstandard is not None:
+    ENCODERS["zstd"] = _zstd
+ENCODERS["gzip"] = _gzip
+
+def negotiate_encoding(accept_encoding: str | None) -> str:
+    """Accept-Encoding(q값 포함)에서 지원하는 인코딩 중 하나를 선택, 없으면 identity"""
+    if not accept_encoding or not settings.COMPRESSION_ENABLED:
+        return IDENTITY
+    qvalues: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[name.strip().lower()] = q
+
+    selected, selected_q = IDENTITY, 0.0
+    for encoding in ENCODERS:
+        q = qvalues.get(encoding, qvalues.get("*", 0.0))
+        if q > selected_q:
+            selected, selected_q = encoding, q
+    return selected
+
+async def compress(body: bytes, encoding: str) -> bytes:
+    with span("compress"):
+        if len(body) < THREADPOOL_MIN_SIZE:
+            return ENCODERS[encoding](body)
+        return await run_in_threadpool(ENCODERS[encoding], body)
+
+def _encode_all(body: bytes) -> dict[str, bytes]:
+    return {encoding: encoder(body) for encoding, encoder in ENCODERS.items()}
+
+async def encode_variants(body: bytes) -> dict[str, bytes]:
+    """캐시에 저장할 인코딩별 본문 (원본 포함, 작은 본문은 원본만)"""
+    if len(body) < settings.COMPRESSION_MIN_SIZE:
+        return {IDENTITY: body}
+    # 인코딩 여러 개를 한 번에 압축하므로 크기와 관계없이 스레드풀에서
+    with span("compress"):
+        variants = await run_in_threadpool(_encode_all, body)
+    return {IDENTITY: body, **variants}
+
+class PrecompressedResponse(Response):
+    """이미 인코딩된 본문 응답 (encoding이 identity면 원본)"""
+
+    def __init__(self, body: bytes, encoding: str = IDENTITY, media_type: str = "application/json"):
+        headers = {"Vary": "Accept-Encoding"}
+        if encoding != IDENTITY:
+            headers["Content-Encoding"] = encoding
+        super().__init__(content=body, media_type=media_type, headers=headers)
+
+def _is_compressible(headers: Headers) -> bool:
+    return headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+
+class CompressionMiddleware:
+    """
+    응답 본문을 협상한 인코딩으로 압축
+    한 번에 보내는 본문만 압축하고, 스트리밍 응답(파일 전송, 프로파일 결과 등)은 그대로 전달합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding == IDENTITY:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if "content-encoding" in headers or not _is_compressible(headers):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # 본문을 보고 압축 여부를 정해야 하므로 헤더는 본문과 함께 전송
+                    start_message = message
+                return
+
+            passthrough = True
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if not message.get("more_body", False) and len(body) >= settings.COMPRESSION_MIN_SIZE:
+                body = await compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                message = {**message, "body": body}
+            await send(start_message)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
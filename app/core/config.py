@@ -21,12 +21,93 @@ class Settings(BaseSettings):
     # Uploads
     UPLOAD_DIR: str = "app/static/uploads"
     STATIC_DIR: Path = BASE_DIR / "app" / "static"
+    # 정적 파일 전송 방식 ("app": StaticFiles로 직접 서빙(개발용) / "nginx": Nginx가 sendfile로 서빙)
+    STATIC_DELIVERY: str = "app"
+    STATIC_X_ACCEL_LOCATION: str = "/_protected_static/"  # nginx의 internal location과 일치해야 함
+    STATIC_CACHE_MAX_AGE: int = 365 * 24 * 60 * 60
+    UPLOAD_MAX_SIZE: int = 10 * 1024 * 1024  # 10MB
+    UPLOAD_CHUNK_SIZE: int = 64 * 1024  # 스트리밍 저장 시 한 번에 읽고 쓰는 크기 (업로드당 메모리 사용량 상한)
+    UPLOAD_MAX_CONCURRENT_WRITES: int = 8  # 동시에 디스크에 쓰는 업로드 수 제한
+    UPLOAD_ALLOWED_EXTENSIONS: set[str] = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+
+    # Resumable Upload (세션 생성 -> offset 지정 청크 PUT -> 완료)
+    UPLOAD_SESSION_CHUNK_SIZE: int = 5 * 1024 * 1024  # 클라이언트에 권장하는 청크 크기 (nginx client_max_body_size 이하)
+    UPLOAD_SESSION_TTL_SECONDS: int = 24 * 60 * 60  # 마지막 청크 이후 이 시간이 지나면 세션/임시 파일 정리
+    UPLOAD_SESSION_GC_INTERVAL_SECONDS: int = 60 * 60
+
+    # Storage Backend ("local": UPLOAD_DIR에 저장 / "s3": S3 호환 오브젝트 스토리지)
+    STORAGE_BACKEND: str = "local"
+    S3_BUCKET: str | None = None
+    S3_ENDPOINT_URL: str | None = None  # MinIO/R2 등 S3 호환 스토리지 주소 (AWS S3는 비워둠)
+    S3_REGION: str | None = None
+    S3_ACCESS_KEY_ID: str | None = None
+    S3_SECRET_ACCESS_KEY: str | None = None
+    S3_PUBLIC_URL: str | None = None  # 업로드된 파일의 공개 URL prefix (CDN 주소 등)
+    PRESIGNED_UPLOAD_EXPIRE_SECONDS: int = 10 * 60
+
+    # 참조 수가 0이 된 파일을 실제로 지우기 전 유예 시간 (같은 파일 재업로드/롤백 대비)
+    FILE_GC_GRACE_SECONDS: int = 60 * 60
+    FILE_GC_INTERVAL_SECONDS: int = 10 * 60
+    # 스토리지 전체를 훑어 어디서도 참조하지 않는 고아 파일을 찾는 주기 (커밋 실패 등으로 남은 파일)
+    FILE_ORPHAN_SWEEP_INTERVAL_SECONDS: int = 6 * 60 * 60
+
+    # Image Variants (Celery 워커가 업로드 후 생성하는 축소/재인코딩 이미지, 긴 변 기준 px)
+    IMAGE_THUMBNAIL_SIZE: int = 320
+    IMAGE_MEDIUM_SIZE: int = 1024
+    IMAGE_QUALITY: int = 82
+
+    # Purge (대용량 삭제)
+    # 댓글 수가 이 값 이하인 게시글은 즉시 삭제하고, 초과하면 숨김 처리 후 Celery로 배치 삭제
+    BOARD_PURGE_INLINE_LIMIT: int = 1000
+    PURGE_BATCH_SIZE: int = 500
+    PURGE_BATCH_INTERVAL: float = 0.05  # 배치 사이 대기 시간(초), 락 경합 완화용
 
     # DB URL 자동 생성
     @property
     def SQLALCHEMY_DATABASE_URL(self) -> str:
         return f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"  # text | json (로그 수집기로 보낼 때)
+    LOG_INFO_SAMPLE_RATE: float = 1.0  # INFO 이하 로그를 남길 비율 (0.1이면 10%만 기록, WARNING 이상은 항상 기록)
+    LOG_QUEUE_SIZE: int = 10000  # 출력 대기 로그 최대 개수 (가득 차면 로그 호출이 출력을 기다림)
+
+    # Production Server (python -m app.server, gunicorn + uvicorn 워커)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0  # 0이면 CPU 코어 수
+    SERVER_BACKLOG: int = 2048  # 아직 accept 하지 못한 연결 대기열 크기 (커널 somaxconn 이하로 적용됨)
+    SERVER_KEEPALIVE: int = 75  # 유휴 keep-alive 연결 유지 시간(초), nginx upstream keepalive_timeout(60초)보다 길게
+    SERVER_MAX_REQUESTS: int = 10000  # 워커가 이만큼 처리하면 교체 (메모리 단편화/누수 대비, 0이면 끄기)
+    SERVER_MAX_REQUESTS_JITTER: int = 1000
+    SERVER_TIMEOUT: int = 60  # 워커가 이 시간 동안 응답(heartbeat)이 없으면 마스터가 재시작
+    SERVER_GRACEFUL_TIMEOUT: int = 30  # 재시작/종료 시 처리 중인 요청을 마칠 때까지 기다리는 시간(초)
+
+    # Load Shedding (워커별 적응형 동시 처리 수 제한, 넘치면 잠깐 대기 후 503 + Retry-After)
+    LOAD_SHED_ENABLED: bool = True
+    LOAD_SHED_INITIAL_LIMIT: int = 50  # 시작 limit (DB 풀 pool_size + max_overflow = 30 근처에서 응답 시간을 보고 조정)
+    LOAD_SHED_MIN_LIMIT: int = 5
+    LOAD_SHED_MAX_LIMIT: int = 500
+    LOAD_SHED_LATENCY_TOLERANCE: float = 1.5  # 최근 응답 시간이 평소의 이 배수를 넘으면 limit을 줄임
+    LOAD_SHED_QUEUE_TIMEOUT: float = 0.5  # 자리가 날 때까지 기다리는 최대 시간(초), 넘으면 503
+    LOAD_SHED_RETRY_AFTER: int = 1  # 503 응답의 Retry-After(초)
+
+    # Request Deadline (요청별 마감, 하위 Redis/httpx/DB 호출은 남은 시간까지만 기다림)
+    REQUEST_DEADLINE_ENABLED: bool = True
+    REQUEST_DEADLINE_SECONDS: float = 30  # 기본 마감 (라우트별로 RouteDeadline 의존성으로 변경)
+    REQUEST_DEADLINE_CANCEL_GRACE: float = 0.5  # 마감 후 이 시간까지 끝나지 않으면 요청 태스크를 취소(초)
+
+    # Response Compression (Accept-Encoding에 따라 br/zstd/gzip, br/zstd는 패키지가 설치되어 있을 때만)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # 이 크기(bytes) 미만의 응답은 압축하지 않음
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5  # 11(최대)은 압축이 수십 배 느려서 동적 응답에는 부적합
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Server-Timing (요청 구간별 소요 시간, 히스토그램은 항상 기록)
+    SERVER_TIMING_HEADER: bool = True  # 응답에 Server-Timing 헤더 포함 여부 (외부에 숨기려면 False)
+
     # Redis
     REDIS_HOST: str
     REDIS_PORT: int = 6379
@@ -36,6 +117,40 @@ class Settings(BaseSettings):
     def CELERY_BROKER_URL(self) -> str:
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
 
+    # Transactional Outbox (커밋된 태스크 발행 요청을 API 프로세스가 배치로 Celery에 발행)
+    OUTBOX_DISPATCHER_ENABLED: bool = True
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL: float = 1.0  # 다른 프로세스가 기록한 메시지를 확인하는 주기(초)
+
+    # In-process Job Runner (응답 이후 실행하는 가벼운 후속 작업)
+    JOB_RUNNER_QUEUE_SIZE: int = 1000  # 대기 작업이 이보다 많으면 새 작업은 버림
+    JOB_RUNNER_CONCURRENCY: int = 4
+    JOB_RUNNER_MAX_RETRIES: int = 2
+    JOB_RUNNER_RETRY_DELAY: float = 0.5  # 재시도 대기(초), 시도마다 2배
+    JOB_RUNNER_DRAIN_TIMEOUT: float = 10.0  # 종료 시 남은 작업을 처리하는 최대 시간(초)
+
+    # 이벤트 루프 지연 모니터 (event_loop_lag_seconds 히스토그램)
+    LOOP_MONITOR_ENABLED: bool = True
+    LOOP_MONITOR_INTERVAL: float = 0.5  # 측정 간격(초)
+    LOOP_MONITOR_DEBUG: bool = False  # 루프를 막은 호출의 스택/라우트를 로그로 남김 (감시 스레드 추가)
+    LOOP_BLOCK_THRESHOLD: float = 0.1  # 이 시간(초) 이상 지연되면 막힌 것으로 판단
+
+    # 관리자 전용 샘플링 프로파일러 (X-Profile 헤더 / POST /api/v1/admin/profile)
+    PROFILING_ENABLED: bool = False
+    PROFILING_MAX_SECONDS: float = 60  # 워커 전체 프로파일링 최대 시간(초)
+
+    # OpenTelemetry Tracing (켜면 OTLP/HTTP로 내보냄, 예: Jaeger/Tempo/OTel Collector의 4318 포트)
+    OTEL_ENABLED: bool = False
+    OTEL_SERVICE_NAME: str = "fastapi-enterprise"
+    OTEL_EXPORTER_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    OTEL_TAIL_SAMPLE_RATE: float = 0.05  # 정상 트레이스 중 내보낼 비율 (에러/느린 트레이스는 항상)
+    OTEL_SLOW_TRACE_THRESHOLD_MS: float = 500  # 이 시간 이상 걸린 트레이스는 항상 내보냄
+
+    # Celery Worker
+    CELERY_TASK_IGNORE_RESULT: bool = True  # 결과를 읽는 곳이 없으므로 result backend에 저장하지 않음
+    CELERY_METRICS_ENABLED: bool = True
+    CELERY_METRICS_PORT: int = 9808  # 워커 메트릭 HTTP 서버 포트 (/metrics)
+
     # SMTP (Email)
     SMTP_HOST: str | None = None
     SMTP_PORT: int | None = None
@@ -43,6 +158,10 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str | None = None
     SMTP_TLS: bool = True
     SMTP_SSL: bool = False
+    SMTP_TIMEOUT_SECONDS: float = 10.0
+    SMTP_HEALTHCHECK_IDLE_SECONDS: float = 30.0  # 이 시간 이상 쓰지 않은 연결은 NOOP으로 확인 후 재사용
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100  # 연결 하나로 보낼 최대 메일 수 (초과 시 재연결)
+    SMTP_MAX_MESSAGES_PER_SECOND: float = 10.0  # 대량 발송 속도 제한 (0이면 제한 없음)
 
     # Google OAuth2
     GOOGLE_CLIENT_ID: str | None = None
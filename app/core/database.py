@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
 
 # [Spring: DataSource] 비동기 커넥션 풀(Async Connection Pool) 생성
@@ -22,6 +23,19 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False
 )
 
+# [Celery Worker 전용 세션 공장]
+# 워커는 태스크마다 asyncio.run()으로 새 이벤트 루프를 만들기 때문에,
+# 이전 루프에 묶인 커넥션을 재사용하지 않도록 NullPool 엔진을 별도로 사용합니다.
+task_engine = create_async_engine(settings.SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+
+TaskSessionLocal = async_sessionmaker(
+    bind=task_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False
+)
+
 # [JPA: @Entity가 상속받을 부모 클래스]
 # 모든 모델(Entity)은 이 Base를 상속받아야 DB 테이블로 인식됩니다.
 Base = declarative_base()
@@ -0,0 +1,224 @@
+import asyncio
+import math
+import sys
+import time
+from contextvars import ContextVar
+from typing import Awaitable, TypeVar
+from fastapi import HTTPException, status
+from prometheus_client import Counter
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.request_context import is_multipart_request, route_template
+
+# asyncio.timeout은 3.11.3 이전 버전에 문제가 있어 redis-py와 같은 기준으로 async-timeout 패키지 사용
+if sys.version_info >= (3, 11, 3):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
+
+# [Spring: Resilience4j TimeLimiter + gRPC Deadline 전파]
+# 클라이언트가 이미 포기한 요청이 느린 쿼리/멈춘 Redis 호출을 붙잡고 워커와 풀 커넥션을 계속 차지하지 않도록,
+# 요청마다 마감 시각(deadline)을 contextvar에 두고 하위 호출이 남은 시간만큼만 기다리게 합니다.
+# - httpx: 남은 시간으로 타임아웃 (with_deadline, 태스크를 새로 만들지 않고 현재 태스크에 타이머만 검)
+# - Redis: 명령마다 타이머를 두지 않고 보내기 전에 마감만 확인 (check_deadline, 캐시 GET마다 드는 비용을 없앰)
+# - MariaDB: SELECT에 SET STATEMENT max_statement_time=남은 시간 (DB가 쿼리를 중단하므로 커넥션은 정상 상태로 반납)
+# - 위에서 끝나지 않은 호출(실행 중인 Redis 명령 등)은 마감 + grace 시점에 요청 태스크 자체를 취소 (요청당 타이머 1개)
+# 기본 마감은 REQUEST_DEADLINE_SECONDS, 라우트마다 Depends(RouteDeadline(seconds=...))로 바꿀 수 있습니다.
+# multipart 요청(게시글 이미지, 프로필 이미지)은 본문 수신이 끝난 시점부터 계산 (느린 클라이언트의 업로드 시간이 마감을 소모하지 않도록)
+# (FastAPI는 Form/File 파라미터가 있으면 핸들러 실행 전에 본문을 모두 받으므로 핸들러 처리 시간에는 항상 마감이 적용됨)
+
+# 기본 마감을 적용하지 않는 경로 (본문 업로드가 느린 업로드, 수십 초씩 걸리는 관리자 프로파일링)
+DEADLINE_EXEMPT_PREFIXES = ("/metrics", "/api/v1/admin", "/api/v1/uploads")
+
+DEADLINE_EXCEEDED = Counter(
+    "http_request_deadline_exceeded_total",
+    "마감 시각을 넘겨 504로 끝난 요청 수 (stage: timeout = 하위 호출 타임아웃 / cancelled = 요청 태스크 취소)",
+    ["route", "stage"],
+)
+
+T = TypeVar("T")
+
+class DeadlineExceeded(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail="Request deadline exceeded")
+
+class Deadline:
+    """요청 1건의 마감 시각 (time.monotonic 기준) + 마감 후 요청 태스크를 취소하는 타이머"""
+    __slots__ = ("started_at", "at", "seconds", "waiting_body", "cancelled", "_task", "_handle")
+
+    def __init__(self, task: asyncio.Task | None, waiting_body: bool = False):
+        self.started_at = time.monotonic()
+        self.at: float | None = None
+        self.seconds: float | None = None
+        # 본문을 받는 동안은 마감을 시작하지 않음 (body_received 이후 started_at부터 계산)
+        self.waiting_body = waiting_body
+        # 타이머가 요청 태스크를 취소했는지 (다른 이유의 취소와 구분)
+        self.cancelled = False
+        self._task = task
+        self._handle: asyncio.TimerHandle | None = None
+
+    def set(self, seconds: float | None):
+        """요청 시작(본문이 있으면 본문 수신 완료) 시각 기준으로 마감 설정 (None이면 마감 없음)"""
+        self.seconds = seconds
+        self.at = None if seconds is None or self.waiting_body else self.started_at + seconds
+        self._schedule()
+
+    def body_received(self):
+        """본문 수신 완료: 이 시점부터 마감 계산 시작"""
+        if self.waiting_body:
+            self.waiting_body = False
+            self.started_at = time.monotonic()
+            self.set(self.seconds)
+
+    def remaining(self) -> float | None:
+        return None if self.at is None else self.at - time.monotonic()
+
+    def _schedule(self):
+        self.stop()
+        if self.at is None or self._task is None:
+            return
+        loop = self._task.get_loop()
+        # 하위 호출의 타임아웃(DB/Redis)이 먼저 정상적으로 끝낼 수 있도록 grace만큼 늦게 취소
+        delay = self.at + settings.REQUEST_DEADLINE_CANCEL_GRACE - time.monotonic()
+        self._handle = loop.call_at(loop.time() + max(delay, 0), self._cancel)
+
+    def _cancel(self):
+        if not self._task.done():
+            self.cancelled = True
+            self._task.cancel()
+
+    def stop(self):
+        """취소 타이머 해제 (응답을 시작한 뒤에는 취소하지 않음)"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+_deadline_var: ContextVar[Deadline | None] = ContextVar("request_deadline", default=None)
+
+def remaining_time() -> float | None:
+    """현재 요청의 남은 시간(초), 요청 밖이거나 마감이 없으면 None"""
+    deadline = _deadline_var.get()
+    return None if deadline is None else deadline.remaining()
+
+def check_deadline():
+    """마감이 이미 지났으면 DeadlineExceeded(504) - 타이머 없이 남은 시간만 확인"""
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded()
+
+async def with_deadline(awaitable: Awaitable[T]) -> T:
+    """남은 시간 안에 끝나지 않으면 취소하고 DeadlineExceeded(504)"""
+    remaining = remaining_time()
+    if remaining is None:
+        return await awaitable
+    if remaining <= 0:
+        # 코루틴을 실행하지 않고 버리는 경우 경고가 남지 않도록 닫음
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded()
+    # wait_for와 달리 별도 태스크를 만들지 않고 현재 태스크에서 실행
+    try:
+        async with async_timeout(remaining):
+            return await awaitable
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded() from None
+
+class RouteDeadline:
+    """
+    [Dependency] 라우트별 마감 (요청 시작 기준)
+    dependencies=[Depends(RouteDeadline(seconds=5))]
+    """
+    def __init__(self, seconds: float | None):
+        self.seconds = seconds
+
+    async def __call__(self):
+        deadline = _deadline_var.get()
+        if deadline is not None:
+            deadline.set(self.seconds)
+
+def with_statement_time(statement: str, seconds: float, is_mariadb: bool) -> str:
+    """SELECT 문에 서버 측 실행 시간 제한을 붙임 (MariaDB: SET STATEMENT, MySQL: 옵티마이저 힌트)"""
+    if is_mariadb:
+        # 0은 "제한 없음"이므로 1ms 미만으로 남은 경우도 최소 1ms로 (반올림해서 0.000이 되지 않도록)
+        return f"SET STATEMENT max_statement_time={max(seconds, 0.001):.3f} FOR {statement}"
+    stripped = statement.lstrip()
+    return f"{stripped[:6]} /*+ MAX_EXECUTION_TIME({math.ceil(seconds * 1000)}) */{stripped[6:]}"
+
+@event.listens_for(Engine, "before_cursor_execute", retval=True)
+def _apply_statement_deadline(conn, cursor, statement, parameters, context, executemany):
+    # 쓰기 문은 중간에 끊으면 재시도/정합성 처리가 복잡해지므로 조회(SELECT)만 제한
+    if executemany or conn.dialect.name != "mysql":
+        return statement, parameters
+    remaining = remaining_time()
+    if remaining is None or statement.lstrip()[:6].upper() != "SELECT":
+        return statement, parameters
+    if remaining <= 0:
+        raise DeadlineExceeded()
+    return with_statement_time(statement, remaining, conn.dialect.is_mariadb), parameters
+
+class DeadlineMiddleware:
+    """요청마다 마감을 설정하고, 마감이 지나 실패하거나 취소된 요청은 504로 응답"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not settings.REQUEST_DEADLINE_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        deadline = Deadline(asyncio.current_task(), waiting_body=is_multipart_request(scope))
+        # 제외 경로도 Deadline은 두어 라우트가 RouteDeadline으로 직접 설정할 수 있게 함
+        if not scope["path"].startswith(DEADLINE_EXEMPT_PREFIXES):
+            deadline.set(settings.REQUEST_DEADLINE_SECONDS)
+        token = _deadline_var.set(deadline)
+        response_started = False
+
+        async def receive_with_deadline() -> Message:
+            message = await receive()
+            if deadline.waiting_body and (message["type"] != "http.request" or not message.get("more_body", False)):
+                deadline.body_received()
+            return message
+
+        async def send_with_deadline(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                deadline.stop()
+                # 하위 호출 타임아웃으로 DeadlineExceeded(504)가 응답된 경우
+                if message["status"] == status.HTTP_504_GATEWAY_TIMEOUT:
+                    DEADLINE_EXCEEDED.labels(route=route_template(scope) or "unmatched", stage="timeout").inc()
+            await send(message)
+
+        try:
+            await self.app(scope, receive_with_deadline if deadline.waiting_body else receive, send_with_deadline)
+        except asyncio.CancelledError:
+            if not deadline.cancelled:
+                raise
+            # 직접 취소한 것이므로 취소 상태를 되돌림 (Python 3.11+)
+            task = asyncio.current_task()
+            if hasattr(task, "uncancel"):
+                task.uncancel()
+            await self._timeout_response(scope, receive, send, response_started, "cancelled")
+        except Exception:
+            # 마감이 지난 뒤의 실패(DB의 max_statement_time 초과 등)는 504로
+            remaining = deadline.remaining()
+            if remaining is None or remaining > 0 or response_started:
+                raise
+            await self._timeout_response(scope, receive, send, response_started, "timeout")
+        finally:
+            deadline.stop()
+            _deadline_var.reset(token)
+
+    @staticmethod
+    async def _timeout_response(scope: Scope, receive: Receive, send: Send, response_started: bool, stage: str):
+        route = route_template(scope) or "unmatched"
+        DEADLINE_EXCEEDED.labels(route=route, stage=stage).inc()
+        logger.warning(f"⏱️ Request deadline exceeded ({scope['method']} {route}, {stage})")
+        if not response_started:
+            response = JSONResponse({"detail": "Request deadline exceeded"}, status_code=status.HTTP_504_GATEWAY_TIMEOUT)
+            await response(scope, receive, send)
@@ -8,17 +8,13 @@ from app.core.config import settings
 from app.repository import user_repository
 from app.models.user import User, UserRole
 from app.core.redis import redis_client
+from app.core.timing import timed
 
 # 토큰을 직접 입력할 수 있는 Bearer Token 스키마 설정
 security = HTTPBearer()
 
-# [보안 의존성] 현재 로그인한 유저 가져오기
-async def get_current_user(
-    request: Request,
-    auth: HTTPAuthorizationCredentials = Depends(security), 
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    token = auth.credentials
+# 토큰으로 유저 확인 (의존성 주입 밖 - 미들웨어 등 - 에서도 사용)
+async def authenticate_token(db: AsyncSession, token: str) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -46,8 +42,19 @@ async def get_current_user(
         
     # 3. 유저 조회
     user = await user_repository.get_user(db, email=email)
-    if user is None:
+    if user is None or user.deleted_at is not None:
         raise credentials_exception
+    return user
+
+# [보안 의존성] 현재 로그인한 유저 가져오기
+# JWT 검증 + Redis 세션 확인 + 유저 조회 시간을 auth 구간으로 기록 (Server-Timing)
+@timed("auth")
+async def get_current_user(
+    request: Request,
+    auth: HTTPAuthorizationCredentials = Depends(security), 
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    user = await authenticate_token(db, auth.credentials)
         
     # [추가] request.state에 유저 정보 저장 (RateLimiter 등에서 활용)
     request.state.user = user
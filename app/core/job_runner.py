@@ -0,0 +1,130 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+from prometheus_client import Counter, Gauge, Histogram
+from app.core.config import settings
+from app.core.logger import logger
+
+# [Spring: @Async + ThreadPoolTaskExecutor(queueCapacity, corePoolSize)]
+# 캐시 무효화처럼 Celery 왕복(브로커 발행 -> 워커)을 쓰기엔 작지만 응답을 늦출 필요도 없는 후속 작업을
+# API 프로세스 안에서 실행합니다. 프로세스가 죽으면 큐에 남은 작업은 사라지므로,
+# 반드시 실행되어야 하는 작업은 outbox.enqueue()로 Celery에 맡겨야 합니다.
+
+JOB_RESULTS = Counter(
+    "job_runner_jobs_total",
+    "인프로세스 작업 처리 결과별 횟수 (state: success / failure / retry / rejected)",
+    ["job", "state"],
+)
+JOB_DURATION = Histogram(
+    "job_runner_job_duration_seconds",
+    "인프로세스 작업 실행 시간",
+    ["job"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+# 멀티 프로세스 모드에서는 살아 있는 워커의 값만 합산
+JOB_QUEUE_SIZE = Gauge("job_runner_queue_size", "실행을 기다리는 인프로세스 작업 수", multiprocess_mode="livesum")
+
+JobFunc = Callable[..., Awaitable[Any]]
+
+def _job_name(func: JobFunc) -> str:
+    return f"{func.__module__}.{func.__qualname__}"
+
+class JobRunner:
+    """
+    크기가 제한된 asyncio.Queue + 고정 개수의 워커 코루틴
+    - 큐가 가득 차면 작업을 버림 (요청 경로를 막지 않음)
+    - 실패한 작업은 지수 백오프로 재시도
+    - 종료 시 남은 작업을 제한 시간 동안 처리한 뒤 워커 종료
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = settings.JOB_RUNNER_QUEUE_SIZE,
+        concurrency: int = settings.JOB_RUNNER_CONCURRENCY,
+        max_retries: int = settings.JOB_RUNNER_MAX_RETRIES,
+        retry_delay: float = settings.JOB_RUNNER_RETRY_DELAY,
+    ):
+        self.max_queue_size = max_queue_size
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._queue: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def submit(self, func: JobFunc, *args, **kwargs) -> bool:
+        """응답 경로와 분리해 func(*args, **kwargs)를 실행 (결과를 기다리지 않음)"""
+        name = _job_name(func)
+        if not self.running:
+            # lifespan 밖(스크립트, Celery 태스크 등)에서는 실행할 워커가 없음
+            logger.warning(f"⚠️ Job runner is not running, dropped job: {name}")
+            JOB_RESULTS.labels(job=name, state="rejected").inc()
+            return False
+        try:
+            self._queue.put_nowait((func, args, kwargs))
+        except asyncio.QueueFull:
+            logger.warning(f"⚠️ Job queue is full ({self.max_queue_size}), dropped job: {name}")
+            JOB_RESULTS.labels(job=name, state="rejected").inc()
+            return False
+        JOB_QUEUE_SIZE.set(self._queue.qsize())
+        return True
+
+    async def _execute(self, func: JobFunc, args: tuple, kwargs: dict):
+        name = _job_name(func)
+        for attempt in range(self.max_retries + 1):
+            started_at = time.perf_counter()
+            try:
+                await func(*args, **kwargs)
+            except Exception:
+                JOB_DURATION.labels(job=name).observe(time.perf_counter() - started_at)
+                if attempt == self.max_retries:
+                    logger.exception(f"❌ Job failed after {attempt + 1} attempts: {name}")
+                    JOB_RESULTS.labels(job=name, state="failure").inc()
+                    return
+                JOB_RESULTS.labels(job=name, state="retry").inc()
+                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+            else:
+                JOB_DURATION.labels(job=name).observe(time.perf_counter() - started_at)
+                JOB_RESULTS.labels(job=name, state="success").inc()
+                return
+
+    async def _worker(self):
+        while True:
+            func, args, kwargs = await self._queue.get()
+            JOB_QUEUE_SIZE.set(self._queue.qsize())
+            try:
+                await self._execute(func, args, kwargs)
+            finally:
+                self._queue.task_done()
+
+    def start(self):
+        # Queue는 처음 사용한 이벤트 루프에 묶이므로 실행 중인 루프에서 생성
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def join(self):
+        """지금까지 제출된 작업이 모두 끝날 때까지 대기"""
+        if self.running:
+            await self._queue.join()
+
+    async def stop(self, timeout: float = settings.JOB_RUNNER_DRAIN_TIMEOUT):
+        if not self.running:
+            return
+        workers, self._workers = self._workers, []  # 이후 submit()은 거부
+
+        drain = asyncio.ensure_future(self._queue.join())
+        await asyncio.wait({drain}, timeout=timeout)
+        if not drain.done():
+            drain.cancel()
+            logger.warning(f"⚠️ Job runner stopped with {self._queue.qsize()} pending jobs")
+
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        JOB_QUEUE_SIZE.set(0)
+
+# API 프로세스당 1개 (lifespan에서 시작/종료)
+job_runner = JobRunner()
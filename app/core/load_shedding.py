@@ -0,0 +1,228 @@
+import asyncio
+import math
+import time
+from collections import deque
+from enum import IntEnum
+from prometheus_client import Counter, Gauge
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.request_context import is_multipart_request
+
+# [Spring: Resilience4j Bulkhead + Netflix concurrency-limits]
+# 트래픽이 몰리면 요청이 uvicorn과 DB 커넥션 풀 앞에 끝없이 쌓여 모든 요청의 지연이 함께 늘어납니다.
+# 워커마다 동시에 처리할 요청 수(limit)를 두고, 넘치는 요청은 잠깐만 기다리게 한 뒤 503 + Retry-After로 빨리 거절합니다.
+# limit은 관측한 응답 시간으로 조정합니다. (Gradient: 장기 평균 대비 최근 평균이 느려지면 줄이고, 회복되면 늘림)
+# 우선순위가 낮은 요청(쓰기/업로드)은 limit의 일부만 쓸 수 있어서, 과부하 시 인증/조회보다 먼저 거절됩니다.
+
+class Priority(IntEnum):
+    CRITICAL = 0  # 인증 (로그인/토큰 재발급이 막히면 모든 기능이 막힘)
+    NORMAL = 1  # 조회
+    LOW = 2  # 쓰기, 업로드
+
+# 우선순위별로 쓸 수 있는 limit 비율 (남은 자리는 더 높은 우선순위 몫)
+PRIORITY_SHARE = {Priority.CRITICAL: 1.0, Priority.NORMAL: 0.9, Priority.LOW: 0.7}
+
+# (메서드 또는 None, 경로 prefix, 우선순위) - 위에서부터 처음 맞는 규칙, 라우팅 전에 판단하므로 경로로만 구분
+PRIORITY_RULES: tuple[tuple[str | None, str, Priority], ...] = (
+    (None, "/api/v1/auth", Priority.CRITICAL),
+    (None, "/api/v1/uploads", Priority.LOW),
+    ("GET", "/", Priority.NORMAL),
+    ("HEAD", "/", Priority.NORMAL),
+    ("OPTIONS", "/", Priority.NORMAL),
+    (None, "/", Priority.LOW),
+)
+# 제한하지 않는 경로 (과부하 상황을 확인하는 메트릭, 수십 초씩 걸리는 관리자 프로파일링)
+EXEMPT_PREFIXES = ("/metrics", "/api/v1/admin")
+# 동시 처리 수는 제한하되 처리 시간은 limit 조정에 반영하지 않는 경로
+# (이어받기 업로드 청크는 핸들러 안에서 본문을 받으므로 처리 시간이 클라이언트 업로드 속도에 좌우됨)
+RTT_EXCLUDED_PREFIXES = ("/api/v1/uploads",)
+
+CONCURRENCY_LIMIT = Gauge(
+    "http_concurrency_limit", "워커별 동시 처리 요청 수 상한 (합계)", multiprocess_mode="livesum"
+)
+IN_FLIGHT = Gauge("http_requests_in_flight", "처리 중인 요청 수 (대기 제외)", multiprocess_mode="livesum")
+SHED_TOTAL = Counter("http_requests_shed_total", "과부하로 거절한 요청 수", ["priority"])
+
+def request_priority(method: str, path: str) -> Priority:
+    for rule_method, prefix, priority in PRIORITY_RULES:
+        if (rule_method is None or rule_method == method) and path.startswith(prefix):
+            return priority
+    return Priority.LOW
+
+class AdaptiveConcurrencyLimiter:
+    """
+    워커(이벤트 루프) 하나의 동시 처리 수 제한 (Gradient 방식, 한 스레드에서만 사용)
+    - 요청이 끝날 때마다 처리 시간(대기 제외)의 단기/장기 이동 평균을 갱신
+    - 단기 평균이 장기 평균 x tolerance보다 느려지면 limit을 줄이고, 아니면 sqrt(limit)만큼 여유를 두고 늘림
+    - limit의 절반도 쓰지 않는 동안은 조정하지 않음 (한가할 때 limit이 무한히 커지지 않도록)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 50,
+        min_limit: int = 5,
+        max_limit: int = 500,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        short_window: int = 10,
+        long_window: int = 600,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self._short_alpha = 2 / (short_window + 1)
+        self._long_alpha = 2 / (long_window + 1)
+        self.short_rtt: float | None = None
+        self.long_rtt: float | None = None
+        self.in_flight = 0
+        self._waiters: dict[Priority, deque[asyncio.Future]] = {priority: deque() for priority in Priority}
+        # 게이지는 요청을 처음 받을 때 기록 (preload한 gunicorn 마스터의 값이 합계에 섞이지 않도록)
+        self._reported = False
+
+    def _has_room(self, priority: Priority) -> bool:
+        return self.in_flight < max(1.0, self.limit * PRIORITY_SHARE[priority])
+
+    async def acquire(self, priority: Priority, timeout: float) -> bool:
+        """자리가 나면 True, timeout 안에 자리가 나지 않거나 대기열이 가득 차면 False"""
+        if not self._reported:
+            CONCURRENCY_LIMIT.set(self.limit)
+            self._reported = True
+        waiters = self._waiters[priority]
+        if not waiters and self._has_room(priority):
+            self._admit()
+            return True
+        # 대기열은 limit 크기까지만 (그 이상 기다려 봐야 timeout 안에 차례가 오지 않음)
+        if timeout <= 0 or sum(map(len, self._waiters.values())) >= self.limit:
+            return False
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        waiters.append(waiter)
+        timer = loop.call_later(timeout, self._expire, waiters, waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            # 자리를 받은 직후 클라이언트가 끊긴 경우 자리를 돌려줌
+            if waiter.done() and not waiter.cancelled() and waiter.result():
+                self.release(None)
+            raise
+        finally:
+            timer.cancel()
+            # 자리를 받지 못하고 끝난 대기(취소)는 대기열에서 바로 제거 (대기열 길이 상한에 계속 잡히지 않도록)
+            self._discard(waiters, waiter)
+
+    @classmethod
+    def _expire(cls, waiters: deque[asyncio.Future], waiter: asyncio.Future):
+        if not waiter.done():
+            waiter.set_result(False)
+        cls._discard(waiters, waiter)
+
+    @staticmethod
+    def _discard(waiters: deque[asyncio.Future], waiter: asyncio.Future):
+        # 자리를 넘겨받은 대기는 _wake_waiters에서 이미 꺼냄
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _admit(self):
+        self.in_flight += 1
+        IN_FLIGHT.inc()
+
+    def release(self, rtt: float | None):
+        """요청 1건 종료 (rtt: 처리 시간(초), 측정하지 않은 경우 None)"""
+        self.in_flight -= 1
+        IN_FLIGHT.dec()
+        if rtt is not None:
+            self._update(rtt)
+        self._wake_waiters()
+
+    def _update(self, rtt: float):
+        if self.short_rtt is None:
+            self.short_rtt = self.long_rtt = rtt
+            return
+        self.short_rtt += (rtt - self.short_rtt) * self._short_alpha
+        self.long_rtt += (rtt - self.long_rtt) * self._long_alpha
+        # 부하가 빠진 뒤 장기 평균이 높은 값에 머물러 있지 않도록 빠르게 따라 내려감
+        if self.long_rtt > self.short_rtt * 2:
+            self.long_rtt *= 0.95
+
+        if self.in_flight + 1 < self.limit / 2:
+            return
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_rtt / self.short_rtt))
+        new_limit = self.limit * gradient + math.sqrt(self.limit)
+        limit = self.limit * (1 - self.smoothing) + new_limit * self.smoothing
+        self.limit = max(self.min_limit, min(self.max_limit, limit))
+        CONCURRENCY_LIMIT.set(self.limit)
+
+    def _wake_waiters(self):
+        # 우선순위가 높은 대기열부터, 각 우선순위의 몫 안에서 자리를 넘겨줌
+        for priority in Priority:
+            waiters = self._waiters[priority]
+            while waiters and self._has_room(priority):
+                waiter = waiters.popleft()
+                if waiter.done():
+                    continue
+                self._admit()
+                waiter.set_result(True)
+
+concurrency_limiter = AdaptiveConcurrencyLimiter(
+    initial_limit=settings.LOAD_SHED_INITIAL_LIMIT,
+    min_limit=settings.LOAD_SHED_MIN_LIMIT,
+    max_limit=settings.LOAD_SHED_MAX_LIMIT,
+    tolerance=settings.LOAD_SHED_LATENCY_TOLERANCE,
+)
+
+class LoadSheddingMiddleware:
+    """동시 처리 수를 넘는 요청을 우선순위 대기열에서 기다리게 하고, 대기 시간이 지나면 503 + Retry-After"""
+
+    def __init__(self, app: ASGIApp, limiter: AdaptiveConcurrencyLimiter | None = None):
+        self.app = app
+        self.limiter = limiter or concurrency_limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not settings.LOAD_SHED_ENABLED or scope["path"].startswith(EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        priority = request_priority(scope["method"], scope["path"])
+        if not await self.limiter.acquire(priority, settings.LOAD_SHED_QUEUE_TIMEOUT):
+            SHED_TOTAL.labels(priority=priority.name.lower()).inc()
+            # 과부하 중에는 거절이 대량으로 발생하므로 INFO (LOG_INFO_SAMPLE_RATE 적용), 전체 수는 메트릭으로 확인
+            logger.info(
+                f"🚦 Request shed ({priority.name.lower()} {scope['method']} {scope['path']}, "
+                f"in_flight={self.limiter.in_flight}, limit={self.limiter.limit:.0f})"
+            )
+            response = JSONResponse(
+                {"detail": "Server is busy. Please retry later."},
+                status_code=503,
+                headers={"Retry-After": str(settings.LOAD_SHED_RETRY_AFTER)},
+            )
+            await response(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        rtt = None
+        waiting_body = is_multipart_request(scope)
+
+        async def receive_body() -> Message:
+            nonlocal started_at, waiting_body
+            message = await receive()
+            # multipart(게시글/프로필 이미지) 요청은 본문 수신이 끝난 시점부터 측정
+            # (느린 클라이언트의 업로드 시간이 모든 라우트의 limit을 줄이지 않도록)
+            if waiting_body and (message["type"] != "http.request" or not message.get("more_body", False)):
+                waiting_body = False
+                started_at = time.perf_counter()
+            return message
+
+        try:
+            await self.app(scope, receive_body if waiting_body else receive, send)
+            if not scope["path"].startswith(RTT_EXCLUDED_PREFIXES):
+                rtt = time.perf_counter() - started_at
+        finally:
+            # 예외로 끝난 요청은 처리 시간을 반영하지 않음 (빠른 실패가 limit을 키우지 않도록)
+            self.limiter.release(rtt)
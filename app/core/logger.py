@@ -1,47 +1,196 @@
+import atexit
+import json
 import logging
+import os
+import queue
+import random
 import sys
+import threading
+import traceback
 from loguru import logger
+from app.core.config import settings
+from app.core.request_context import get_request_id, get_route
 
 class InterceptHandler(logging.Handler):
     """
     Python 표준 logging 모듈의 로그를 Loguru로 가로채는 핸들러
+    (호출 위치는 스택 프레임을 거슬러 찾지 않고, 표준 LogRecord에 이미 있는 값을 patcher에서 사용)
     """
+    def __init__(self):
+        super().__init__()
+        # 레벨 이름 -> Loguru 레벨 매핑 캐시 (logger.level() 조회는 잠금을 잡음)
+        self._levels: dict[str, str | int] = {}
+
+    def _level(self, record: logging.LogRecord) -> str | int:
+        level = self._levels.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            self._levels[record.levelname] = level
+        return level
+
     def emit(self, record):
-        # Loguru의 레벨로 매핑
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        # 호출 스택 깊이 찾기
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
-
-        logger.opt(depth=depth, exception=record.exc_info).log(
-            level, record.getMessage()
-        )
+        logger.opt(exception=record.exc_info).log(self._level(record), "{}", record.getMessage(), stdlib_record=record)
+
+def _sample_filter(record) -> bool:
+    # WARNING 이상은 항상 기록, INFO 이하는 LOG_INFO_SAMPLE_RATE 비율만 기록
+    # (반드시 남겨야 하는 로그는 logger.bind(force=True)로 샘플링 제외)
+    rate = settings.LOG_INFO_SAMPLE_RATE
+    if rate >= 1 or record["level"].no >= logging.WARNING or record["extra"].get("force"):
+        return True
+    return random.random() < rate
+
+def _patch_record(record):
+    extra = record["extra"]
+    stdlib_record = extra.pop("stdlib_record", None)
+    if stdlib_record is not None:
+        record["name"] = stdlib_record.name
+        record["function"] = stdlib_record.funcName
+        record["line"] = stdlib_record.lineno
+
+    # [MDC] 요청 처리 중에 남긴 로그에는 요청 ID와 라우트를 함께 기록
+    extra.setdefault("request_id", get_request_id() or "-")
+    extra.setdefault("route", get_route() or "-")
+
+def _json_format(record) -> str:
+    # 샘플링/레벨 필터를 통과한 로그만 직렬화 (문자열 포맷과 달리 예외는 JSON 필드로 포함)
+    payload = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+        **record["extra"],
+    }
+    if record["exception"] is not None:
+        payload["exception"] = "".join(traceback.format_exception(*record["exception"]))
+    record["extra"]["serialized"] = json.dumps(payload, ensure_ascii=False, default=str)
+    return "{extra[serialized]}\n"
+
+class BackgroundSink:
+    """
+    로그 출력(stderr 쓰기)을 백그라운드 스레드에서 처리하는 Loguru sink
+    Loguru의 enqueue=True는 레코드 전체를 pickle해서 multiprocessing 파이프로 보내므로 호출 측 비용이 오히려 큼.
+    여기서는 포맷된 문자열만 프로세스 내부 큐에 넣고, 쓰기는 스레드가 모아서 처리합니다.
+    """
+
+    _STOP = object()
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._stopped = False
+        self._start()
+        # prefork(Celery, gunicorn) 자식 프로세스에는 스레드가 복제되지 않으므로 fork 후 다시 시작
+        os.register_at_fork(after_in_child=self._start)
+        atexit.register(self.drain)
+
+    def _start(self):
+        if self._stopped:
+            return
+        self._queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._write_loop, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def isatty(self) -> bool:
+        # colorize 자동 판단용
+        return self.stream.isatty()
+
+    def write(self, message: str):
+        # 출력이 한참 밀려 큐가 가득 차면 그때만 기다림 (로그를 버리지 않고 메모리 사용량만 제한)
+        self._queue.put(message)
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            # 쌓인 로그를 한 번에 모아서 쓰고 flush는 묶음당 1회
+            items = [item]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            try:
+                for item in items:
+                    if item is self._STOP:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        item.set()
+                    else:
+                        self.stream.write(item)
+                self.stream.flush()
+            except Exception:
+                pass  # 로그 출력 실패로 스레드가 죽지 않도록
+            if stop:
+                return
+
+    def drain(self, timeout: float = 5.0):
+        """지금까지 넣은 로그가 모두 출력될 때까지 대기 (종료 직전 호출)"""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def stop(self, timeout: float = 5.0):
+        """남은 로그를 모두 출력한 뒤 스레드 종료 (logger.remove() 시 Loguru가 호출, 이후 fork된 자식에서도 다시 시작하지 않음)"""
+        if self._stopped:
+            return
+        self._stopped = True
+        atexit.unregister(self.drain)
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+_sink: BackgroundSink | None = None
+_configured = False
 
 def setup_logger():
+    """
+    로깅 설정 (여러 모듈에서 호출해도 최초 1회만 적용)
+    - 콘솔 출력은 BackgroundSink가 백그라운드 스레드에서 기록 (요청 처리 중 stderr 쓰기로 막히지 않음)
+    - LOG_FORMAT=json 이면 한 줄에 JSON 하나 (로그 수집기용)
+    """
+    global _configured, _sink
+    if _configured:
+        return logger
+    _configured = True
+
     # 1. Uvicorn의 기본 로그 핸들러들을 싹 제거 (우리가 접수한다! 😎)
     logging.getLogger("uvicorn").handlers = []
     logging.getLogger("uvicorn.access").handlers = []
-    
+
     # 2. 모든 표준 로거가 InterceptHandler를 거치도록 설정
     logging.basicConfig(handlers=[InterceptHandler()], level=logging.INFO, force=True)
 
-    # 3. Loguru 설정 (기존과 동일)
+    # 3. Loguru 설정
     logger.remove()
-    
-    log_format = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-        "<level>{message}</level>"
-    )
+
+    logger.configure(patcher=_patch_record)
+    if settings.LOG_FORMAT == "json":
+        log_format = _json_format
+    else:
+        log_format = (
+            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+            "<level>{level: <8}</level> | "
+            "<magenta>{extra[request_id]}</magenta> | "
+            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+            "<level>{message}</level>"
+        )
 
     # 콘솔 출력
-    logger.add(sys.stderr, format=log_format, level="INFO")
+    _sink = BackgroundSink(sys.stderr)
+    logger.add(
+        _sink,
+        format=log_format,
+        level=settings.LOG_LEVEL,
+        filter=_sample_filter,
+        colorize=False if settings.LOG_FORMAT == "json" else None,
+    )
+
+    return logger
 
-    return logger
\ No newline at end of file
+def flush_logger():
+    """백그라운드 sink에 남은 로그를 모두 출력 (프로세스 종료 직전 호출)"""
+    if _sink is not None:
+        _sink.drain()
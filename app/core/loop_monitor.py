@@ -0,0 +1,172 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from prometheus_client import Counter, Histogram
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.request_context import route_template
+
+# [참고] 이벤트 루프 지연(lag) 모니터
+# 이벤트 루프는 스레드 하나에서 모든 요청을 처리하므로, 동기 호출(bcrypt, 파일 I/O, 동기 네트워크 호출 등)이
+# 루프를 잡고 있으면 그동안 다른 모든 요청이 멈춥니다. 평소에는 tail latency로만 드러나므로 직접 측정합니다.
+# - 항상: interval마다 깨어나는 태스크가 "예정보다 얼마나 늦게 깨어났는지"를 히스토그램으로 기록
+# - 디버그(LOOP_MONITOR_DEBUG): 감시 스레드가 루프가 threshold 이상 멈춘 순간의 스택과 실행 중이던 라우트를 기록
+#   (uvloop 등 어떤 루프 구현에서도 동작)
+
+LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "이벤트 루프 지연 (예정 시각보다 늦게 깨어난 시간)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+LOOP_BLOCKS = Counter(
+    "event_loop_blocking_total",
+    "이벤트 루프를 threshold 이상 막은 횟수 (디버그 모드)",
+    ["route"],
+)
+
+class BlockingEvent:
+    """루프를 막은 호출 1건 (route: 실행 중이던 라우트 템플릿, 요청 밖이면 None)"""
+    __slots__ = ("route", "stack", "heartbeat", "lag")
+
+    def __init__(self, route: str | None, stack: str, heartbeat: float):
+        self.route = route
+        self.stack = stack
+        self.heartbeat = heartbeat
+        # 루프가 다시 깨어났을 때 측정된 지연(초)
+        self.lag: float | None = None
+
+    def __repr__(self):
+        return f"BlockingEvent(route={self.route!r}, lag={self.lag})\n{self.stack}"
+
+def _find_route(frame) -> tuple[str | None, str | None]:
+    """(라우트 템플릿, 실제 경로) - 라우팅 전이면 템플릿은 None"""
+    # 막힌 시점의 스택에는 요청을 처리 중인 ASGI 미들웨어/라우터 프레임이 포함되어 있으므로 scope를 찾아 라우트를 계산
+    # (루프 스레드가 멈춘 동안 GIL을 잡고 읽기만 함)
+    path = None
+    while frame is not None:
+        scope = frame.f_locals.get("scope")
+        if isinstance(scope, dict) and scope.get("type") in ("http", "websocket"):
+            template = route_template(scope)
+            if template:
+                return template, scope.get("path")
+            path = scope.get("path")
+        frame = frame.f_back
+    return None, path
+
+class LoopMonitor:
+    def __init__(
+        self,
+        interval: float = settings.LOOP_MONITOR_INTERVAL,
+        block_threshold: float = settings.LOOP_BLOCK_THRESHOLD,
+        debug: bool = settings.LOOP_MONITOR_DEBUG,
+    ):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.debug = debug
+        # 디버그 모드에서 감지한 이벤트 (최근 것만 유지)
+        self.events: list[BlockingEvent] = []
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._loop_thread_id: int | None = None
+        # 루프 태스크가 마지막으로 잠들기 시작한 시각 (감시 스레드와 공유)
+        self._heartbeat = 0.0
+        # 마지막으로 측정한 (heartbeat, 지연)
+        self._last_lag: tuple[float | None, float] = (None, 0.0)
+        self._pending: BlockingEvent | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self):
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.perf_counter()
+        self._stopped.clear()
+        self._pending = None
+        loop = asyncio.get_running_loop()
+        self._task = loop.create_task(self._run(loop.time() + self.interval))
+        if self.debug:
+            self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+    async def stop(self):
+        if not self.running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._watchdog is not None:
+            self._stopped.set()
+            self._watchdog.join()
+            self._watchdog = None
+            self._report_pending()
+
+    async def _run(self, expected: float):
+        # 첫 주기는 start() 시점부터 (태스크가 처음 실행되기 전에 루프가 막혀도 측정되도록)
+        loop = asyncio.get_running_loop()
+        while True:
+            heartbeat = self._heartbeat
+            await asyncio.sleep(max(0.0, expected - loop.time()))
+            lag = max(0.0, loop.time() - expected)
+            LOOP_LAG.observe(lag)
+            self._last_lag = (heartbeat, lag)
+            self._heartbeat = time.perf_counter()
+            expected = loop.time() + self.interval
+
+    def _report_pending(self):
+        # 루프가 다시 깨어나 해당 주기의 지연이 측정되었으면 이벤트를 마무리하고 로그로 남김
+        event = self._pending
+        if event is None or self._last_lag[0] != event.heartbeat:
+            return
+        self._pending = None
+        event.lag = self._last_lag[1]
+        logger.warning(f"🐢 Event loop blocked for {event.lag * 1000:.0f}ms (route={event.route or '-'})\n{event.stack}")
+
+    def _watch(self):
+        """[감시 스레드] 루프 태스크가 예정 시각 + threshold가 지나도 깨어나지 못하면 루프 스레드의 스택을 기록"""
+        check_every = min(self.interval, self.block_threshold) / 2
+        while not self._stopped.wait(check_every):
+            self._report_pending()
+            heartbeat = self._heartbeat
+            if self._pending is not None or time.perf_counter() - heartbeat < self.interval + self.block_threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            template, path = _find_route(frame)
+            event = BlockingEvent(template or path, "".join(traceback.format_stack(frame)), heartbeat)
+            # 메트릭 라벨은 라우트 템플릿만 (실제 경로는 값 종류가 무한히 늘어나므로 로그에만)
+            LOOP_BLOCKS.labels(route=template or ("unmatched" if path else "-")).inc()
+            self.events = [*self.events[-99:], event]
+            self._pending = event
+
+loop_monitor = LoopMonitor()
+
+@asynccontextmanager
+async def detect_blocking(threshold: float = 0.1) -> AsyncIterator[list[BlockingEvent]]:
+    """
+    [테스트용] 블록 안에서 루프를 threshold 이상 막은 호출 목록
+    async with detect_blocking() as events:
+        await client.get("/api/v1/boards/")
+    assert not events, events
+    """
+    monitor = LoopMonitor(interval=threshold / 2, block_threshold=threshold, debug=True)
+    monitor.start()
+    events: list[BlockingEvent] = []
+    try:
+        yield events
+    finally:
+        # 마지막 호출이 끝난 뒤 감시 스레드가 확인할 시간을 줌
+        await asyncio.sleep(monitor.interval)
+        await monitor.stop()
+        events.extend(monitor.events)
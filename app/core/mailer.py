@@ -0,0 +1,83 @@
+import smtplib
+import threading
+import time
+from email.message import Message
+from app.core.config import settings
+from app.core.logger import logger
+
+# [Spring: JavaMailSender + 커넥션 풀]
+# 메일 1통마다 TCP 연결 -> STARTTLS -> 로그인 -> QUIT 을 반복하지 않도록
+# Celery 워커 프로세스마다 SMTP 연결 1개를 유지하며 여러 태스크가 재사용합니다.
+
+class PooledSMTPConnection:
+    def __init__(self):
+        self._server: smtplib.SMTP | None = None
+        self._last_used = 0.0
+        self._sent_count = 0
+        # 스레드 풀 워커(-P threads)에서도 한 연결을 동시에 쓰지 않도록 잠금
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        timeout = settings.SMTP_TIMEOUT_SECONDS
+        if settings.SMTP_SSL:
+            server = smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT, timeout=timeout)
+        else:
+            server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=timeout)
+            if settings.SMTP_TLS:
+                server.starttls()
+
+        if settings.SMTP_USER and settings.SMTP_PASSWORD:
+            server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        self.connections_opened += 1
+        self._sent_count = 0
+        return server
+
+    def _is_healthy(self) -> bool:
+        if self._server is None:
+            return False
+        # 서버는 유휴 연결을 끊으므로, 한동안 쓰지 않은 연결만 NOOP으로 확인 (매번 왕복하지 않음)
+        if time.monotonic() - self._last_used < settings.SMTP_HEALTHCHECK_IDLE_SECONDS:
+            return True
+        try:
+            return self._server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _get_server(self) -> smtplib.SMTP:
+        # 한 연결로 너무 많이 보내면 서버가 거절하므로 일정 개수마다 재연결
+        if self._sent_count >= settings.SMTP_MAX_MESSAGES_PER_CONNECTION or not self._is_healthy():
+            self._close_server()
+            self._server = self._connect()
+        return self._server
+
+    def send(self, message: Message):
+        with self._lock:
+            try:
+                self._get_server().send_message(message)
+            except (smtplib.SMTPServerDisconnected, OSError):
+                # 건강 검사 이후에 끊긴 경우 한 번만 재연결 후 재시도
+                self._close_server()
+                self._get_server().send_message(message)
+            self._sent_count += 1
+            self._last_used = time.monotonic()
+
+    def _close_server(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        self._server = None
+
+    def close(self):
+        with self._lock:
+            self._close_server()
+
+# 워커 프로세스당 1개 (prefork 워커는 fork 이후 각 프로세스에서 처음 사용할 때 연결)
+smtp_connection = PooledSMTPConnection()
+
+def close_smtp_connection():
+    logger.info("📪 Closing pooled SMTP connection")
+    smtp_connection.close()
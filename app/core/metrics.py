@@ -0,0 +1,89 @@
+import fcntl
+import os
+from contextlib import contextmanager
+from typing import Iterator
+from fastapi import FastAPI
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
+from prometheus_client.mmap_dict import MmapedDict
+from prometheus_client.multiprocess import MultiProcessCollector, mark_process_dead
+from prometheus_fastapi_instrumentator import Instrumentator
+from starlette.responses import Response
+
+# [Spring: Micrometer + Actuator /actuator/prometheus]
+# API 워커가 여러 개면(python -m app.server) 메트릭은 워커마다 따로 쌓이므로, 스크레이프를 받은 워커의 값만 보이게 됩니다.
+# PROMETHEUS_MULTIPROC_DIR가 설정되어 있으면 각 워커가 값을 이 디렉토리의 파일(mmap)에 기록하고,
+# /metrics는 요청을 받은 워커가 모든 파일을 합산해서 응답합니다.
+# 종료된 워커의 카운터/히스토그램 파일은 마스터가 *_archive.db 하나로 합쳐 두어,
+# max-requests로 워커가 계속 교체되어도 스크레이프마다 읽는 파일 수가 늘어나지 않습니다.
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+# 값을 더해서 합칠 수 있는 타입 (gauge는 mark_process_dead가 live* 모드 파일을 지움)
+ARCHIVED_TYPES = ("counter", "histogram", "summary")
+_LOCK_FILE = ".lock"
+
+@contextmanager
+def _directory_lock(path: str, operation: int) -> Iterator[None]:
+    # 합치는 도중(아카이브에 더한 뒤 원본 파일을 지우기 전)에 스크레이프가 읽으면 값이 두 번 더해지거나
+    # 파일이 사라져 실패하므로, 합치기는 배타 잠금 / 스크레이프는 공유 잠금
+    with open(os.path.join(path, _LOCK_FILE), "a") as lock_file:
+        fcntl.flock(lock_file, operation)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+class LockedMultiProcessCollector(MultiProcessCollector):
+    def collect(self):
+        with _directory_lock(self._path, fcntl.LOCK_SH):
+            return super().collect()
+
+def reset_multiprocess_dir(path: str):
+    """
+    실행 시작 시(워커 fork 전) 메트릭 디렉토리 준비
+    이전 실행에서 남은 파일은 pid가 겹치거나 값이 이어지지 않도록 비움
+    """
+    os.makedirs(path, exist_ok=True)
+    for name in os.listdir(path):
+        if name.endswith(".db"):
+            os.remove(os.path.join(path, name))
+
+def archive_dead_process(pid: int, path: str | None = None):
+    """
+    종료된 워커의 메트릭 파일 정리 (gunicorn 마스터의 child_exit / Celery 워커 프로세스 종료 시 호출, 잠금으로 한 번에 하나씩 실행)
+    - counter/histogram/summary: 값을 <type>_archive.db에 더하고 원본 삭제 (누적값이 줄어들지 않음)
+    - live* gauge: 삭제 (살아 있는 워커의 값만 합산)
+    """
+    path = path or os.environ.get(MULTIPROC_DIR_ENV)
+    if not path:
+        return
+    with _directory_lock(path, fcntl.LOCK_EX):
+        for metric_type in ARCHIVED_TYPES:
+            source = os.path.join(path, f"{metric_type}_{pid}.db")
+            if not os.path.exists(source):
+                continue
+            archive = MmapedDict(os.path.join(path, f"{metric_type}_archive.db"))
+            try:
+                for key, value, timestamp, _ in MmapedDict.read_all_values_from_file(source):
+                    archived, _ = archive.read_value(key)
+                    archive.write_value(key, archived + value, timestamp)
+            finally:
+                archive.close()
+            os.remove(source)
+        mark_process_dead(pid, path)
+
+def metrics_endpoint() -> Response:
+    """Prometheus 스크레이프 (멀티 프로세스 모드면 모든 워커의 값을 합산)"""
+    registry = REGISTRY
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        registry = CollectorRegistry()
+        LockedMultiProcessCollector(registry)
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+def setup_metrics(app: FastAPI):
+    """HTTP 요청 메트릭 계측 + /metrics 노출"""
+    Instrumentator(
+        # handler 라벨은 라우트 템플릿(/api/v1/users/{email})만 사용하고,
+        # 매칭되는 라우트가 없는 요청(404 스캔 등)은 "none" 하나로 묶어 라벨 값이 무한히 늘어나지 않게 함
+        should_group_untemplated=True,
+    ).instrument(app)
+    app.add_api_route("/metrics", metrics_endpoint, methods=["GET"])
@@ -0,0 +1,119 @@
+import asyncio
+from celery import Task
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.logger import logger
+from app.core import tracing
+from app.repository import outbox_repository
+
+# [참고] Transactional Outbox
+# 요청 경로에서 task.delay()를 직접 호출하면
+#   1. 브로커(Redis) 발행이 이벤트 루프를 막고 (요청 지연 = 브로커 지연)
+#   2. 이후 커밋이 실패해도 태스크는 이미 발행된 상태가 됩니다.
+# 대신 enqueue()로 같은 트랜잭션에 발행 요청을 기록하고, 커밋되면 OutboxDispatcher가 모아서 발행합니다.
+# 발행 보장은 at-least-once입니다. 발행 직후 삭제 커밋이 실패하면 같은 태스크가 다시 발행될 수 있습니다.
+
+OUTBOX_PENDING_KEY = "outbox_pending"
+
+async def enqueue(db: AsyncSession, task: Task, *args, **kwargs):
+    """task.delay(*args, **kwargs)를 트랜잭션 커밋 시점으로 미룸 (커밋은 호출한 서비스가 수행)"""
+    await outbox_repository.add_outbox_message(
+        db, task_name=task.name, args=list(args), kwargs=kwargs, trace_context=tracing.inject_current_context()
+    )
+    db.sync_session.info[OUTBOX_PENDING_KEY] = True
+
+class OutboxDispatcher:
+    """
+    outbox_messages를 배치 단위로 Celery 브로커에 발행하는 백그라운드 루프 (API 프로세스마다 1개)
+    커밋 직후 깨어나 바로 발행하고, 다른 프로세스가 기록한 메시지는 주기적인 폴링으로 처리합니다.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker = AsyncSessionLocal):
+        self.session_factory = session_factory
+        self._wakeup: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    def notify(self):
+        # SQLAlchemy 이벤트 훅에서 호출되므로 스레드와 무관하게 안전한 방식으로 깨움
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    @staticmethod
+    def _publish(messages: list):
+        # 배치 전체를 브로커 커넥션 하나로 발행
+        with celery_app.producer_or_acquire() as producer:
+            for message in messages:
+                # 발행 span과 워커의 실행 span이 enqueue한 요청의 트레이스에 이어지도록 context 복원
+                with tracing.use_context(message.trace_context):
+                    celery_app.send_task(message.task_name, args=message.args, kwargs=message.kwargs, producer=producer)
+
+    async def dispatch_batch(self) -> int:
+        async with self.session_factory() as db:
+            messages = await outbox_repository.get_pending_messages_for_update(db, limit=settings.OUTBOX_BATCH_SIZE)
+            if not messages:
+                await db.rollback()
+                return 0
+
+            # 브로커 발행은 블로킹 I/O이므로 스레드풀에서 실행
+            await run_in_threadpool(self._publish, messages)
+            await outbox_repository.delete_messages_by_ids(db, [message.id for message in messages])
+            return len(messages)
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            # 종료 요청 이후에도 한 번 더 발행 (종료 직전에 커밋된 메시지까지 처리)
+            stopping = self._stopping
+            try:
+                published = await self.dispatch_batch()
+            except Exception:
+                logger.exception("❌ Outbox dispatch failed")
+                published = 0
+
+            if stopping:
+                return
+            # 배치가 가득 찼으면 쉬지 않고 다음 배치 발행
+            if published >= settings.OUTBOX_BATCH_SIZE:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.OUTBOX_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        # Event는 처음 사용한 이벤트 루프에 묶이므로 실행 중인 루프에서 생성
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        # cancel() 대신 종료 플래그 사용 (발행 중인 배치는 끝까지 처리해야 하고,
+        # Python 3.11의 wait_for는 깨어나는 순간 들어온 취소를 무시할 수 있음)
+        # 남은 메시지는 다른 프로세스 또는 다음 실행 시 발행됩니다.
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        self._loop = None
+
+outbox_dispatcher = OutboxDispatcher()
+
+# 커밋 시점에 outbox 메시지가 있었다면 디스패처를 바로 깨움 (폴링 주기만큼 기다리지 않음)
+@event.listens_for(Session, "after_commit")
+def _notify_outbox_dispatcher(session: Session):
+    if session.info.pop(OUTBOX_PENDING_KEY, False):
+        outbox_dispatcher.notify()
+
+@event.listens_for(Session, "after_rollback")
+def _clear_outbox_pending(session: Session):
+    session.info.pop(OUTBOX_PENDING_KEY, None)
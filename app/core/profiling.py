@@ -0,0 +1,137 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from fastapi import HTTPException, status
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.dependencies import RoleChecker, authenticate_token
+from app.core.logger import logger
+from app.models.user import UserRole
+
+# [Spring: Java Flight Recorder / async-profiler를 Actuator로 노출]
+# 운영 중 p99가 튀었을 때 살아 있는 워커를 바로 프로파일링하기 위한 관리자 전용 기능 (PROFILING_ENABLED=True 일 때만)
+# - 요청 단위: 관리자가 X-Profile: html|speedscope 헤더를 붙이면 원래 응답 대신 그 요청의 프로파일을 돌려줌
+# - 워커 단위: POST /api/v1/admin/profile?seconds=N 동안 이벤트 루프 스레드 전체를 샘플링
+# 꺼져 있으면 설정값 하나만 확인하고 지나가며, pyinstrument도 import 하지 않습니다.
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_FORMATS = ("html", "speedscope")
+# 1ms 간격 샘플링 (요청 1건처럼 짧은 구간도 충분한 샘플이 쌓이도록)
+SAMPLE_INTERVAL = 0.001
+
+admin_only = RoleChecker([UserRole.ADMIN])
+
+# 같은 스레드에서 프로파일러는 하나만 돌 수 있으므로 동시에 하나만 허용
+_profiling = False
+
+def _claim() -> bool:
+    global _profiling
+    if _profiling:
+        return False
+    _profiling = True
+    return True
+
+def _release():
+    global _profiling
+    _profiling = False
+
+def _render(profiler, output_format: str) -> Response:
+    if output_format == "speedscope":
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        return Response(profiler.output(SpeedscopeRenderer()), media_type="application/json")
+    return Response(profiler.output_html(), media_type="text/html")
+
+def _busy_response() -> JSONResponse:
+    return JSONResponse({"detail": "Another profile is already running"}, status_code=status.HTTP_409_CONFLICT)
+
+async def run_worker_profile(seconds: float, output_format: str = "html") -> Response:
+    """
+    현재 워커의 이벤트 루프 스레드를 seconds초 동안 샘플링 (그 사이 처리되는 모든 요청/작업 포함)
+    스레드풀에서 실행되는 동기 코드는 포함되지 않습니다.
+    """
+    if not _claim():
+        return _busy_response()
+    from pyinstrument import Profiler
+
+    seconds = min(seconds, settings.PROFILING_MAX_SECONDS)
+    # async_mode="disabled": 특정 태스크가 아니라 스레드 전체를 샘플링
+    profiler = Profiler(interval=SAMPLE_INTERVAL, async_mode="disabled")
+    profiler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.stop()
+        _release()
+    logger.info(f"🔬 Worker profile captured ({seconds:.1f}s, {output_format})")
+    return _render(profiler, output_format)
+
+async def _is_admin(scope: Scope, authorization: str | None) -> bool:
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    # 테스트 등에서 get_db를 교체했다면 그 세션을 사용
+    get_session = scope["app"].dependency_overrides.get(get_db, get_db)
+    async with asynccontextmanager(get_session)() as db:
+        try:
+            admin_only(await authenticate_token(db, token))
+        except HTTPException:
+            return False
+    return True
+
+class ProfilingMiddleware:
+    """X-Profile 헤더가 붙은 관리자 요청을 프로파일링해 결과(HTML 또는 speedscope JSON)를 응답으로 반환"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if not settings.PROFILING_ENABLED or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        output_format = authorization = None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                output_format = value.decode("latin-1").strip().lower()
+            elif name == b"authorization":
+                authorization = value.decode("latin-1")
+        if output_format is None:
+            await self.app(scope, receive, send)
+            return
+
+        if output_format not in PROFILE_FORMATS or not await _is_admin(scope, authorization):
+            # 관리자가 아니면 헤더를 무시하고 평소처럼 처리
+            logger.warning(f"Ignored X-Profile header on {scope['path']} (not an admin or unknown format)")
+            await self.app(scope, receive, send)
+            return
+        if not _claim():
+            await _busy_response()(scope, receive, send)
+            return
+
+        from pyinstrument import Profiler
+
+        response_status = None
+
+        async def discard_response(message: Message):
+            # 원래 응답은 버리고 상태 코드만 X-Profiled-Status로 전달
+            nonlocal response_status
+            if message["type"] == "http.response.start":
+                response_status = message["status"]
+
+        profiler = Profiler(interval=SAMPLE_INTERVAL, async_mode="enabled")
+        started_at = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard_response)
+        finally:
+            profiler.stop()
+            _release()
+
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        logger.info(f"🔬 Request profile captured for {scope['path']} ({elapsed_ms:.1f}ms, {output_format})")
+        response = _render(profiler, output_format)
+        response.headers["X-Profiled-Status"] = str(response_status)
+        await response(scope, receive, send)
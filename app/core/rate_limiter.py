@@ -2,6 +2,7 @@ from fastapi import Request, HTTPException, status
 import time
 from app.core.redis import redis_client
 from app.core.logger import logger
+from app.core.timing import span
 
 class RateLimiter:
     """
@@ -51,15 +52,16 @@ class RateLimiter:
         end
         """
 
-        result = await redis_client.eval(
-            lua_script, 
-            1, 
-            key, 
-            self.times, 
-            self.seconds, 
-            current_time, 
-            window_start
-        )
+        with span("rate_limit"):
+            result = await redis_client.eval(
+                lua_script,
+                1,
+                key,
+                self.times,
+                self.seconds,
+                current_time,
+                window_start
+            )
 
         allowed, count = result[0], result[1]
 
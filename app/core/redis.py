@@ -1,5 +1,28 @@
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
 from app.core.config import settings
+from app.core.timing import span
+from app.core.deadline import check_deadline
+
+class TimedPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True):
+        check_deadline()
+        with span("redis"):
+            return await super().execute(raise_on_error)
+
+class TimedRedis(redis.Redis):
+    """
+    명령 실행 시간을 현재 요청의 redis 구간(Server-Timing)에 누적하는 클라이언트
+    요청의 마감(deadline)이 이미 지났으면 보내지 않고 504, 실행 중인 명령은 요청 태스크 취소로 끊김 (redis-py가 커넥션을 버림)
+    """
+
+    async def execute_command(self, *args, **options):
+        check_deadline()
+        with span("redis"):
+            return await super().execute_command(*args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> TimedPipeline:
+        return TimedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
 
 # Redis Connection Pool
 redis_pool = redis.ConnectionPool(
@@ -11,10 +34,21 @@ redis_pool = redis.ConnectionPool(
 )
 
 # Redis Client
-redis_client = redis.Redis(connection_pool=redis_pool)
+redis_client = TimedRedis(connection_pool=redis_pool)
+
+# 바이너리 값(미리 압축해 둔 응답 본문 등)용 풀/클라이언트 (값을 문자열로 디코딩하지 않음)
+redis_binary_pool = redis.ConnectionPool(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    decode_responses=False
+)
+
+redis_binary_client = TimedRedis(connection_pool=redis_binary_pool)
 
 async def get_redis_client():
     return redis_client
 
 async def close_redis_connection():
     await redis_client.close()
+    await redis_binary_client.close()
@@ -0,0 +1,81 @@
+import re
+import uuid
+from contextvars import ContextVar
+from prometheus_fastapi_instrumentator.routing import get_route_name
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# [Spring: MDC(Mapped Diagnostic Context) + OncePerRequestFilter]
+# 요청마다 request_id와 ASGI scope를 contextvar에 담아 두면, 같은 요청에서 실행되는
+# 코드(서비스, 리포지토리, 로거 patcher 등)가 인자로 넘기지 않아도 꺼내 쓸 수 있습니다.
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# 클라이언트가 보낸 ID는 로그에 그대로 찍히므로 안전한 문자/길이만 허용
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+request_scope_var: ContextVar[Scope | None] = ContextVar("request_scope", default=None)
+
+def get_request_id() -> str | None:
+    return request_id_var.get()
+
+ROUTE_TEMPLATE_KEY = "route_template"
+
+def route_template(scope: Scope) -> str | None:
+    """
+    요청의 라우트 템플릿 (예: /api/v1/boards/{board_id}), 라우팅 전이거나 매칭된 라우트가 없으면 None
+    router prefix가 붙은 전체 경로는 라우트 목록을 다시 매칭해야 알 수 있으므로 scope에 한 번만 계산해 둠
+    """
+    template = scope.get(ROUTE_TEMPLATE_KEY)
+    # 라우터가 매칭 후 같은 scope dict에 route를 기록하므로 그 이후에만 계산
+    if template is None and "route" in scope:
+        template = get_route_name(HTTPConnection(scope), should_include_root_path=False)
+        scope[ROUTE_TEMPLATE_KEY] = template
+    return template
+
+def is_multipart_request(scope: Scope) -> bool:
+    """multipart/form-data 요청인지 (파일 업로드 폼, 본문이 클 수 있어 수신 시간이 처리 시간보다 길 수 있음)"""
+    for name, value in scope["headers"]:
+        if name == b"content-type":
+            return value.lower().startswith(b"multipart/form-data")
+    return False
+
+def get_route() -> str | None:
+    """현재 요청의 라우트 템플릿, 라우팅 전이면 실제 경로"""
+    scope = request_scope_var.get()
+    if scope is None:
+        return None
+    return route_template(scope) or scope.get("path")
+
+class RequestContextMiddleware:
+    """요청 ID를 발급(또는 X-Request-ID 헤더를 이어받아)하고 응답 헤더에도 돌려줌"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if request_id is None or not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+
+        async def send_with_request_id(message: Message):
+            if message["type"] == "http.response.start":
+                # 응답 객체의 헤더 리스트를 직접 수정하지 않도록 복사
+                message["headers"] = [*message.get("headers", []), (b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        id_token = request_id_var.set(request_id)
+        scope_token = request_scope_var.set(scope)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(id_token)
+            request_scope_var.reset(scope_token)
@@ -1,3 +1,4 @@
+from fastapi.concurrency import run_in_threadpool
 from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
 from jose import jwt
@@ -9,12 +10,13 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # [비밀번호 검증]
 # plain_password: 사용자가 입력한 비번
 # hashed_password: DB에 저장된 암호화된 비번
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+# bcrypt는 일부러 느린(수백 ms) CPU 연산이므로 이벤트 루프를 막지 않도록 스레드풀에서 실행
+async def verify_password(plain_password, hashed_password):
+    return await run_in_threadpool(pwd_context.verify, plain_password, hashed_password)
 
 # [비밀번호 암호화]
-def get_password_hash(password):
-    return pwd_context.hash(password)
+async def get_password_hash(password):
+    return await run_in_threadpool(pwd_context.hash, password)
 
 # [JWT 토큰 생성]
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
@@ -0,0 +1,42 @@
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.staticfiles import StaticFiles
+from starlette.types import Scope
+from app.core.config import settings
+
+# 업로드 파일은 내용 해시/UUID로 이름이 정해져 내용이 절대 바뀌지 않으므로 영구 캐시 가능
+IMMUTABLE_CACHE_CONTROL = f"public, max-age={settings.STATIC_CACHE_MAX_AGE}, immutable"
+
+def cache_control_for(path: str) -> str | None:
+    if path.startswith("uploads/"):
+        return IMMUTABLE_CACHE_CONTROL
+    return None
+
+class CachedStaticFiles(StaticFiles):
+    """[개발용] Python 워커가 직접 정적 파일을 서빙하되, 업로드 파일에는 immutable 캐시 헤더 부여"""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        cache_control = cache_control_for(path)
+        if cache_control and response.status_code in (200, 304):
+            response.headers["Cache-Control"] = cache_control
+        return response
+
+async def x_accel_static(file_path: str) -> Response:
+    """[운영용] 파일 바이트는 Nginx가 sendfile로 전송하고, 앱은 내부 리다이렉트 헤더만 응답"""
+    if ".." in file_path.split("/"):
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    headers = {"X-Accel-Redirect": f"{settings.STATIC_X_ACCEL_LOCATION}{file_path}"}
+    cache_control = cache_control_for(file_path)
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(headers=headers)
+
+def setup_static_files(app: FastAPI):
+    # STATIC_DELIVERY=nginx: /static/uploads/는 Nginx가 직접 서빙하고,
+    # 그 외 앱으로 들어온 /static 요청도 X-Accel-Redirect로 Nginx에 넘겨 Python 워커는 파일을 읽지 않음
+    if settings.STATIC_DELIVERY == "nginx":
+        app.add_api_route("/static/{file_path:path}", x_accel_static, methods=["GET", "HEAD"], include_in_schema=False)
+        return
+
+    app.mount("/static", CachedStaticFiles(directory=str(settings.STATIC_DIR)), name="static")
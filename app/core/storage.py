@@ -0,0 +1,232 @@
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator
+from app.core.config import settings
+
+# [Spring: ResourceLoader / StorageService 인터페이스]
+# 업로드 파일을 어디에 저장하든(로컬 디스크, S3 호환 스토리지) 서비스 코드는 "key" 단위로만 다룹니다.
+# key 예시: boards/ab/ab12...ef.jpg
+# [참고] 모든 메서드는 블로킹 I/O이므로 이벤트 루프에서는 run_in_threadpool로 호출해야 합니다.
+
+class StorageBackend(ABC):
+    @abstractmethod
+    def save(self, key: str, source_path: str) -> None:
+        """로컬 임시 파일을 key 위치로 옮겨 저장 (원본 임시 파일은 제거)"""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool: ...
+
+    @abstractmethod
+    def size(self, key: str) -> int | None:
+        """파일 크기 (없으면 None)"""
+
+    @abstractmethod
+    def modified_at(self, key: str) -> float | None:
+        """마지막 수정 시각 (Unix timestamp, 없으면 None)"""
+
+    @abstractmethod
+    def read_head(self, key: str, length: int) -> bytes | None:
+        """파일 앞부분 length byte (내용 형식 검사용, 없으면 None)"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def list_keys(self, prefix: str = "") -> Iterator[str]:
+        """prefix로 시작하는 key를 하나씩 반환 (전체 목록을 메모리에 올리지 않음)"""
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """클라이언트가 접근할 공개 URL"""
+
+    @abstractmethod
+    def key_from_url(self, url: str) -> str | None:
+        """공개 URL -> key (이 스토리지가 관리하는 URL이 아니면 None)"""
+
+    @abstractmethod
+    def local_copy(self, key: str):
+        """[Context Manager] 이미지 처리 등을 위해 로컬 파일 경로로 접근 (원격 스토리지는 임시 파일로 다운로드)"""
+
+    def presign_upload(self, key: str, content_type: str, max_size: int) -> dict:
+        """클라이언트가 API 서버를 거치지 않고 직접 업로드할 수 있는 presigned 요청 정보"""
+        raise NotImplementedError(f"{type(self).__name__} does not support presigned uploads")
+
+class LocalStorageBackend(StorageBackend):
+    """UPLOAD_DIR 아래에 저장하고 /static/uploads/ 로 서빙하는 기본 스토리지"""
+
+    URL_PREFIX = "/static/uploads/"
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def save(self, key: str, source_path: str) -> None:
+        destination = self.path(key)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        os.replace(source_path, destination)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def size(self, key: str) -> int | None:
+        try:
+            return os.path.getsize(self.path(key))
+        except FileNotFoundError:
+            return None
+
+    def modified_at(self, key: str) -> float | None:
+        try:
+            return os.path.getmtime(self.path(key))
+        except FileNotFoundError:
+            return None
+
+    def read_head(self, key: str, length: int) -> bytes | None:
+        try:
+            with open(self.path(key), "rb") as f:
+                return f.read(length)
+        except FileNotFoundError:
+            return None
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def list_keys(self, prefix: str = "") -> Iterator[str]:
+        # prefix의 디렉토리 부분부터만 탐색 (os.walk/scandir는 항목을 하나씩 읽어 메모리 사용량이 일정)
+        base_dir = self.path(os.path.dirname(prefix))
+        for dir_path, dir_names, file_names in os.walk(base_dir):
+            # 업로드 중인 임시 파일(.tmp) 등 숨김 디렉토리는 제외
+            dir_names[:] = [name for name in dir_names if not name.startswith(".")]
+            for file_name in file_names:
+                key = os.path.relpath(os.path.join(dir_path, file_name), self.root).replace(os.sep, "/")
+                if key.startswith(prefix):
+                    yield key
+
+    def url(self, key: str) -> str:
+        return f"{self.URL_PREFIX}{key}"
+
+    def key_from_url(self, url: str) -> str | None:
+        if not url or not url.startswith(self.URL_PREFIX):
+            return None
+        return url[len(self.URL_PREFIX):]
+
+    @contextmanager
+    def local_copy(self, key: str) -> Iterator[str]:
+        yield self.path(key)
+
+class S3StorageBackend(StorageBackend):
+    """S3 호환 오브젝트 스토리지 (AWS S3, MinIO, Cloudflare R2 등)"""
+
+    def __init__(self, bucket: str, public_url: str, client=None):
+        import boto3  # S3를 사용할 때만 필요
+
+        self.bucket = bucket
+        self.public_url = public_url.rstrip("/")
+        self.client = client or boto3.client(
+            "s3",
+            endpoint_url=settings.S3_ENDPOINT_URL,
+            region_name=settings.S3_REGION,
+            aws_access_key_id=settings.S3_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+        )
+
+    def save(self, key: str, source_path: str) -> None:
+        self.client.upload_file(source_path, self.bucket, key)
+        os.remove(source_path)
+
+    def _head(self, key: str) -> dict | None:
+        from botocore.exceptions import ClientError
+
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def exists(self, key: str) -> bool:
+        return self._head(key) is not None
+
+    def size(self, key: str) -> int | None:
+        head = self._head(key)
+        return head["ContentLength"] if head else None
+
+    def modified_at(self, key: str) -> float | None:
+        head = self._head(key)
+        return head["LastModified"].timestamp() if head else None
+
+    def read_head(self, key: str, length: int) -> bytes | None:
+        from botocore.exceptions import ClientError
+
+        # Range 요청으로 앞부분만 받음 (객체 전체를 내려받지 않음)
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=key, Range=f"bytes=0-{length - 1}")
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return response["Body"].read()
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def list_keys(self, prefix: str = "") -> Iterator[str]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for item in page.get("Contents", []):
+                yield item["Key"]
+
+    def url(self, key: str) -> str:
+        return f"{self.public_url}/{key}"
+
+    def key_from_url(self, url: str) -> str | None:
+        prefix = f"{self.public_url}/"
+        if not url or not url.startswith(prefix):
+            return None
+        return url[len(prefix):]
+
+    @contextmanager
+    def local_copy(self, key: str) -> Iterator[str]:
+        with tempfile.NamedTemporaryFile(suffix=os.path.splitext(key)[1]) as temp_file:
+            self.client.download_fileobj(self.bucket, key, temp_file)
+            temp_file.flush()
+            yield temp_file.name
+
+    def presign_upload(self, key: str, content_type: str, max_size: int) -> dict:
+        # 크기/타입 조건을 서명에 포함시켜 스토리지가 직접 검증하도록 함
+        return self.client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_size],
+            ],
+            ExpiresIn=settings.PRESIGNED_UPLOAD_EXPIRE_SECONDS,
+        )
+
+# [Spring: @Bean] 설정에 따라 스토리지 구현체를 선택 (프로세스당 1개)
+@lru_cache
+def get_storage() -> StorageBackend:
+    if settings.STORAGE_BACKEND == "s3":
+        return S3StorageBackend(bucket=settings.S3_BUCKET, public_url=settings.S3_PUBLIC_URL)
+    return LocalStorageBackend(root=settings.UPLOAD_DIR)
+
+def get_temp_dir() -> str:
+    """업로드 중인 임시 파일 디렉토리 (숨김 디렉토리라 list_keys 결과에는 나오지 않음)"""
+    temp_dir = os.path.join(settings.UPLOAD_DIR, ".tmp")
+    os.makedirs(temp_dir, exist_ok=True)
+    return temp_dir
+
+def make_temp_path(suffix: str = "") -> str:
+    """업로드 스트리밍용 로컬 임시 파일 경로 (최종 저장 전 해시 계산/검증 용도)"""
+    file_descriptor, temp_path = tempfile.mkstemp(suffix=suffix, dir=get_temp_dir())
+    os.close(file_descriptor)
+    return temp_path
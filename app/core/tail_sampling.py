@@ -0,0 +1,70 @@
+import threading
+from collections import OrderedDict
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.trace import StatusCode
+
+# OpenTelemetry SDK가 필요하므로 트레이싱을 켤 때만 import 됩니다. (app.core.tracing.setup_tracing)
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """
+    트레이스 단위 Tail Sampling (SpanProcessor)
+    로컬 루트 span(요청, 태스크 실행)이 끝날 때까지 span을 모아 두었다가 아래 중 하나면 트레이스 전체를 내보냄
+    - 에러 상태의 span이 있음
+    - 루트 span이 OTEL_SLOW_TRACE_THRESHOLD_MS 이상 걸림
+    - 나머지는 trace_id 기준 OTEL_TAIL_SAMPLE_RATE 비율 (API/워커 프로세스가 같은 결정을 내림)
+    """
+
+    def __init__(self, delegate: SpanProcessor, sample_rate: float, slow_threshold_ms: float, max_pending_traces: int = 10000):
+        self.delegate = delegate
+        self.slow_threshold_ns = slow_threshold_ms * 1_000_000
+        self.sample_bound = round(max(0.0, min(sample_rate, 1.0)) * (2 ** 64 - 1))
+        self.max_pending_traces = max_pending_traces
+        self._pending: OrderedDict[int, list[ReadableSpan]] = OrderedDict()
+        # 루트가 끝난 뒤 늦게 끝나는 span(응답 이후 작업 등)도 같은 결정을 따르도록 최근 결정 보관
+        self._decisions: OrderedDict[int, bool] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Span, parent_context: Context | None = None):
+        self.delegate.on_start(span, parent_context=parent_context)
+
+    def _is_local_root(self, span: ReadableSpan) -> bool:
+        return span.parent is None or span.parent.is_remote
+
+    def _should_keep(self, trace_id: int, root: ReadableSpan, spans: list[ReadableSpan]) -> bool:
+        if any(span.status.status_code is StatusCode.ERROR for span in spans):
+            return True
+        if root.end_time - root.start_time >= self.slow_threshold_ns:
+            return True
+        # TraceIdRatioBased와 같은 방식 (trace_id 하위 64비트)
+        return (trace_id & 0xFFFFFFFFFFFFFFFF) < self.sample_bound
+
+    def on_end(self, span: ReadableSpan):
+        trace_id = span.context.trace_id
+        with self._lock:
+            decision = self._decisions.get(trace_id)
+            if decision is None:
+                spans = self._pending.setdefault(trace_id, [])
+                spans.append(span)
+                if not self._is_local_root(span):
+                    # 루트가 끝나지 않는 트레이스가 쌓이지 않도록 오래된 것부터 버림
+                    if len(self._pending) > self.max_pending_traces:
+                        self._pending.popitem(last=False)
+                    return
+                del self._pending[trace_id]
+                decision = self._should_keep(trace_id, span, spans)
+                self._decisions[trace_id] = decision
+                if len(self._decisions) > self.max_pending_traces:
+                    self._decisions.popitem(last=False)
+            else:
+                spans = [span]
+
+        if decision:
+            for finished in spans:
+                self.delegate.on_end(finished)
+
+    def shutdown(self):
+        self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.delegate.force_flush(timeout_millis)
@@ -0,0 +1,153 @@
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from fastapi.routing import APIRoute
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.request_context import route_template
+
+# [참고] 요청 구간별 소요 시간 (Server-Timing)
+# 요청마다 RequestTimings 하나를 contextvar에 두고, 인증/Rate Limit/Redis/SQL 등의 구간이
+# span()으로 시간을 누적합니다. 응답 헤더(Server-Timing)로 내려주면 브라우저 개발자 도구에서 바로 보이고,
+# 같은 값을 라우트 템플릿별 Prometheus 히스토그램으로도 기록합니다.
+# 구간은 겹칠 수 있습니다. (예: auth 안의 Redis/SQL 시간은 redis/db에도 포함)
+
+PHASE_DURATION = Histogram(
+    "http_request_phase_duration_seconds",
+    "요청 처리 구간별 소요 시간",
+    ["route", "phase"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+class RequestTimings:
+    __slots__ = ("durations", "counts", "endpoint_finished_at")
+
+    def __init__(self):
+        self.durations: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self.endpoint_finished_at: float | None = None
+
+    def add(self, phase: str, duration: float):
+        self.durations[phase] = self.durations.get(phase, 0.0) + duration
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+
+_timings_var: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+class span:
+    """
+    [Context Manager] with span("redis"): ... 구간 시간을 현재 요청에 누적
+    (요청 밖 - Celery 태스크, 인프로세스 작업 등 - 에서는 아무것도 하지 않음)
+    """
+    __slots__ = ("phase", "timings", "started_at")
+
+    def __init__(self, phase: str):
+        self.phase = phase
+
+    def __enter__(self):
+        self.timings = _timings_var.get()
+        if self.timings is not None:
+            self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.timings is not None:
+            self.timings.add(self.phase, time.perf_counter() - self.started_at)
+
+def timed(phase: str):
+    """[Decorator] 비동기 함수 전체를 하나의 구간으로 기록 (FastAPI 의존성에도 사용 가능)"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(phase):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# [SQL] 커서 실행 시간 (엔진 클래스에 등록하므로 API/테스트 엔진 모두 적용)
+# 시작 시각은 문장마다 새로 만들어지는 실행 context에 둠 (커넥션에 쌓아 두면 실패한 문장의 값이 풀 커넥션에 남음)
+QUERY_STARTED_AT = "_timing_query_started_at"
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _timings_var.get() is not None:
+        setattr(context, QUERY_STARTED_AT, time.perf_counter())
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timings = _timings_var.get()
+    started_at = getattr(context, QUERY_STARTED_AT, None)
+    if timings is not None and started_at is not None:
+        timings.add("db", time.perf_counter() - started_at)
+
+class TimedRoute(APIRoute):
+    """
+    엔드포인트 함수가 끝난 시각을 기록하는 라우트 클래스
+    엔드포인트 반환 ~ 응답 시작 사이(응답 모델 검증 + JSON 직렬화)를 render 구간으로 계산합니다.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        if inspect.iscoroutinefunction(endpoint) and not getattr(endpoint, "_timed", False):
+            endpoint = self._wrap(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    @staticmethod
+    def _wrap(endpoint):
+        # functools.wraps로 원래 시그니처를 유지 (FastAPI가 __wrapped__를 따라가 파라미터를 해석)
+        @functools.wraps(endpoint)
+        async def timed_endpoint(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                timings = _timings_var.get()
+                if timings is not None:
+                    timings.endpoint_finished_at = time.perf_counter()
+
+        timed_endpoint._timed = True
+        return timed_endpoint
+
+def _server_timing_header(timings: RequestTimings, total: float) -> bytes:
+    entries = [
+        f"{phase};dur={duration * 1000:.1f};desc=\"{timings.counts[phase]}x\""
+        for phase, duration in timings.durations.items()
+    ]
+    entries.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(entries).encode("latin-1")
+
+class ServerTimingMiddleware:
+    """요청 구간별 소요 시간을 Server-Timing 헤더와 Prometheus 히스토그램으로 기록"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _timings_var.set(timings)
+        started_at = time.perf_counter()
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                now = time.perf_counter()
+                if timings.endpoint_finished_at is not None:
+                    timings.add("render", now - timings.endpoint_finished_at)
+                if settings.SERVER_TIMING_HEADER:
+                    header = _server_timing_header(timings, now - started_at)
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", header)]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _timings_var.reset(token)
+            # 매칭되지 않은 경로(404, 스캐너 요청 등)는 하나로 묶어 라벨 수 폭증 방지
+            route = route_template(scope) or "unmatched"
+            for phase, duration in timings.durations.items():
+                PHASE_DURATION.labels(route=route, phase=phase).observe(duration)
+            PHASE_DURATION.labels(route=route, phase="total").observe(time.perf_counter() - started_at)
@@ -0,0 +1,155 @@
+import functools
+import importlib
+import inspect
+import pkgutil
+from contextlib import contextmanager
+from typing import Any, Iterator
+from app.core.config import settings
+from app.core.logger import logger
+
+# [Spring: Micrometer Tracing + OpenTelemetry]
+# OTEL_ENABLED=True 일 때만 OpenTelemetry 패키지를 import 하고 계측을 붙입니다. (꺼져 있으면 비용 0)
+# - 라우터: FastAPI 계측 (요청 1건 = 루트 span)
+# - 서비스/리포지토리: app.services, app.repository의 공개 함수(및 클래스의 staticmethod)를 자동으로 감쌈
+# - Redis / SQLAlchemy / httpx(OAuth) / Celery 발행·실행: 공식 instrumentation 패키지
+# - Outbox로 미뤄진 태스크도 enqueue 시점의 trace context를 메시지에 저장해 워커까지 이어짐
+# 모든 span을 일단 만들고, 트레이스가 끝난 뒤 느리거나 실패한 트레이스만 전부 내보냅니다. (Tail Sampling)
+
+TRACED_PACKAGES = ("app.services", "app.repository")
+
+_provider = None
+_instrumentors: list = []
+# 자동 계측으로 교체한 속성 (owner, 이름, 원래 값) - shutdown_tracing()에서 원복
+_patched: list[tuple[Any, str, Any]] = []
+
+def _traced(func, span_name: str, tracer):
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(span_name):
+                return await func(*args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with tracer.start_as_current_span(span_name):
+            return func(*args, **kwargs)
+    return wrapper
+
+def _patch(owner, name: str, original, replacement):
+    setattr(owner, name, replacement)
+    _patched.append((owner, name, original))
+
+def _instrument_application_code(tracer):
+    """서비스/리포지토리 모듈의 공개 함수와 클래스 staticmethod를 span으로 감쌈 (module.function 이름)"""
+    for package_name in TRACED_PACKAGES:
+        package = importlib.import_module(package_name)
+        for module_info in pkgutil.iter_modules(package.__path__):
+            module = importlib.import_module(f"{package_name}.{module_info.name}")
+            prefix = module_info.name
+            for name, obj in list(vars(module).items()):
+                if name.startswith("_") or getattr(obj, "__module__", None) != module.__name__:
+                    continue
+                if inspect.isfunction(obj):
+                    _patch(module, name, obj, _traced(obj, f"{prefix}.{name}", tracer))
+                elif inspect.isclass(obj):
+                    for attr, value in list(vars(obj).items()):
+                        if isinstance(value, staticmethod) and not attr.startswith("_"):
+                            traced = staticmethod(_traced(value.__func__, f"{obj.__name__}.{attr}", tracer))
+                            _patch(obj, attr, value, traced)
+
+def setup_tracing(app=None, *, exporter=None, engines=None, service_name: str | None = None):
+    """
+    트레이싱 설정 (OTEL_ENABLED=False 이고 exporter도 넘기지 않으면 아무것도 하지 않음)
+    - app: FastAPI 앱 (미들웨어를 추가하므로 앱 시작 전에 호출)
+    - exporter: 테스트에서는 InMemorySpanExporter를 넘김 (기본은 OTLP/HTTP)
+    """
+    global _provider
+    if _provider is not None:
+        return _provider
+    if not settings.OTEL_ENABLED and exporter is None:
+        return None
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.instrumentation.celery import CeleryInstrumentor
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.instrumentation.redis import RedisInstrumentor
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+    from app.core.tail_sampling import TailSamplingSpanProcessor
+
+    if exporter is None:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        exporter = OTLPSpanExporter(endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT)
+    if engines is None:
+        from app.core.database import engine, task_engine
+
+        engines = [engine, task_engine]
+
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name or settings.OTEL_SERVICE_NAME}))
+    provider.add_span_processor(TailSamplingSpanProcessor(
+        BatchSpanProcessor(exporter),
+        sample_rate=settings.OTEL_TAIL_SAMPLE_RATE,
+        slow_threshold_ms=settings.OTEL_SLOW_TRACE_THRESHOLD_MS,
+    ))
+
+    if app is not None:
+        # Prometheus 스크레이프는 트레이스로 남기지 않음
+        FastAPIInstrumentor.instrument_app(app, tracer_provider=provider, excluded_urls="metrics")
+    sqlalchemy_instrumentor = SQLAlchemyInstrumentor()
+    sqlalchemy_instrumentor.instrument(engines=[e.sync_engine for e in engines], tracer_provider=provider)
+    _instrumentors.append(sqlalchemy_instrumentor)
+    for instrumentor in (RedisInstrumentor(), HTTPXClientInstrumentor(), CeleryInstrumentor()):
+        instrumentor.instrument(tracer_provider=provider)
+        _instrumentors.append(instrumentor)
+    _instrument_application_code(provider.get_tracer("app"))
+
+    _provider = provider
+    logger.info(f"🔭 OpenTelemetry tracing enabled ({settings.OTEL_TAIL_SAMPLE_RATE:.0%} of normal traces kept)")
+    return provider
+
+def shutdown_tracing(app=None):
+    """남은 span을 내보내고 계측을 해제"""
+    global _provider
+    if _provider is None:
+        return
+    if app is not None:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+        FastAPIInstrumentor.uninstrument_app(app)
+    for instrumentor in _instrumentors:
+        instrumentor.uninstrument()
+    _instrumentors.clear()
+    for owner, name, original in reversed(_patched):
+        setattr(owner, name, original)
+    _patched.clear()
+
+    _provider.shutdown()
+    _provider = None
+
+def inject_current_context() -> dict | None:
+    """현재 trace context를 W3C traceparent 헤더 dict로 (트레이싱이 꺼져 있으면 None)"""
+    if _provider is None:
+        return None
+    from opentelemetry import propagate
+
+    carrier: dict[str, str] = {}
+    propagate.inject(carrier)
+    return carrier or None
+
+@contextmanager
+def use_context(carrier: dict | None) -> Iterator[None]:
+    """inject_current_context()로 저장한 context를 현재 스레드에 복원 (다른 시점/스레드에서 이어가기)"""
+    if _provider is None or not carrier:
+        yield
+        return
+    from opentelemetry import context, propagate
+
+    token = context.attach(propagate.extract(carrier))
+    try:
+        yield
+    finally:
+        context.detach(token)
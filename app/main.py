@@ -1,14 +1,24 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from prometheus_fastapi_instrumentator import Instrumentator
 import uvicorn
 from contextlib import asynccontextmanager
-from app.routers.v1 import auth_router, user_router, board_router, comment_router
+from app.routers.v1 import auth_router, user_router, board_router, comment_router, upload_router, admin_router
 from app.core.database import engine, Base
-from app.core.logger import setup_logger
+from app.core.logger import setup_logger, flush_logger
+from app.core.request_context import RequestContextMiddleware
+from app.core.timing import ServerTimingMiddleware
+from app.core.compression import CompressionMiddleware
+from app.core.profiling import ProfilingMiddleware
 from app.core.config import settings
 from app.core.redis import close_redis_connection
+from app.core.outbox import outbox_dispatcher
+from app.core.job_runner import job_runner
+from app.core.loop_monitor import loop_monitor
+from app.core.metrics import setup_metrics
+from app.core.load_shedding import LoadSheddingMiddleware
+from app.core.deadline import DeadlineMiddleware
+from app.core.static_files import setup_static_files
+from app.core.tracing import setup_tracing, shutdown_tracing
 import os
 
 # 로거 설정 초기화
@@ -24,11 +34,29 @@ async def lifespan(app: FastAPI):
     # 업로드 디렉토리 생성
     if not os.path.exists(settings.UPLOAD_DIR):
         os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+
+    # 커밋된 Celery 태스크 발행 요청(outbox) 디스패처 시작
+    if settings.OUTBOX_DISPATCHER_ENABLED:
+        outbox_dispatcher.start()
+
+    # 응답 이후 실행할 가벼운 후속 작업(캐시 무효화 등) 러너 시작
+    job_runner.start()
+
+    # 이벤트 루프 지연 측정 (디버그 모드면 루프를 막은 호출의 스택까지 기록)
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor.start()
     
     yield
     
-    # Shutdown
+    # Shutdown (남은 후속 작업 -> outbox 발행 -> Redis 연결 순서로 정리)
+    await loop_monitor.stop()
+    await job_runner.stop()
+    await outbox_dispatcher.stop()
     await close_redis_connection()
+    # 남은 트레이스 전송 (OTEL_ENABLED일 때만)
+    shutdown_tracing()
+    # 백그라운드 로그 큐에 남은 로그까지 출력
+    flush_logger()
 
 app = FastAPI(
     title="FastAPI Enterprise Architecture",
@@ -46,19 +74,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Prometheus 메트릭 설정 (Instrumentator)
-Instrumentator().instrument(app).expose(app)
+# 관리자 요청 단위 프로파일링 (PROFILING_ENABLED=True + X-Profile 헤더일 때만 동작)
+app.add_middleware(ProfilingMiddleware)
+
+# 요청 ID 발급 + 로그 컨텍스트 (요청 처리 중 남긴 로그에 request_id/route가 찍히도록)
+app.add_middleware(RequestContextMiddleware)
+
+# 응답 압축 (Accept-Encoding: br/zstd/gzip, 압축 시간이 Server-Timing의 compress 구간에 잡히도록 그 안쪽)
+app.add_middleware(CompressionMiddleware)
+
+# 요청 구간별(auth, redis, db, render) 소요 시간 -> Server-Timing 헤더 + Prometheus 히스토그램
+app.add_middleware(ServerTimingMiddleware)
+
+# 요청별 마감 (지나면 하위 호출을 끊고 504, 동시 처리 자리를 얻은 뒤부터 계산)
+app.add_middleware(DeadlineMiddleware)
+
+# 과부하 시 동시 처리 수 제한 + 우선순위가 낮은 요청부터 503 (대기 시간도 HTTP 메트릭에 포함되도록 Instrumentator 안쪽)
+app.add_middleware(LoadSheddingMiddleware)
+
+# Prometheus 메트릭 설정 (Instrumentator, 워커가 여러 개면 PROMETHEUS_MULTIPROC_DIR로 합산)
+setup_metrics(app)
 
 # 정적 파일 서버 설정 (프로필 이미지 등)
 if not os.path.exists(settings.STATIC_DIR):
     os.makedirs(settings.STATIC_DIR, exist_ok=True)
-app.mount("/static", StaticFiles(directory=str(settings.STATIC_DIR)), name="static")
+setup_static_files(app)
 
 # 라우터 등록 (v1)
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(user_router, prefix="/api/v1")
 app.include_router(board_router, prefix="/api/v1")
 app.include_router(comment_router, prefix="/api/v1")
+app.include_router(upload_router, prefix="/api/v1")
+app.include_router(admin_router, prefix="/api/v1")
+
+# OpenTelemetry 트레이싱 (OTEL_ENABLED=True일 때만, 미들웨어를 추가하므로 앱 시작 전에 설정)
+setup_tracing(app)
 
 @app.get("/")
 async def root():
@@ -1,3 +1,5 @@
 from .user import User
 from .board import Board
 from .comment import Comment
+from .stored_file import StoredFile
+from .outbox_message import OutboxMessage
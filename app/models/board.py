@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -13,6 +13,9 @@ class Board(Base):
     
     # 첨부 이미지 경로 저장
     image_url = Column(String(500), nullable=True)
+
+    # 첨부 이미지의 파생 이미지 URL (예: {"thumbnail": "...", "medium": "...", "webp": "..."})
+    image_variants = Column(JSON, nullable=True)
     
     # user_id는 users 테이블의 email 컬럼을 참조합니다.
     user_id = Column(String(255), ForeignKey("users.email"))
@@ -20,8 +23,12 @@ class Board(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # 소프트 삭제 일시 (값이 있으면 목록/상세에서 즉시 숨김 처리, 실제 삭제는 Celery가 담당)
+    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
     # [JPA: 양방향 매핑]
     owner = relationship("User", back_populates="boards")
-    comments = relationship("Comment", back_populates="board", cascade="all, delete-orphan")
+    # passive_deletes=True: 게시글 삭제 시 댓글을 세션에 로딩하지 않고 DB의 ON DELETE CASCADE에 위임
+    comments = relationship("Comment", back_populates="board", cascade="all, delete-orphan", passive_deletes=True)
 
     
\ No newline at end of file
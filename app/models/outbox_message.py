@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+# [JPA: @Entity] Transactional Outbox
+# Celery 태스크 발행 요청을 비즈니스 데이터와 같은 트랜잭션으로 저장하고,
+# 커밋된 메시지만 OutboxDispatcher가 브로커로 발행한 뒤 삭제합니다.
+class OutboxMessage(Base):
+    __tablename__ = "outbox_messages"
+
+    # 발행 순서 = id 순서
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Celery 태스크 이름 (예: app.tasks.email_task.send_welcome_email)
+    task_name = Column(String(255), nullable=False)
+    args = Column(JSON, nullable=False)
+    kwargs = Column(JSON, nullable=False)
+    # enqueue 시점의 trace context (W3C traceparent), 트레이싱이 꺼져 있으면 NULL
+    trace_context = Column(JSON, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
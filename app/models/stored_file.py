@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+# [JPA: @Entity] 업로드 파일 메타데이터 (Content-Addressed Storage)
+# 같은 내용의 파일은 한 번만 저장하고, 몇 곳에서 참조하는지 ref_count로 관리합니다.
+class StoredFile(Base):
+    __tablename__ = "stored_files"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # 공개 URL (게시글/유저 테이블이 참조하는 값과 동일)
+    url = Column(String(500), unique=True, nullable=False)
+
+    # 파일 내용의 SHA-256 해시 (파일명으로도 사용, presigned 직접 업로드 파일은 서버가 내용을 보지 않으므로 NULL)
+    digest = Column(String(64), index=True, nullable=True)
+    size = Column(Integer, nullable=False)
+
+    # 참조 수 (0이 되면 GC 태스크가 유예 시간 이후 실제 파일을 삭제)
+    ref_count = Column(Integer, default=0, nullable=False, index=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import Boolean, Column, String, Enum
+from sqlalchemy import Boolean, Column, String, Enum, DateTime, JSON
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -37,6 +37,12 @@ class User(Base):
     # 프로필 이미지 경로 저장
     profile_image_url = Column(String(500), nullable=True)
 
+    # 프로필 이미지의 파생 이미지 URL (Celery 워커가 생성 후 기록)
+    profile_image_variants = Column(JSON, nullable=True)
+
+    # 탈퇴(소프트 삭제) 일시 - 값이 있으면 탈퇴 처리된 계정이며, 실제 데이터는 Celery purge 태스크가 정리
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
     # [JPA: @OneToMany(mappedBy = "owner")]
     boards = relationship("Board", back_populates="owner")
     comments = relationship("Comment", back_populates="owner")
@@ -1,20 +1,21 @@
+from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, delete, update
 from app.models.board import Board
 from app.schemas.board import BoardCreate, BoardUpdate
 
 async def get_board(db: AsyncSession, board_id: int):
-    stmt = select(Board).where(Board.id == board_id)
+    stmt = select(Board).where(Board.id == board_id, Board.deleted_at.is_(None))
     result = await db.execute(stmt)
     return result.scalars().first()
 
 async def get_boards(db: AsyncSession, skip: int = 0, limit: int = 100):
-    stmt = select(Board).order_by(Board.id.desc()).offset(skip).limit(limit)
+    stmt = select(Board).where(Board.deleted_at.is_(None)).order_by(Board.id.desc()).offset(skip).limit(limit)
     result = await db.execute(stmt)
     return result.scalars().all()
 
 async def get_boards_count(db: AsyncSession):
-    stmt = select(func.count()).select_from(Board)
+    stmt = select(func.count()).select_from(Board).where(Board.deleted_at.is_(None))
     result = await db.execute(stmt)
     return result.scalar()
 
@@ -35,5 +36,39 @@ async def update_board(db: AsyncSession, db_board: Board, board_update: BoardUpd
     return db_board
 
 async def delete_board(db: AsyncSession, db_board: Board):
+    # passive_deletes=True 이므로 댓글은 로딩하지 않고 DB의 ON DELETE CASCADE가 정리
     await db.delete(db_board)
     await db.commit()
+
+# 소프트 삭제: 즉시 숨김 처리 (실제 삭제는 purge 태스크가 담당)
+async def hide_board(db: AsyncSession, db_board: Board):
+    db_board.deleted_at = datetime.now(timezone.utc)
+    await db.commit()
+
+# purge 태스크용: 엔티티를 로딩하지 않고 PK로 바로 삭제
+async def delete_board_by_id(db: AsyncSession, board_id: int):
+    stmt = delete(Board).where(Board.id == board_id)
+    await db.execute(stmt)
+    await db.commit()
+
+# purge 태스크용: 특정 유저의 게시글을 (숨김 포함) 최대 limit 건씩 조회
+# 숨김 게시글은 숨길 때 이미지 참조 수를 이미 줄였으므로 deleted_at도 함께 반환
+async def get_boards_batch_by_user(db: AsyncSession, user_id: str, limit: int):
+    stmt = select(Board.id, Board.image_url, Board.deleted_at).where(Board.user_id == user_id).limit(limit)
+    result = await db.execute(stmt)
+    return result.all()
+
+# 커밋하지 않음: 첨부 이미지 참조 수 감소와 같은 트랜잭션으로 묶어야 하므로 호출한 쪽에서 커밋
+async def delete_boards_by_ids(db: AsyncSession, board_ids: list[int]):
+    await db.execute(delete(Board).where(Board.id.in_(board_ids)))
+
+# 주어진 URL 중 게시글(숨김 포함)이 첨부 이미지로 참조하는 것 (고아 파일 검사용)
+async def get_referenced_image_urls(db: AsyncSession, image_urls: list[str]) -> set[str]:
+    result = await db.execute(select(Board.image_url).where(Board.image_url.in_(image_urls)).distinct())
+    return set(result.scalars().all())
+
+# 이미지 파생본 기록 (해당 이미지를 참조하는 게시글 전체)
+async def update_image_variants(db: AsyncSession, image_url: str, variants: dict[str, str]):
+    stmt = update(Board).where(Board.image_url == image_url).values(image_variants=variants)
+    await db.execute(stmt)
+    await db.commit()
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, delete
 from app.models.comment import Comment
 from app.schemas.comment import CommentCreate, CommentUpdate
 
@@ -13,6 +13,11 @@ async def get_comments_by_board(db: AsyncSession, board_id: int, skip: int = 0,
     result = await db.execute(stmt)
     return result.scalars().all()
 
+async def count_comments_by_board(db: AsyncSession, board_id: int):
+    stmt = select(func.count()).select_from(Comment).where(Comment.board_id == board_id)
+    result = await db.execute(stmt)
+    return result.scalar()
+
 async def create_comment(db: AsyncSession, comment: CommentCreate, board_id: int, user_id: str):
     db_comment = Comment(**comment.model_dump(), board_id=board_id, user_id=user_id)
     db.add(db_comment)
@@ -31,4 +36,24 @@ async def update_comment(db: AsyncSession, db_comment: Comment, comment_update:
 
 async def delete_comment(db: AsyncSession, db_comment: Comment):
     await db.delete(db_comment)
-    await db.commit()
\ No newline at end of file
+    await db.commit()
+
+# 배치 삭제: 최대 limit 건의 PK만 조회한 뒤 삭제하고 바로 커밋 (짧은 트랜잭션 유지)
+# MariaDB는 IN 서브쿼리 안의 LIMIT을 지원하지 않으므로 2단계로 나눠 실행합니다.
+async def delete_comments_batch(db: AsyncSession, limit: int, board_id: int = None, user_id: str = None):
+    if board_id is None and user_id is None:
+        raise ValueError("board_id 또는 user_id 중 하나는 반드시 지정해야 합니다.")
+
+    stmt = select(Comment.id).limit(limit)
+    if board_id is not None:
+        stmt = stmt.where(Comment.board_id == board_id)
+    if user_id is not None:
+        stmt = stmt.where(Comment.user_id == user_id)
+    result = await db.execute(stmt)
+    comment_ids = result.scalars().all()
+    if not comment_ids:
+        return 0
+
+    await db.execute(delete(Comment).where(Comment.id.in_(comment_ids)))
+    await db.commit()
+    return len(comment_ids)
@@ -0,0 +1,26 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete
+from app.models.outbox_message import OutboxMessage
+
+# [참고] 메시지 추가는 커밋하지 않습니다.
+# 호출한 서비스의 트랜잭션이 커밋될 때 함께 저장되고, 롤백되면 함께 사라집니다.
+async def add_outbox_message(db: AsyncSession, task_name: str, args: list, kwargs: dict, trace_context: dict | None = None):
+    db_message = OutboxMessage(task_name=task_name, args=args, kwargs=kwargs, trace_context=trace_context)
+    db.add(db_message)
+    return db_message
+
+# 발행 대기 메시지를 순서대로 행 잠금과 함께 조회
+# (API 서버가 여러 대여도 SKIP LOCKED로 같은 메시지를 중복 발행하지 않음)
+async def get_pending_messages_for_update(db: AsyncSession, limit: int):
+    stmt = (
+        select(OutboxMessage)
+        .order_by(OutboxMessage.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(stmt)
+    return result.scalars().all()
+
+async def delete_messages_by_ids(db: AsyncSession, message_ids: list[int]):
+    await db.execute(delete(OutboxMessage).where(OutboxMessage.id.in_(message_ids)))
+    await db.commit()
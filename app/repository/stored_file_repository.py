@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.models.stored_file import StoredFile
+
+# [참고] 참조 수 증감은 커밋하지 않습니다.
+# 게시글/유저 변경과 같은 트랜잭션으로 묶여야 하므로 호출한 서비스의 커밋에 함께 반영됩니다.
+# updated_at은 GC 유예 시간 비교에 쓰이므로 DB 서버 시간대와 무관하게 애플리케이션의 UTC 시각으로 기록합니다.
+
+async def get_stored_file(db: AsyncSession, url: str):
+    stmt = select(StoredFile).where(StoredFile.url == url)
+    result = await db.execute(stmt)
+    return result.scalars().first()
+
+# 참조 수 +1 (없으면 생성) - 동시 업로드에도 안전하도록 UPSERT 한 문장으로 처리
+async def increment_ref_count(db: AsyncSession, url: str, digest: str, size: int):
+    now = datetime.now(timezone.utc)
+    values = {"url": url, "digest": digest, "size": size, "ref_count": 1, "updated_at": now}
+    increment = {"ref_count": StoredFile.ref_count + 1, "updated_at": now}
+
+    if db.bind.dialect.name == "sqlite":
+        stmt = sqlite_insert(StoredFile).values(**values).on_conflict_do_update(
+            index_elements=[StoredFile.url], set_=increment
+        )
+    else:
+        stmt = mysql_insert(StoredFile).values(**values).on_duplicate_key_update(**increment)
+    await db.execute(stmt)
+
+# 이미 저장된 파일의 참조 수 +1 (presigned 직접 업로드 파일 등, 없으면 0 반환)
+async def increment_existing_ref_count(db: AsyncSession, url: str):
+    stmt = (
+        update(StoredFile)
+        .where(StoredFile.url == url)
+        .values(ref_count=StoredFile.ref_count + 1, updated_at=datetime.now(timezone.utc))
+    )
+    result = await db.execute(stmt)
+    return result.rowcount
+
+# 파일을 참조 없이 기록 (이미 있으면 GC 유예 시간만 갱신)
+# 이어받기 업로드 완료, 메타데이터 없는 파일(이전 업로드/고아 파일)을 GC 대상으로 편입할 때 사용
+async def register_stored_file(db: AsyncSession, url: str, digest: str | None, size: int):
+    now = datetime.now(timezone.utc)
+    values = {"url": url, "digest": digest, "size": size, "ref_count": 0, "updated_at": now}
+
+    if db.bind.dialect.name == "sqlite":
+        stmt = sqlite_insert(StoredFile).values(**values).on_conflict_do_update(
+            index_elements=[StoredFile.url], set_={"updated_at": now}
+        )
+    else:
+        stmt = mysql_insert(StoredFile).values(**values).on_duplicate_key_update(updated_at=now)
+    await db.execute(stmt)
+
+# 주어진 URL 중 메타데이터가 있는 것 (고아 파일 검사용)
+async def get_existing_urls(db: AsyncSession, urls: list[str]) -> set[str]:
+    result = await db.execute(select(StoredFile.url).where(StoredFile.url.in_(urls)))
+    return set(result.scalars().all())
+
+# 직접 업로드 완료 기록 (아직 아무도 참조하지 않으므로 ref_count=0, 사용되지 않으면 GC 대상)
+async def create_stored_file(db: AsyncSession, url: str, size: int, digest: str = None):
+    db_stored_file = StoredFile(url=url, digest=digest, size=size, ref_count=0, updated_at=datetime.now(timezone.utc))
+    db.add(db_stored_file)
+    await db.commit()
+    return db_stored_file
+
+# 참조 수 -1 (관리 대상 파일이 아니면 0 반환)
+async def decrement_ref_count(db: AsyncSession, url: str):
+    stmt = (
+        update(StoredFile)
+        .where(StoredFile.url == url, StoredFile.ref_count > 0)
+        .values(ref_count=StoredFile.ref_count - 1, updated_at=datetime.now(timezone.utc))
+    )
+    result = await db.execute(stmt)
+    return result.rowcount
+
+# GC 대상 조회: 참조가 없고 유예 시간이 지난 파일을 행 잠금과 함께 조회
+# (잠금을 잡은 동안 같은 파일을 새로 업로드하는 요청은 UPSERT에서 대기합니다.)
+async def get_unreferenced_files_for_update(db: AsyncSession, grace_seconds: int, limit: int):
+    threshold = datetime.now(timezone.utc) - timedelta(seconds=grace_seconds)
+    stmt = (
+        select(StoredFile)
+        .where(StoredFile.ref_count <= 0, StoredFile.updated_at < threshold)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(stmt)
+    return result.scalars().all()
+
+async def delete_stored_files_by_ids(db: AsyncSession, file_ids: list[int]):
+    await db.execute(delete(StoredFile).where(StoredFile.id.in_(file_ids)))
+    await db.commit()
@@ -1,5 +1,6 @@
+from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete, update
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import get_password_hash
@@ -14,7 +15,7 @@ async def get_user(db: AsyncSession, email: str):
 
 # 모든 유저 조회
 async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100):
-    stmt = select(User).offset(skip).limit(limit)
+    stmt = select(User).where(User.deleted_at.is_(None)).offset(skip).limit(limit)
     result = await db.execute(stmt)
     return result.scalars().all()
 
@@ -24,10 +25,10 @@ async def create_user(db: AsyncSession, user: UserCreate | User):
         # 이미 User 모델 객체인 경우 (소셜 로그인 등)
         db_user = user
         if db_user.password:
-            db_user.password = get_password_hash(db_user.password)
+            db_user.password = await get_password_hash(db_user.password)
     else:
         # UserCreate DTO인 경우 (일반 회원가입 등)
-        hashed_password = get_password_hash(user.password) if user.password else None
+        hashed_password = await get_password_hash(user.password) if user.password else None
         db_user = User(
             email=user.email, 
             password=hashed_password,
@@ -43,7 +44,7 @@ async def create_user(db: AsyncSession, user: UserCreate | User):
 # 유저 수정 (Update)
 async def update_user(db: AsyncSession, db_user: User, user_update: UserUpdate):
     if user_update.password:
-        db_user.password = get_password_hash(user_update.password)
+        db_user.password = await get_password_hash(user_update.password)
     
     if user_update.is_active is not None:
         db_user.is_active = user_update.is_active
@@ -56,3 +57,25 @@ async def update_user(db: AsyncSession, db_user: User, user_update: UserUpdate):
 async def delete_user(db: AsyncSession, db_user: User):
     await db.delete(db_user)
     await db.commit()
+
+# 유저 소프트 삭제 (탈퇴 처리: 즉시 비활성화, 실제 삭제는 purge 태스크가 담당)
+async def soft_delete_user(db: AsyncSession, db_user: User):
+    db_user.is_active = False
+    db_user.deleted_at = datetime.now(timezone.utc)
+    await db.commit()
+
+# purge 태스크용: 엔티티를 로딩하지 않고 PK로 바로 삭제
+async def delete_user_by_email(db: AsyncSession, email: str):
+    await db.execute(delete(User).where(User.email == email))
+    await db.commit()
+
+# 주어진 URL 중 유저(탈퇴 처리 포함)가 프로필 이미지로 참조하는 것 (고아 파일 검사용)
+async def get_referenced_profile_image_urls(db: AsyncSession, image_urls: list[str]) -> set[str]:
+    result = await db.execute(select(User.profile_image_url).where(User.profile_image_url.in_(image_urls)).distinct())
+    return set(result.scalars().all())
+
+# 프로필 이미지 파생본 기록
+async def update_profile_image_variants(db: AsyncSession, image_url: str, variants: dict[str, str]):
+    stmt = update(User).where(User.profile_image_url == image_url).values(profile_image_variants=variants)
+    await db.execute(stmt)
+    await db.commit()
@@ -2,3 +2,5 @@ from .auth_router import router as auth_router
 from .user_router import router as user_router
 from .board_router import router as board_router
 from .comment_router import router as comment_router
+from .upload_router import router as upload_router
+from .admin_router import router as admin_router
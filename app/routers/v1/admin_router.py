@@ -0,0 +1,34 @@
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.core.config import settings
+from app.core.profiling import admin_only, run_worker_profile
+from app.core.timing import TimedRoute
+
+# [Spring: Actuator 관리 엔드포인트] 관리자 전용 운영 도구
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(admin_only)],
+    route_class=TimedRoute,
+)
+
+# 워커 전체 프로파일링 (관리자 전용)
+@router.post(
+    "/profile",
+    summary="워커 샘플링 프로파일",
+    description="이 요청을 받은 워커의 이벤트 루프를 N초 동안 샘플링해 flamegraph(HTML) 또는 speedscope JSON으로 반환합니다. **관리자 권한**과 `PROFILING_ENABLED=True`가 필요합니다.",
+    responses={
+        200: {"description": "프로파일 결과 (text/html 또는 application/json)"},
+        403: {"description": "권한 부족 (관리자만 접근 가능)"},
+        404: {"description": "프로파일링 비활성화"},
+        409: {"description": "이미 다른 프로파일링이 실행 중"},
+    }
+)
+async def profile_worker(
+    seconds: float = Query(10, gt=0, le=settings.PROFILING_MAX_SECONDS, description="샘플링 시간(초)"),
+    format: Literal["html", "speedscope"] = Query("html", description="결과 형식"),
+):
+    if not settings.PROFILING_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiling is disabled")
+    return await run_worker_profile(seconds, format)
@@ -8,10 +8,10 @@ from app.services import auth_service, google_auth_service, kakao_auth_service
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.core.rate_limiter import RateLimiter
-from app.core.logger import setup_logger
+from app.core.logger import logger
+from app.core.timing import TimedRoute
 
-logger = setup_logger()
-router = APIRouter(tags=["authentication"])
+router = APIRouter(tags=["authentication"], route_class=TimedRoute)
 
 # [Google 로그인 시작 API]
 @router.get(
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form
+from fastapi import APIRouter, Depends, UploadFile, File, Form, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
@@ -10,10 +10,13 @@ from app.services import board_service
 from app.services.file_service import FileService
 from app.models.user import User
 from app.core.rate_limiter import RateLimiter
+from app.core.deadline import RouteDeadline
+from app.core.timing import TimedRoute
 
 router = APIRouter(
     prefix="/boards",
     tags=["boards"],
+    route_class=TimedRoute,
 )
 
 # 글쓰기 (Multipart/form-data)
@@ -33,12 +36,14 @@ async def create_board(
     title: str = Form(..., description="게시글 제목"),
     content: str = Form(..., description="게시글 본문"),
     file: Optional[UploadFile] = File(None, description="첨부 이미지 파일"),
+    image_url: Optional[str] = Form(None, description="직접/이어받기 업로드(/uploads) 완료 후 받은 본인 파일 URL (file 대신 사용)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    image_url = None
     if file:
-        image_url = await FileService.save_file(file, sub_dir="boards")
+        image_url = await FileService.save_file(db, file, sub_dir="boards")
+    elif image_url:
+        await FileService.acquire(db, image_url, user_id=current_user.email)
         
     board = BoardCreate(title=title, content=content)
     return await board_service.create_new_board(db=db, board=board, user_id=current_user.email, image_url=image_url)
@@ -62,12 +67,14 @@ async def update_board(
     title: Optional[str] = Form(None, description="수정할 제목"),
     content: Optional[str] = Form(None, description="수정할 본문"),
     file: Optional[UploadFile] = File(None, description="새 첨부 이미지 파일"),
+    image_url: Optional[str] = Form(None, description="직접/이어받기 업로드(/uploads) 완료 후 받은 본인의 새 파일 URL (file 대신 사용)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    image_url = None
     if file:
-        image_url = await FileService.save_file(file, sub_dir="boards")
+        image_url = await FileService.save_file(db, file, sub_dir="boards")
+    elif image_url:
+        await FileService.acquire(db, image_url, user_id=current_user.email)
     
     board_update = BoardUpdate(title=title, content=content)
     return await board_service.update_existing_board(
@@ -78,28 +85,34 @@ async def update_board(
 @router.get(
     "/", 
     response_model=PageResponse[BoardResponse],
+    dependencies=[Depends(RouteDeadline(seconds=5))],
     summary="게시글 목록 조회 (페이징)",
     description="전체 게시글 목록을 최신순으로 페이징하여 조회합니다.",
     responses={
-        200: {"description": "목록 조회 성공"}
+        200: {"description": "목록 조회 성공"},
+        504: {"description": "처리 시간 초과"}
     }
 )
 async def read_boards(
     page: int = 1, 
     size: int = 10, 
+    accept_encoding: Optional[str] = Header(None, include_in_schema=False),
     db: AsyncSession = Depends(get_db)
 ):
-    return await board_service.get_boards_list(db=db, page=page, size=size)
+    # 캐시에 미리 압축해 둔 본문을 그대로 응답 (response_model은 문서용, 직렬화/검증은 캐시를 채울 때 한 번)
+    return await board_service.get_boards_list(db=db, page=page, size=size, accept_encoding=accept_encoding)
 
 # 단건 조회
 @router.get(
     "/{board_id}", 
     response_model=BoardResponse,
+    dependencies=[Depends(RouteDeadline(seconds=5))],
     summary="게시글 상세 조회",
     description="특정 ID를 가진 게시글의 상세 정보를 조회합니다.",
     responses={
         200: {"description": "조회 성공"},
-        404: {"description": "게시글을 찾을 수 없음"}
+        404: {"description": "게시글을 찾을 수 없음"},
+        504: {"description": "처리 시간 초과"}
     }
 )
 async def read_board(board_id: int, db: AsyncSession = Depends(get_db)):
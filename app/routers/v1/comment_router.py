@@ -8,9 +8,12 @@ from app.schemas.comment import CommentCreate, CommentUpdate, CommentResponse
 from app.services import comment_service
 from app.models.user import User
 from app.core.rate_limiter import RateLimiter
+from app.core.deadline import RouteDeadline
+from app.core.timing import TimedRoute
 
 router = APIRouter(
     tags=["comments"],
+    route_class=TimedRoute,
 )
 
 # 댓글 작성
@@ -41,11 +44,13 @@ async def create_comment(
 @router.get(
     "/boards/{board_id}/comments", 
     response_model=List[CommentResponse],
+    dependencies=[Depends(RouteDeadline(seconds=5))],
     summary="특정 게시글의 댓글 목록 조회",
     description="게시글 ID를 기반으로 해당 게시글에 달린 모든 댓글 목록을 조회합니다.",
     responses={
         200: {"description": "댓글 목록 조회 성공"},
-        404: {"description": "게시글을 찾을 수 없음"}
+        404: {"description": "게시글을 찾을 수 없음"},
+        504: {"description": "처리 시간 초과"}
     }
 )
 async def read_comments(
@@ -0,0 +1,167 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.dependencies import get_current_user
+from app.schemas.upload import (
+    PresignedUploadRequest, PresignedUploadResponse, UploadCompleteRequest, UploadCompleteResponse,
+    UploadSessionCreateRequest, UploadSessionResponse,
+)
+from app.services.file_service import FileService
+from app.services import upload_service
+from app.models.user import User
+from app.core.rate_limiter import RateLimiter
+from app.core.timing import TimedRoute
+
+router = APIRouter(
+    prefix="/uploads",
+    tags=["uploads"],
+    route_class=TimedRoute,
+)
+
+# presigned 직접 업로드 요청 생성
+@router.post(
+    "/presigned",
+    response_model=PresignedUploadResponse,
+    dependencies=[Depends(RateLimiter(times=20, seconds=60))],
+    summary="직접 업로드 URL 발급",
+    description="파일을 API 서버를 거치지 않고 오브젝트 스토리지(S3 호환)에 직접 업로드할 수 있는 presigned 요청을 발급합니다. 업로드 후 반드시 완료 API를 호출해야 합니다.",
+    responses={
+        200: {"description": "발급 성공"},
+        401: {"description": "인증 실패 (토큰 누락)"},
+        413: {"description": "파일 크기 초과"},
+        415: {"description": "허용되지 않는 파일 형식"},
+        501: {"description": "로컬 스토리지 사용 중 (직접 업로드 미지원)"}
+    }
+)
+async def create_presigned_upload(
+    upload: PresignedUploadRequest,
+    current_user: User = Depends(get_current_user)
+):
+    return await FileService.create_presigned_upload(
+        user_id=current_user.email, filename=upload.filename, content_type=upload.content_type,
+        size=upload.size, category=upload.category
+    )
+
+# 직접 업로드 완료 처리
+@router.post(
+    "/complete",
+    response_model=UploadCompleteResponse,
+    dependencies=[Depends(RateLimiter(times=20, seconds=60))],
+    summary="직접 업로드 완료",
+    description="스토리지에 업로드된 객체를 확인하고 파일 정보를 기록합니다. 반환된 file_url을 게시글 작성/수정 시 image_url로 전달하세요.",
+    responses={
+        200: {"description": "완료 처리 성공"},
+        400: {"description": "유효하지 않은 key 또는 이미지가 아닌 파일 (객체는 삭제됨)"},
+        404: {"description": "업로드된 파일을 찾을 수 없음 (다른 사용자에게 발급된 key 포함)"},
+        413: {"description": "파일 크기 초과"}
+    }
+)
+async def complete_upload(
+    upload: UploadCompleteRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    file_url = await FileService.complete_presigned_upload(db, key=upload.key, user_id=current_user.email)
+    return {"file_url": file_url}
+
+# 이어받기 업로드 세션 생성
+@router.post(
+    "/sessions",
+    response_model=UploadSessionResponse,
+    dependencies=[Depends(RateLimiter(times=20, seconds=60))],
+    summary="이어받기 업로드 세션 생성",
+    description="대용량 파일을 청크 단위로 나눠 올릴 수 있는 업로드 세션을 생성합니다. 연결이 끊기면 세션 조회로 offset을 확인한 뒤 그 지점부터 이어서 전송하면 됩니다.",
+    responses={
+        200: {"description": "세션 생성 성공"},
+        401: {"description": "인증 실패 (토큰 누락)"},
+        413: {"description": "파일 크기 초과"},
+        415: {"description": "허용되지 않는 파일 형식"}
+    }
+)
+async def create_upload_session(
+    upload: UploadSessionCreateRequest,
+    current_user: User = Depends(get_current_user)
+):
+    return await upload_service.create_upload_session(
+        user_id=current_user.email, filename=upload.filename, content_type=upload.content_type,
+        size=upload.size, category=upload.category
+    )
+
+# 이어받기 업로드 세션 조회 (재개 시 offset 확인)
+@router.get(
+    "/sessions/{upload_id}",
+    response_model=UploadSessionResponse,
+    summary="이어받기 업로드 상태 조회",
+    description="서버가 지금까지 받은 byte 수(offset)를 반환합니다.",
+    responses={
+        200: {"description": "조회 성공"},
+        404: {"description": "세션 없음 (만료 또는 다른 사용자의 세션)"}
+    }
+)
+async def get_upload_session(
+    upload_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    return await upload_service.get_upload_session(upload_id, user_id=current_user.email)
+
+# 청크 업로드 (요청 본문 = 파일 조각, application/octet-stream)
+@router.put(
+    "/sessions/{upload_id}",
+    response_model=UploadSessionResponse,
+    summary="청크 업로드",
+    description="요청 본문(raw bytes)을 offset 위치부터 기록합니다. offset은 세션의 현재 offset과 같아야 합니다.",
+    responses={
+        200: {"description": "기록 성공 (다음 offset 반환)"},
+        400: {"description": "선언한 파일 크기 초과"},
+        404: {"description": "세션 없음"},
+        409: {"description": "offset 불일치 또는 같은 세션의 다른 요청 처리 중"}
+    }
+)
+async def upload_chunk(
+    upload_id: str,
+    request: Request,
+    offset: int = Query(..., ge=0, description="이 청크의 시작 위치 (byte)"),
+    current_user: User = Depends(get_current_user)
+):
+    return await upload_service.upload_chunk(
+        upload_id, user_id=current_user.email, offset=offset, chunks=request.stream()
+    )
+
+# 이어받기 업로드 완료
+@router.post(
+    "/sessions/{upload_id}/complete",
+    response_model=UploadCompleteResponse,
+    summary="이어받기 업로드 완료",
+    description="모든 청크를 받은 파일을 검증 후 저장합니다. 반환된 file_url을 게시글 작성/수정 시 image_url로 전달하세요.",
+    responses={
+        200: {"description": "완료 처리 성공"},
+        404: {"description": "세션 없음"},
+        409: {"description": "아직 모든 청크를 받지 못함"},
+        415: {"description": "파일 내용이 이미지 형식이 아님"}
+    }
+)
+async def complete_upload_session(
+    upload_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    file_url = await upload_service.complete_upload_session(db, upload_id, user_id=current_user.email)
+    return {"file_url": file_url}
+
+# 이어받기 업로드 취소
+@router.delete(
+    "/sessions/{upload_id}",
+    summary="이어받기 업로드 취소",
+    description="세션과 지금까지 받은 임시 파일을 삭제합니다.",
+    responses={
+        200: {"description": "취소 성공"},
+        404: {"description": "세션 없음"}
+    }
+)
+async def cancel_upload_session(
+    upload_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    await upload_service.cancel_upload_session(upload_id, user_id=current_user.email)
+    return {"message": "Upload session cancelled"}
@@ -7,11 +7,13 @@ from app.schemas.user import UserCreate, User, UserUpdate
 from app.services import user_service
 from app.services.file_service import FileService
 from app.models.user import User as UserModel, UserRole  # 타입 힌트 및 역할 Enum
+from app.core.timing import TimedRoute
 
 # [Spring: @RestController]
 router = APIRouter(
     prefix="/users",
     tags=["users"],
+    route_class=TimedRoute,
 )
 
 # 권한 가드 정의
@@ -55,14 +57,10 @@ async def upload_profile_image(
     if current_user.email != email:
         raise HTTPException(status_code=403, detail="인증 실패")
     
-    # 1. 기존 이미지가 있다면 삭제
-    if current_user.profile_image_url:
-        FileService.delete_file(current_user.profile_image_url)
+    # 1. 새 이미지 저장 (기존 이미지는 서비스에서 참조 해제)
+    image_url = await FileService.save_file(db, file, sub_dir="profiles")
     
-    # 2. 새 이미지 저장
-    image_url = await FileService.save_file(file, sub_dir="profiles")
-    
-    # 3. DB 업데이트
+    # 2. DB 업데이트
     return await user_service.update_profile_image(db=db, email=email, image_url=image_url)
 
 # 회원가입 (누구나 가능)
@@ -123,7 +121,7 @@ async def update_user(
 @router.delete(
     "/{email}",
     summary="사용자 계정 삭제",
-    description="사용자 계정을 영구적으로 삭제합니다. 본인 계정에 대해서만 삭제가 가능합니다.",
+    description="사용자 계정을 즉시 비활성화(탈퇴 처리)하고, 작성한 게시글/댓글/업로드 파일은 백그라운드에서 순차적으로 삭제합니다. 본인 계정에 대해서만 삭제가 가능합니다.",
     responses={
         200: {"description": "삭제 성공"},
         403: {"description": "인증 실패 (본인 아님)"},
@@ -24,6 +24,11 @@ class BoardResponse(BoardBase):
     id: int = Field(..., description="게시글 고유 식별 번호 (PK)", examples=[1])
     user_id: str = Field(..., description="작성자의 이메일 주소", examples=["testuser@example.com"])
     image_url: Optional[str] = Field(None, description="첨부 이미지 URL 경로", examples=["/static/uploads/boards/abc.jpg"])
+    image_variants: Optional[dict[str, str]] = Field(
+        None,
+        description="첨부 이미지의 축소/WebP 변환 이미지 URL (생성 전에는 null)",
+        examples=[{"thumbnail": "/static/uploads/boards/abc_thumbnail.jpg", "medium": "/static/uploads/boards/abc_medium.jpg", "webp": "/static/uploads/boards/abc_webp.webp"}]
+    )
     created_at: datetime = Field(..., description="최초 작성 일시")
     updated_at: Optional[datetime] = Field(None, description="최종 수정 일시")
 
@@ -0,0 +1,43 @@
+from pydantic import BaseModel, Field
+from typing import Literal
+
+# presigned 직접 업로드 요청 DTO
+class PresignedUploadRequest(BaseModel):
+    """스토리지 직접 업로드를 위한 presigned 요청 생성 시 필요한 데이터"""
+    filename: str = Field(..., description="업로드할 파일명 (확장자 검사용)", examples=["photo.jpg"])
+    content_type: str = Field(..., description="파일의 MIME 타입", examples=["image/jpeg"])
+    size: int = Field(..., gt=0, description="파일 크기 (byte)", examples=[204800])
+    category: Literal["boards", "profiles"] = Field("boards", description="업로드 파일 분류", examples=["boards"])
+
+# presigned 직접 업로드 응답 DTO
+class PresignedUploadResponse(BaseModel):
+    """클라이언트는 upload_url로 fields + file을 multipart POST 한 뒤 complete API를 호출합니다."""
+    key: str = Field(..., description="스토리지 객체 key (완료 API 호출 시 사용)", examples=["boards/direct/3f2a....jpg"])
+    upload_url: str = Field(..., description="파일을 직접 업로드할 스토리지 주소")
+    fields: dict[str, str] = Field(..., description="업로드 요청에 함께 보낼 서명된 form 필드")
+    file_url: str = Field(..., description="업로드 완료 후 파일에 접근할 URL")
+
+# 업로드 완료 요청 DTO
+class UploadCompleteRequest(BaseModel):
+    key: str = Field(..., description="presigned 요청 생성 시 받은 객체 key", examples=["boards/direct/3f2a....jpg"])
+
+# 업로드 완료 응답 DTO
+class UploadCompleteResponse(BaseModel):
+    file_url: str = Field(..., description="게시글 작성/수정 시 image_url로 전달할 파일 URL", examples=["https://cdn.example.com/boards/direct/3f2a....jpg"])
+
+# 이어받기 업로드 세션 생성 요청 DTO
+class UploadSessionCreateRequest(BaseModel):
+    """청크 단위 이어받기 업로드 세션 생성 시 필요한 데이터"""
+    filename: str = Field(..., description="업로드할 파일명 (확장자 검사용)", examples=["photo.jpg"])
+    content_type: str = Field(..., description="파일의 MIME 타입", examples=["image/jpeg"])
+    size: int = Field(..., gt=0, description="전체 파일 크기 (byte)", examples=[8388608])
+    category: Literal["boards", "profiles"] = Field("boards", description="업로드 파일 분류", examples=["boards"])
+
+# 이어받기 업로드 세션 응답 DTO
+class UploadSessionResponse(BaseModel):
+    """클라이언트는 offset부터 chunk_size 이하 크기로 나눠 PUT 합니다."""
+    upload_id: str = Field(..., description="업로드 세션 ID")
+    offset: int = Field(..., description="서버가 지금까지 받은 byte 수 (다음 청크의 시작 위치)", examples=[0])
+    size: int = Field(..., description="전체 파일 크기 (byte)", examples=[8388608])
+    chunk_size: int = Field(..., description="권장 청크 크기 (byte)", examples=[5242880])
+    expires_in: int = Field(..., description="마지막 청크 이후 세션 유지 시간 (초)", examples=[86400])
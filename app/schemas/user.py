@@ -51,6 +51,7 @@ class UserUpdate(BaseModel):
 class User(UserBase):
     is_active: bool = Field(..., description="사용자 활성 상태")
     profile_image_url: Optional[str] = Field(None, description="프로필 이미지 URL 경로")
+    profile_image_variants: Optional[dict[str, str]] = Field(None, description="프로필 이미지의 축소/WebP 변환 이미지 URL (생성 전에는 null)")
 
     # [ModelMapper] Entity -> DTO 변환
     model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,108 @@
+"""
+운영용 API 서버 실행 (gunicorn 마스터 + uvicorn 워커 N개)
+
+    python -m app.server
+
+- 워커: SERVER_WORKERS (0이면 이 프로세스가 쓸 수 있는 CPU 코어 수), 이벤트 루프는 uvloop, HTTP 파서는 httptools
+- preload: 마스터가 앱을 한 번 import 한 뒤 fork 하므로 import 비용(라우터/모델/Pydantic 스키마 구성)은 한 번만 듭니다.
+- max-requests: 워커마다 SERVER_MAX_REQUESTS + 0~SERVER_MAX_REQUESTS_JITTER 건을 처리하면 교체 (동시에 재시작되지 않도록 jitter)
+- 메트릭: 워커가 2개 이상이면 PROMETHEUS_MULTIPROC_DIR(없으면 임시 디렉토리)에 워커별 값을 기록하고 /metrics에서 합산
+- 롤링 재시작: 마스터에 시그널을 보내면 처리 중인 요청을 마친 워커부터 교체합니다.
+    kill -HUP <master pid>            # 워커를 새로 띄우고 기존 워커는 SERVER_GRACEFUL_TIMEOUT 안에 정상 종료
+    kill -TTIN / -TTOU <master pid>   # 워커 1개 추가 / 감소
+  preload 상태에서는 HUP으로 코드가 다시 로드되지 않으므로, 코드 배포는 USR2(새 마스터 실행) 후 기존 마스터에 QUIT을 보냅니다.
+
+개발 중에는 기존처럼 `python -m app.main` (uvicorn --reload)을 사용합니다.
+"""
+import logging
+import os
+import tempfile
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+from app.core.config import settings
+
+class ProductionUvicornWorker(UvicornWorker):
+    # "auto"는 설치되어 있지 않으면 조용히 asyncio/h11로 바뀌므로 명시 (없으면 워커 시작 시 바로 실패)
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on", "server_header": False}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # UvicornWorker는 uvicorn 로그를 gunicorn 핸들러로 보내므로, 다시 Loguru(InterceptHandler)로 보냄
+        for name in ("uvicorn.error", "uvicorn.access"):
+            uvicorn_logger = logging.getLogger(name)
+            uvicorn_logger.handlers = []
+            uvicorn_logger.propagate = True
+
+def default_workers() -> int:
+    """컨테이너 CPU 제한(affinity)을 반영한 코어 수 (비동기 워커라 코어당 1개)"""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+def post_fork(server, worker):
+    # preload로 마스터에서 만든 커넥션 풀을 자식이 그대로 쓰지 않도록 비움 (소켓은 닫지 않고 참조만 버림)
+    from app.core.database import engine, task_engine
+
+    engine.sync_engine.dispose(close=False)
+    task_engine.sync_engine.dispose(close=False)
+
+def child_exit(server, worker):
+    # 종료된 워커의 메트릭 파일을 아카이브로 합침 (재시작/교체된 워커의 누적값은 유지)
+    from app.core.metrics import archive_dead_process
+
+    archive_dead_process(worker.pid)
+
+def prepare_metrics_dir(workers: int):
+    """멀티 프로세스 메트릭 디렉토리 준비 (앱 import 전에 호출해야 prometheus_client가 파일 기반 값을 사용)"""
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not path:
+        if workers < 2:
+            return
+        path = tempfile.mkdtemp(prefix="prometheus-api-", dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+    # prometheus_client는 import 시점의 환경 변수로 값 저장 방식을 정하므로 설정한 뒤에 import
+    from app.core.metrics import reset_multiprocess_dir
+
+    reset_multiprocess_dir(path)
+
+def build_options() -> dict:
+    return {
+        "bind": f"{settings.SERVER_HOST}:{settings.SERVER_PORT}",
+        "workers": settings.SERVER_WORKERS or default_workers(),
+        "worker_class": ProductionUvicornWorker,
+        "preload_app": True,
+        "backlog": settings.SERVER_BACKLOG,
+        # uvicorn의 timeout_keep_alive로 전달됨 (앞단 프록시의 upstream keepalive_timeout보다 길게)
+        "keepalive": settings.SERVER_KEEPALIVE,
+        "max_requests": settings.SERVER_MAX_REQUESTS,
+        "max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+        "timeout": settings.SERVER_TIMEOUT,
+        "graceful_timeout": settings.SERVER_GRACEFUL_TIMEOUT,
+        # 워커 heartbeat 파일을 메모리 파일시스템에 (컨테이너의 overlay 디스크 쓰기로 heartbeat가 밀리지 않도록)
+        "worker_tmp_dir": "/dev/shm" if os.path.isdir("/dev/shm") else None,
+        "post_fork": post_fork,
+        "child_exit": child_exit,
+    }
+
+class ApiServer(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            if value is not None:
+                self.cfg.set(key, value)
+
+    def load(self):
+        from app.main import app
+
+        return app
+
+def main():
+    options = build_options()
+    prepare_metrics_dir(options["workers"])
+    ApiServer(options).run()
+
+if __name__ == "__main__":
+    main()
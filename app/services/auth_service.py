@@ -9,12 +9,27 @@ from app.core.redis import redis_client
 
 # [Spring: AuthService]
 
+def is_active_user(user) -> bool:
+    """탈퇴(소프트 삭제, purge 대기 중)하거나 비활성화된 유저가 아닌지"""
+    return user.deleted_at is None and bool(user.is_active)
+
+def ensure_active_user(user):
+    """소셜 로그인용: 탈퇴/비활성 유저에게는 토큰과 세션을 발급하지 않음 (인증 실패와 같은 401)"""
+    if not is_active_user(user):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
 async def login(db: AsyncSession, form_data):
     # 1. 유저 확인
     user = await user_repository.get_user(db, email=form_data.username)
     
     # 2. 비밀번호 검증 (소셜 로그인 유저는 password가 None일 수 있음)
-    if not user or not user.password or not security.verify_password(form_data.password, user.password):
+    # 탈퇴/비활성 유저도 계정 존재 여부를 드러내지 않도록 같은 401
+    if not user or not user.password or not await security.verify_password(form_data.password, user.password) \
+            or not is_active_user(user):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -1,25 +1,60 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
-from app.repository import board_repository
+from app.repository import board_repository, comment_repository
 from app.schemas.board import BoardCreate, BoardUpdate, BoardResponse
 from app.services.file_service import FileService
-from app.core.redis import redis_client
-import json
+from app.core.redis import redis_client, redis_binary_client
+from app.core.compression import IDENTITY, PrecompressedResponse, encode_variants, negotiate_encoding
+from app.core.timing import span
+from app.core.config import settings
+from app.core import outbox
+from app.core.job_runner import job_runner
+from app.tasks.board_task import purge_board
+from app.tasks.image_task import generate_image_variants
 import math
 from app.schemas.page import PageResponse
 
+BOARD_LIST_CACHE_KEY = "boards_page_{page}_size_{size}"
+# 지금 캐시되어 있는 목록 키 모음 (무효화 시 키스페이스 전체를 SCAN 하지 않고 이 Set에 있는 키만 삭제)
+BOARD_LIST_CACHE_KEYS = "boards_page_keys"
+BOARD_LIST_CACHE_TTL = 60
+
+# Set의 키와 Set 자체를 한 번에 삭제 (삭제 도중 새로 채워진 키가 Set에서만 빠지는 경우가 없도록)
+INVALIDATE_LIST_CACHE_SCRIPT = """
+local keys = redis.call('SMEMBERS', KEYS[1])
+for i = 1, #keys, 500 do
+    redis.call('DEL', unpack(keys, i, math.min(i + 499, #keys)))
+end
+redis.call('DEL', KEYS[1])
+return #keys
+"""
+
+async def invalidate_board_list_cache():
+    # 목록 캐시는 page/size 조합별로 저장되므로, 채울 때 등록해 둔 키를 모두 제거
+    await redis_client.eval(INVALIDATE_LIST_CACHE_SCRIPT, 1, BOARD_LIST_CACHE_KEYS)
+
 async def create_new_board(db: AsyncSession, board: BoardCreate, user_id: str, image_url: str = None):
-    # 캐시 무효화 (새 글 작성 시 목록 캐시 제거)
-    await redis_client.delete("boards_page_1") # 단순 예시: 1페이지만 제거하거나 패턴 매칭으로 제거
-    return await board_repository.create_board(db=db, board=board, user_id=user_id, image_url=image_url)
+    # 썸네일/WebP 생성은 커밋 이후 Celery 워커에서 처리 (요청 경로에서는 이미지 처리 X)
+    if image_url:
+        await outbox.enqueue(db, generate_image_variants, image_url)
+    db_board = await board_repository.create_board(db=db, board=board, user_id=user_id, image_url=image_url)
+
+    # 캐시 무효화 (새 글 작성 시 목록 캐시 제거) - 커밋 이후 응답과 분리해서 실행
+    job_runner.submit(invalidate_board_list_cache)
+    return db_board
 
-async def get_boards_list(db: AsyncSession, page: int = 1, size: int = 10):
-    cache_key = f"boards_page_{page}_size_{size}"
+async def get_boards_list(db: AsyncSession, page: int = 1, size: int = 10, accept_encoding: str | None = None) -> PrecompressedResponse:
+    cache_key = BOARD_LIST_CACHE_KEY.format(page=page, size=size)
+    encoding = negotiate_encoding(accept_encoding)
     
-    # 1. 캐시 조회
-    cached_data = await redis_client.get(cache_key)
-    if cached_data:
-        return PageResponse(**json.loads(cached_data))
+    # 1. 캐시 조회 (인코딩별로 미리 압축해 둔 본문 중 필요한 것만 꺼내 그대로 응답 - 파싱/직렬화/압축 없음)
+    cached_body = await redis_binary_client.hget(cache_key, encoding)
+    if cached_body is None and encoding != IDENTITY:
+        # 작은 목록은 원본만 저장되어 있음
+        encoding = IDENTITY
+        cached_body = await redis_binary_client.hget(cache_key, encoding)
+    if cached_body is not None:
+        return PrecompressedResponse(cached_body, encoding)
 
     # 2. DB 조회 (캐시 Miss)
     skip = (page - 1) * size
@@ -30,7 +65,7 @@ async def get_boards_list(db: AsyncSession, page: int = 1, size: int = 10):
 
     items_data = [BoardResponse.model_validate(item) for item in db_items]
     
-    response = PageResponse(
+    response = PageResponse[BoardResponse](
         items=items_data,
         total_count=total_count,
         page=page,
@@ -38,11 +73,23 @@ async def get_boards_list(db: AsyncSession, page: int = 1, size: int = 10):
         total_pages=total_pages
     )
     
-    # 3. 캐시 저장 (TTL 60초)
-    # Pydantic 모델을 JSON으로 직렬화
-    await redis_client.set(cache_key, response.model_dump_json(), ex=60)
+    # 3. 캐시 저장 (TTL BOARD_LIST_CACHE_TTL초)
+    # JSON 직렬화 후 인코딩별(원본/gzip/br/zstd) 본문을 Hash 필드로 함께 저장
+    with span("render"):
+        body = response.model_dump_json().encode()
+    variants = await encode_variants(body)
+    async with redis_binary_client.pipeline() as pipe:
+        pipe.delete(cache_key)
+        pipe.hset(cache_key, mapping=variants)
+        pipe.expire(cache_key, BOARD_LIST_CACHE_TTL)
+        # 키 목록도 같은 TTL로 (쓰기가 없어도 만료된 키 이름이 계속 쌓이지 않도록)
+        pipe.sadd(BOARD_LIST_CACHE_KEYS, cache_key)
+        pipe.expire(BOARD_LIST_CACHE_KEYS, BOARD_LIST_CACHE_TTL)
+        await pipe.execute()
     
-    return response
+    if encoding not in variants:
+        encoding = IDENTITY
+    return PrecompressedResponse(variants[encoding], encoding)
 
 async def get_board_detail(db: AsyncSession, board_id: int):
     db_board = await board_repository.get_board(db, board_id=board_id)
@@ -60,10 +107,15 @@ async def update_existing_board(db: AsyncSession, board_id: int, board_update: B
     # 이미지 업데이트 시 기존 이미지 삭제
     if image_url:
         if db_board.image_url:
-            FileService.delete_file(db_board.image_url)
+            await FileService.delete_file(db, db_board.image_url)
         db_board.image_url = image_url
-        
-    return await board_repository.update_board(db=db, db_board=db_board, board_update=board_update)
+        db_board.image_variants = None
+        await outbox.enqueue(db, generate_image_variants, image_url)
+
+    db_board = await board_repository.update_board(db=db, db_board=db_board, board_update=board_update)
+    # 목록 캐시에도 제목/이미지가 들어 있으므로 함께 무효화
+    job_runner.submit(invalidate_board_list_cache)
+    return db_board
 
 async def delete_existing_board(db: AsyncSession, board_id: int, user_id: str):
     db_board = await get_board_detail(db, board_id)
@@ -74,7 +126,16 @@ async def delete_existing_board(db: AsyncSession, board_id: int, user_id: str):
     
     # 게시글 삭제 시 첨부 이미지도 삭제
     if db_board.image_url:
-        FileService.delete_file(db_board.image_url)
-        
-    await board_repository.delete_board(db=db, db_board=db_board)
+        await FileService.delete_file(db, db_board.image_url)
+
+    # 댓글이 적으면 DB의 ON DELETE CASCADE로 즉시 삭제,
+    # 많으면 즉시 숨김 처리 후 Celery가 배치 단위로 정리 (메모리/락 시간 제한)
+    comment_count = await comment_repository.count_comments_by_board(db, board_id=board_id)
+    if comment_count <= settings.BOARD_PURGE_INLINE_LIMIT:
+        await board_repository.delete_board(db=db, db_board=db_board)
+    else:
+        await outbox.enqueue(db, purge_board, board_id)
+        await board_repository.hide_board(db=db, db_board=db_board)
+
+    job_runner.submit(invalidate_board_list_cache)
     return {"message": "Board deleted successfully"}
\ No newline at end of file
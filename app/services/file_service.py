@@ -1,39 +1,307 @@
+import asyncio
+import hashlib
 import os
 import uuid
-from fastapi import UploadFile
+import weakref
+from fastapi import UploadFile, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
+from app.core.redis import redis_client
+from app.core.storage import get_storage, make_temp_path
+from app.repository import board_repository, stored_file_repository, user_repository
+
+# 허용 이미지 포맷의 시그니처 (확장자/Content-Type 위조 방지)
+IMAGE_SIGNATURES = (
+    b"\xff\xd8\xff",        # JPEG
+    b"\x89PNG\r\n\x1a\n",   # PNG
+    b"GIF87a",              # GIF
+    b"GIF89a",              # GIF
+)
+# 시그니처 검사에 필요한 앞부분 길이 (WEBP: RIFF????WEBP)
+SIGNATURE_LENGTH = 12
+
+# 업로드 파일 분류 (스토리지 key의 최상위 디렉토리)
+UPLOAD_CATEGORIES = ("boards", "profiles")
+
+# presigned 직접 업로드 파일이 저장되는 위치: {category}/direct/{uuid}{ext}
+DIRECT_UPLOAD_DIR = "direct"
+
+# 업로드한 사용자만 그 파일을 게시글 등에 첨부(acquire)할 수 있도록 (사용자, URL) 단위로 기록
+# presigned 발급 시(완료 API도 발급받은 사용자만 호출 가능)와 이어받기 업로드 완료 시 기록하며,
+# 참조되지 않은 파일이 GC로 지워지기 전까지(FILE_GC_GRACE_SECONDS) 유지
+UPLOAD_GRANT_KEY = "upload_grant:{user_id}:{file_url}"
+
+# 동시 디스크 쓰기 제한 (대용량 업로드가 몰려도 디스크 I/O와 스레드풀을 독점하지 않도록)
+# asyncio 객체는 처음 사용한 이벤트 루프에 묶이므로 import 시점이 아니라 실행 중인 루프마다 하나씩 생성
+_write_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+def _write_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _write_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _write_semaphores[loop] = asyncio.Semaphore(settings.UPLOAD_MAX_CONCURRENT_WRITES)
+    return semaphore
 
 class FileService:
     @staticmethod
-    async def save_file(file: UploadFile, sub_dir: str = "") -> str:
-        # 1. 파일 확장자 추출
-        file_ext = os.path.splitext(file.filename)[1]
-        
-        # 2. 고유한 파일명 생성 (UUID)
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
-        
-        # 3. 저장 경로 설정
-        upload_path = os.path.join(settings.UPLOAD_DIR, sub_dir)
-        if not os.path.exists(upload_path):
-            os.makedirs(upload_path, exist_ok=True)
-            
-        file_full_path = os.path.join(upload_path, unique_filename)
-        
-        # 4. 파일 저장
-        with open(file_full_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-            
-        # 5. 접근 가능한 URL 경로 반환
-        return f"/static/uploads/{sub_dir}/{unique_filename}".replace("//", "/")
-
-    @staticmethod
-    def delete_file(file_path: str):
-        if not file_path:
+    def _validate_extension(file_ext: str):
+        if file_ext.lower() not in settings.UPLOAD_ALLOWED_EXTENSIONS:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=f"허용되지 않는 파일 형식입니다. ({', '.join(sorted(settings.UPLOAD_ALLOWED_EXTENSIONS))})"
+            )
+
+    @staticmethod
+    def _validate_content_type(content_type: str | None):
+        if content_type and not content_type.startswith("image/"):
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="이미지 파일만 업로드할 수 있습니다."
+            )
+
+    @staticmethod
+    def _validate_signature(first_chunk: bytes):
+        is_webp = first_chunk[:4] == b"RIFF" and first_chunk[8:12] == b"WEBP"
+        if not is_webp and not first_chunk.startswith(IMAGE_SIGNATURES):
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="파일 내용이 이미지 형식이 아닙니다."
+            )
+
+    @staticmethod
+    def validate_upload(filename: str, content_type: str | None, size: int | None) -> str:
+        """파일을 받기 전에 알 수 있는 정보(확장자/타입/선언된 크기)로 검사하고 확장자를 반환"""
+        file_ext = os.path.splitext(filename or "")[1].lower()
+        FileService._validate_extension(file_ext)
+        FileService._validate_content_type(content_type)
+        if size is not None and size > settings.UPLOAD_MAX_SIZE:
+            raise FileService._too_large_exception()
+        return file_ext
+
+    @staticmethod
+    def _too_large_exception() -> HTTPException:
+        return HTTPException(
+            status_code=413,
+            detail=f"파일 크기는 최대 {settings.UPLOAD_MAX_SIZE // (1024 * 1024)}MB까지 허용됩니다."
+        )
+
+    @staticmethod
+    def _write_chunk(buffer, hasher, chunk: bytes):
+        # 디스크 쓰기와 해시 계산을 한 번의 스레드풀 호출로 처리
+        hasher.update(chunk)
+        buffer.write(chunk)
+
+    @staticmethod
+    def _store(key: str, temp_path: str):
+        # 같은 내용의 파일이 이미 있으면 다시 올리지 않음
+        storage = get_storage()
+        if storage.exists(key):
+            os.remove(temp_path)
+        else:
+            storage.save(key, temp_path)
+
+    @staticmethod
+    async def save_file(db: AsyncSession, file: UploadFile, sub_dir: str = "") -> str:
+        """
+        업로드 파일을 내용 해시(SHA-256) 기반 key로 저장하고 참조 수를 1 증가
+        (같은 내용의 파일은 한 번만 저장되며, URL은 내용이 바뀌지 않는 한 영구히 동일)
+        """
+        # 1. 파일 확장자 추출 및 형식 검사 (크기를 미리 알 수 있으면 복사 전에 바로 거절)
+        file_ext = FileService.validate_upload(file.filename, file.content_type, file.size)
+
+        # 2. 로컬 임시 파일로 스트리밍 (해시는 저장이 끝나야 알 수 있음)
+        # 업로드 크기와 관계없이 메모리에는 최대 UPLOAD_CHUNK_SIZE 만큼만 올라갑니다.
+        async with _write_semaphore():
+            temp_path = await run_in_threadpool(make_temp_path, ".part")
+            hasher = hashlib.sha256()
+            buffer = await run_in_threadpool(open, temp_path, "wb")
+            try:
+                total_size = 0
+                while chunk := await file.read(settings.UPLOAD_CHUNK_SIZE):
+                    if total_size == 0:
+                        FileService._validate_signature(chunk)
+                    total_size += len(chunk)
+                    if total_size > settings.UPLOAD_MAX_SIZE:
+                        raise FileService._too_large_exception()
+                    await run_in_threadpool(FileService._write_chunk, buffer, hasher, chunk)
+
+                if total_size == 0:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="빈 파일은 업로드할 수 없습니다.")
+            except BaseException:
+                await run_in_threadpool(buffer.close)
+                await run_in_threadpool(os.remove, temp_path)
+                raise
+            await run_in_threadpool(buffer.close)
+
+            # 3. 해시 기반 key 결정: {sub_dir}/{digest 앞 2자리}/{digest}{ext}
+            digest = hasher.hexdigest()
+            key = f"{sub_dir}/{digest[:2]}/{digest}{file_ext}".lstrip("/")
+            file_url = get_storage().url(key)
+
+            # 4. 참조 수 증가를 먼저 실행 (행 잠금으로 GC와의 경쟁 방지) 후 스토리지에 배치
+            await stored_file_repository.increment_ref_count(db, url=file_url, digest=digest, size=total_size)
+            try:
+                await run_in_threadpool(FileService._store, key, temp_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    await run_in_threadpool(os.remove, temp_path)
+                raise
+
+        # 5. 접근 가능한 URL 반환
+        return file_url
+
+    @staticmethod
+    def _hash_file(path: str) -> tuple[str, int, bytes]:
+        # 청크 단위로 읽어 (digest, 크기, 첫 청크) 반환 - 파일 전체를 메모리에 올리지 않음
+        hasher = hashlib.sha256()
+        total_size = 0
+        first_chunk = b""
+        with open(path, "rb") as f:
+            while chunk := f.read(settings.UPLOAD_CHUNK_SIZE):
+                if total_size == 0:
+                    first_chunk = chunk
+                hasher.update(chunk)
+                total_size += len(chunk)
+        return hasher.hexdigest(), total_size, first_chunk
+
+    @staticmethod
+    async def save_temp_file(db: AsyncSession, temp_path: str, file_ext: str, sub_dir: str = "") -> str:
+        """
+        로컬 임시 파일로 모인 업로드(이어받기 업로드 등)를 해시 기반 key로 저장
+        (presigned 업로드와 같이 참조 수 0으로 기록되며, 게시글 등에서 사용할 때 증가)
+        """
+        FileService._validate_extension(file_ext)
+        digest, total_size, first_chunk = await run_in_threadpool(FileService._hash_file, temp_path)
+        if total_size == 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="빈 파일은 업로드할 수 없습니다.")
+        if total_size > settings.UPLOAD_MAX_SIZE:
+            raise FileService._too_large_exception()
+        FileService._validate_signature(first_chunk)
+
+        key = f"{sub_dir}/{digest[:2]}/{digest}{file_ext}".lstrip("/")
+        file_url = get_storage().url(key)
+
+        # save_file과 같은 순서: 행을 먼저 기록(잠금)한 뒤 스토리지에 배치하고 커밋
+        await stored_file_repository.register_stored_file(db, url=file_url, digest=digest, size=total_size)
+        await run_in_threadpool(FileService._store, key, temp_path)
+        await db.commit()
+        return file_url
+
+    @staticmethod
+    async def grant_upload(user_id: str, file_url: str):
+        """user_id가 업로드한 파일로 기록 (acquire 허용)"""
+        key = UPLOAD_GRANT_KEY.format(user_id=user_id, file_url=file_url)
+        await redis_client.set(key, 1, ex=settings.FILE_GC_GRACE_SECONDS)
+
+    @staticmethod
+    async def create_presigned_upload(user_id: str, filename: str, content_type: str, size: int, category: str) -> dict:
+        """
+        클라이언트가 스토리지에 직접 업로드할 수 있는 presigned 요청 생성
+        (파일 바이트가 API 서버를 거치지 않음)
+        """
+        file_ext = FileService.validate_upload(filename, content_type, size)
+
+        storage = get_storage()
+        key = f"{category}/{DIRECT_UPLOAD_DIR}/{uuid.uuid4()}{file_ext}"
+        try:
+            presigned = storage.presign_upload(key, content_type=content_type, max_size=settings.UPLOAD_MAX_SIZE)
+        except NotImplementedError:
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="현재 스토리지 설정에서는 직접 업로드를 지원하지 않습니다."
+            )
+
+        file_url = storage.url(key)
+        await FileService.grant_upload(user_id, file_url)
+        return {"key": key, "upload_url": presigned["url"], "fields": presigned["fields"], "file_url": file_url}
+
+    @staticmethod
+    async def complete_presigned_upload(db: AsyncSession, key: str, user_id: str) -> str:
+        """직접 업로드가 끝난 객체를 검증하고 파일 메타데이터만 기록 (참조 수 0, 게시글 등에서 사용 시 증가)"""
+        category, _, rest = key.partition("/")
+        if category not in UPLOAD_CATEGORIES or not rest.startswith(f"{DIRECT_UPLOAD_DIR}/") or ".." in key:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 업로드 key입니다.")
+
+        storage = get_storage()
+        file_url = storage.url(key)
+        # 다른 사용자에게 발급된 key도 존재 여부를 드러내지 않도록 404
+        grant_key = UPLOAD_GRANT_KEY.format(user_id=user_id, file_url=file_url)
+        size = await run_in_threadpool(storage.size, key) if await redis_client.exists(grant_key) else None
+        if size is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업로드된 파일을 찾을 수 없습니다.")
+        if size > settings.UPLOAD_MAX_SIZE:
+            await run_in_threadpool(storage.delete, key)
+            raise FileService._too_large_exception()
+
+        # 서버를 거치지 않은 파일이므로 save_file과 같은 기준으로 내용을 검사 (확장자/Content-Type만 맞춘 위조 파일 거절)
+        # Content-Type은 presigned 조건으로 발급 시 검사한 값과 같아야만 업로드되므로 여기서는 확장자와 시그니처만 확인
+        head = await run_in_threadpool(storage.read_head, key, SIGNATURE_LENGTH)
+        try:
+            FileService._validate_extension(os.path.splitext(key)[1])
+            FileService._validate_signature(head or b"")
+        except HTTPException as e:
+            await run_in_threadpool(storage.delete, key)
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.detail) from None
+
+        if await stored_file_repository.get_stored_file(db, url=file_url) is None:
+            await stored_file_repository.create_stored_file(db, url=file_url, size=size)
+        # 완료 시점부터 GC 유예 시간 동안 첨부 가능
+        await FileService.grant_upload(user_id, file_url)
+        return file_url
+
+    @staticmethod
+    async def acquire(db: AsyncSession, file_url: str, user_id: str):
+        """
+        user_id가 직접/이어받기 업로드로 올린 파일을 참조 (커밋은 호출한 서비스의 트랜잭션에서 함께 처리)
+        공개 URL만 알면 다른 사용자의 파일도 첨부할 수 있지 않도록 업로드 기록이 있는 파일만 허용
+        """
+        if not await redis_client.exists(UPLOAD_GRANT_KEY.format(user_id=user_id, file_url=file_url)):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="직접 업로드한 파일만 첨부할 수 있습니다.")
+        updated = await stored_file_repository.increment_existing_ref_count(db, url=file_url)
+        if updated == 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="업로드가 완료되지 않은 파일입니다.")
+
+    @staticmethod
+    def url_to_key(file_url: str) -> str | None:
+        # 공개 URL -> 스토리지 key (이 서비스가 저장한 파일이 아니면 None, 예: 소셜 프로필 이미지)
+        return get_storage().key_from_url(file_url)
+
+    @staticmethod
+    def remove_from_storage(file_url: str):
+        """원본과 파생 이미지(썸네일 등, {이름}_xxx 형식)를 스토리지에서 삭제"""
+        key = FileService.url_to_key(file_url)
+        if key is None:
             return
-            
-        # URL 경로를 실제 파일 시스템 경로로 변환
-        # 예: /static/uploads/profiles/xxx.jpg -> static/uploads/profiles/xxx.jpg
-        actual_path = file_path.lstrip("/")
-        if os.path.exists(actual_path):
-            os.remove(actual_path)
+
+        storage = get_storage()
+        storage.delete(key)
+        stem = os.path.splitext(key)[0]
+        for variant_key in list(storage.list_keys(prefix=f"{stem}_")):
+            storage.delete(variant_key)
+
+    @staticmethod
+    async def delete_file(db: AsyncSession, file_path: str):
+        """
+        참조 수를 1 감소 (커밋은 호출한 서비스의 트랜잭션에서 함께 처리)
+        실제 파일은 커밋 이후 GC 태스크가 삭제하므로 요청 경로에서는 스토리지 I/O가 없습니다.
+        (트랜잭션이 롤백되면 참조 수도 그대로 유지되어 파일이 잘못 지워지지 않음)
+        """
+        key = FileService.url_to_key(file_path)
+        if key is None:
+            return
+
+        updated = await stored_file_repository.decrement_ref_count(db, url=file_path)
+        if updated == 0 and await stored_file_repository.get_stored_file(db, url=file_path) is None:
+            # 해시 기반 저장 이전에 업로드된 파일: 참조 수 0으로 등록해 GC 대상에 편입
+            size = await run_in_threadpool(get_storage().size, key)
+            await stored_file_repository.register_stored_file(db, url=file_path, digest=None, size=size or 0)
+
+    @staticmethod
+    async def get_referenced_urls(db: AsyncSession, file_urls: list[str]) -> set[str]:
+        """게시글/프로필 이미지 또는 파일 메타데이터(stored_files)에 기록된 URL"""
+        return (
+            await board_repository.get_referenced_image_urls(db, file_urls)
+            | await user_repository.get_referenced_profile_image_urls(db, file_urls)
+            | await stored_file_repository.get_existing_urls(db, file_urls)
+        )
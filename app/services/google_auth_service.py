@@ -8,6 +8,8 @@ from app.core import security
 from app.repository import user_repository
 from app.models.user import User
 from app.core.redis import redis_client
+from app.core.deadline import with_deadline
+from app.services.auth_service import ensure_active_user
 
 # [Spring: GoogleAuthService]
 
@@ -33,7 +35,7 @@ async def authenticate_google_user(db: AsyncSession, code: str):
     
     # 1. Authorization Code -> Access Token 교환
     async with httpx.AsyncClient() as client:
-        token_response = await client.post(
+        token_response = await with_deadline(client.post(
             GOOGLE_TOKEN_URL,
             data={
                 "client_id": settings.GOOGLE_CLIENT_ID,
@@ -42,7 +44,7 @@ async def authenticate_google_user(db: AsyncSession, code: str):
                 "grant_type": "authorization_code",
                 "redirect_uri": settings.GOOGLE_REDIRECT_URI,
             },
-        )
+        ))
         
         if token_response.status_code != 200:
             raise HTTPException(
@@ -54,10 +56,10 @@ async def authenticate_google_user(db: AsyncSession, code: str):
         access_token = token_data.get("access_token")
         
         # 2. Access Token -> 유저 정보(Email, Name 등) 가져오기
-        userinfo_response = await client.get(
+        userinfo_response = await with_deadline(client.get(
             GOOGLE_USERINFO_URL,
             headers={"Authorization": f"Bearer {access_token}"}
-        )
+        ))
         
         if userinfo_response.status_code != 200:
             raise HTTPException(
@@ -91,6 +93,8 @@ async def authenticate_google_user(db: AsyncSession, code: str):
             )
             user = await user_repository.create_user(db, new_user)
         else:
+            # 탈퇴(purge 대기 중)/비활성 유저는 정보를 갱신하거나 토큰을 발급하지 않음
+            ensure_active_user(user)
             # 기존 유저라면 정보 업데이트 (선택 사항)
             user.provider = "google"
             user.social_id = user_info.get("sub")
@@ -0,0 +1,63 @@
+import os
+from PIL import Image, ImageOps
+from app.core.config import settings
+from app.core.storage import get_storage, make_temp_path
+from app.services.file_service import FileService
+
+class ImageService:
+    """
+    업로드된 원본 이미지로부터 목록/상세 화면용 파생 이미지를 생성
+    (CPU를 많이 쓰는 작업이므로 요청 처리 경로가 아닌 Celery 워커에서만 호출합니다.)
+    """
+
+    @staticmethod
+    def variant_specs() -> dict[str, tuple[int, str | None]]:
+        # 이름 -> (긴 변 최대 크기, 저장 포맷 / None이면 원본 포맷 유지)
+        return {
+            "thumbnail": (settings.IMAGE_THUMBNAIL_SIZE, None),
+            "medium": (settings.IMAGE_MEDIUM_SIZE, None),
+            "webp": (settings.IMAGE_MEDIUM_SIZE, "WEBP"),
+        }
+
+    @staticmethod
+    def _save(image: Image.Image, path: str, image_format: str):
+        options = {"optimize": True}
+        if image_format in ("JPEG", "WEBP"):
+            options["quality"] = settings.IMAGE_QUALITY
+        if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(path, format=image_format, **options)
+
+    @staticmethod
+    def generate_variants(image_url: str) -> dict[str, str]:
+        """원본 옆에 {이름}_{variant}.{ext} 파일을 만들고 variant 이름 -> URL 매핑을 반환"""
+        storage = get_storage()
+        key = FileService.url_to_key(image_url)
+        if key is None or not storage.exists(key):
+            return {}
+
+        key_stem, original_ext = os.path.splitext(key)
+        variants = {}
+
+        with storage.local_copy(key) as original_path, Image.open(original_path) as original:
+            original_format = original.format
+            # EXIF 회전 정보를 픽셀에 반영 (축소 이미지가 눕혀지는 문제 방지)
+            source = ImageOps.exif_transpose(original)
+
+            for name, (max_size, image_format) in ImageService.variant_specs().items():
+                image_format = image_format or original_format
+                ext = ".webp" if image_format == "WEBP" else original_ext
+
+                variant_key = f"{key_stem}_{name}{ext}"
+                variants[name] = storage.url(variant_key)
+                # 같은 내용의 원본은 같은 key에 저장되므로, 이미 만든 파생본은 재사용
+                if storage.exists(variant_key):
+                    continue
+
+                resized = source.copy()
+                resized.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+                temp_path = make_temp_path(ext)
+                ImageService._save(resized, temp_path, image_format)
+                storage.save(variant_key, temp_path)
+
+        return variants
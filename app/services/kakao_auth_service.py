@@ -8,6 +8,8 @@ from app.core import security
 from app.repository import user_repository
 from app.models.user import User
 from app.core.redis import redis_client
+from app.core.deadline import with_deadline
+from app.services.auth_service import ensure_active_user
 
 # [Spring: KakaoAuthService]
 
@@ -30,7 +32,7 @@ async def authenticate_kakao_user(db: AsyncSession, code: str):
     
     # 1. Authorization Code -> Access Token 교환
     async with httpx.AsyncClient() as client:
-        token_response = await client.post(
+        token_response = await with_deadline(client.post(
             KAKAO_TOKEN_URL,
             data={
                 "grant_type": "authorization_code",
@@ -40,7 +42,7 @@ async def authenticate_kakao_user(db: AsyncSession, code: str):
                 "code": code,
             },
             headers={"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"}
-        )
+        ))
         
         if token_response.status_code != 200:
             raise HTTPException(
@@ -52,13 +54,13 @@ async def authenticate_kakao_user(db: AsyncSession, code: str):
         access_token = token_data.get("access_token")
         
         # 2. Access Token -> 유저 정보 가져오기
-        userinfo_response = await client.get(
+        userinfo_response = await with_deadline(client.get(
             KAKAO_USERINFO_URL,
             headers={
                 "Authorization": f"Bearer {access_token}",
                 "Content-Type": "application/x-www-form-urlencoded;charset=utf-8"
             }
-        )
+        ))
         
         if userinfo_response.status_code != 200:
             raise HTTPException(
@@ -92,6 +94,8 @@ async def authenticate_kakao_user(db: AsyncSession, code: str):
             )
             user = await user_repository.create_user(db, new_user)
         else:
+            # 탈퇴(purge 대기 중)/비활성 유저는 정보를 갱신하거나 토큰을 발급하지 않음
+            ensure_active_user(user)
             # 기존 유저 정보 업데이트
             user.provider = "kakao"
             user.social_id = str(user_info.get("id"))
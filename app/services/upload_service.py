@@ -0,0 +1,205 @@
+import os
+import time
+import uuid
+from typing import AsyncIterator
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.core.storage import get_temp_dir
+from app.services.file_service import FileService
+
+# [참고] 이어받기(Resumable) 업로드
+# 1. POST   /uploads/sessions                   -> upload_id 발급
+# 2. PUT    /uploads/sessions/{id}?offset=N      -> 청크를 임시 파일의 N 위치부터 기록 (연결이 끊겨도 받은 만큼은 유지)
+# 3. GET    /uploads/sessions/{id}               -> 현재 offset 조회 후 끊긴 지점부터 재전송
+# 4. POST   /uploads/sessions/{id}/complete      -> FileService로 최종 저장
+# 세션 상태는 Redis Hash(TTL)에, 데이터는 UPLOAD_DIR/.tmp 에 저장합니다.
+# (API 서버가 여러 대라면 UPLOAD_DIR이 공유 볼륨이어야 합니다.)
+
+UPLOAD_SESSION_KEY = "upload_session:{upload_id}"
+UPLOAD_SESSION_LOCK_KEY = "upload_session_lock:{upload_id}"
+UPLOAD_SESSION_LOCK_SECONDS = 60
+# 청크를 받는 동안 이 간격마다 잠금 TTL 연장 (느린 업로드가 TTL을 넘겨 다른 요청과 겹쳐 쓰지 않도록)
+UPLOAD_SESSION_LOCK_EXTEND_INTERVAL = UPLOAD_SESSION_LOCK_SECONDS / 3
+
+# 세션이 남아 있고 잠금을 가진 요청일 때만 offset 갱신
+# (기록 중에 취소/완료된 세션을 offset만 있는 Hash로 되살리거나, 잠금을 잃은 뒤 다른 요청의 offset을 덮어쓰지 않도록)
+# 반환값: 1 = 갱신, 0 = 세션 없음, -1 = 잠금을 잃음
+SET_OFFSET_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+if redis.call('GET', KEYS[2]) ~= ARGV[3] then
+    return -1
+end
+redis.call('HSET', KEYS[1], 'offset', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+# 잠금 해제/연장은 자신이 건 잠금(같은 토큰)일 때만 (TTL이 지나 다른 요청이 얻은 잠금을 지우지 않도록)
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+EXTEND_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+def session_temp_path(upload_id: str) -> str:
+    return os.path.join(get_temp_dir(), f"session_{upload_id}.part")
+
+def _touch(path: str):
+    open(path, "wb").close()
+
+def _session_response(upload_id: str, session: dict) -> dict:
+    return {
+        "upload_id": upload_id,
+        "offset": int(session["offset"]),
+        "size": int(session["size"]),
+        "chunk_size": settings.UPLOAD_SESSION_CHUNK_SIZE,
+        "expires_in": settings.UPLOAD_SESSION_TTL_SECONDS,
+    }
+
+def _session_not_found() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업로드 세션을 찾을 수 없습니다.")
+
+def _lock_lost() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="업로드 세션 잠금이 만료되었습니다. 현재 offset을 조회한 뒤 다시 시도하세요."
+    )
+
+async def _get_session(upload_id: str, user_id: str) -> dict:
+    session = await redis_client.hgetall(UPLOAD_SESSION_KEY.format(upload_id=upload_id))
+    # 다른 사용자의 세션도 존재 여부를 드러내지 않도록 404
+    if not session or session.get("user_id") != user_id:
+        raise _session_not_found()
+    return session
+
+class _SessionLock:
+    """[Context Manager] 같은 세션에 대한 청크 업로드/완료 요청의 동시 실행 방지"""
+
+    def __init__(self, upload_id: str):
+        self.key = UPLOAD_SESSION_LOCK_KEY.format(upload_id=upload_id)
+        # 잠금 소유자 식별용 (해제/연장 시 비교)
+        self.token = uuid.uuid4().hex
+        self.extended_at = 0.0
+
+    async def __aenter__(self):
+        if not await redis_client.set(self.key, self.token, nx=True, ex=UPLOAD_SESSION_LOCK_SECONDS):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="같은 업로드 세션의 다른 요청이 처리 중입니다.")
+        self.extended_at = time.monotonic()
+        return self
+
+    async def keep_alive(self):
+        """마지막 연장 후 UPLOAD_SESSION_LOCK_EXTEND_INTERVAL이 지났으면 TTL 연장 (이미 잠금을 잃었으면 409)"""
+        if time.monotonic() - self.extended_at < UPLOAD_SESSION_LOCK_EXTEND_INTERVAL:
+            return
+        if not await redis_client.eval(EXTEND_LOCK_SCRIPT, 1, self.key, self.token, UPLOAD_SESSION_LOCK_SECONDS):
+            raise _lock_lost()
+        self.extended_at = time.monotonic()
+
+    async def __aexit__(self, *exc_info):
+        await redis_client.eval(RELEASE_LOCK_SCRIPT, 1, self.key, self.token)
+
+async def create_upload_session(user_id: str, filename: str, content_type: str, size: int, category: str) -> dict:
+    file_ext = FileService.validate_upload(filename, content_type, size)
+
+    upload_id = uuid.uuid4().hex
+    await run_in_threadpool(_touch, session_temp_path(upload_id))
+
+    session = {"user_id": user_id, "file_ext": file_ext, "category": category, "size": size, "offset": 0}
+    key = UPLOAD_SESSION_KEY.format(upload_id=upload_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping=session)
+        pipe.expire(key, settings.UPLOAD_SESSION_TTL_SECONDS)
+        await pipe.execute()
+    return _session_response(upload_id, session)
+
+async def get_upload_session(upload_id: str, user_id: str) -> dict:
+    session = await _get_session(upload_id, user_id)
+    return _session_response(upload_id, session)
+
+async def upload_chunk(upload_id: str, user_id: str, offset: int, chunks: AsyncIterator[bytes]) -> dict:
+    """offset 위치부터 요청 본문을 스트리밍으로 기록 (메모리에는 수신 청크 단위로만 올라감)"""
+    async with _SessionLock(upload_id) as lock:
+        # 잠금을 얻은 뒤에 읽어야 직전 요청이 기록한 offset을 봄
+        session = await _get_session(upload_id, user_id)
+        current_offset = int(session["offset"])
+        size = int(session["size"])
+        if offset != current_offset:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"offset이 일치하지 않습니다. (현재 offset: {current_offset})"
+            )
+
+        written = 0
+        # 기록된 offset 이후의 데이터(이전 요청이 기록 도중 중단된 잔여분)는 버리고 이어서 씀
+        try:
+            buffer = await run_in_threadpool(open, session_temp_path(upload_id), "r+b")
+        except FileNotFoundError:
+            # 세션을 읽은 직후 취소됨 (취소는 잠금 없이 실행)
+            raise _session_not_found() from None
+        try:
+            await run_in_threadpool(buffer.truncate, offset)
+            await run_in_threadpool(buffer.seek, offset)
+            async for chunk in chunks:
+                if offset + written + len(chunk) > size:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="선언한 파일 크기를 초과했습니다.")
+                # 청크 사이에 클라이언트가 오래 멈췄다면 기록 전에 잠금을 아직 가지고 있는지 확인
+                await lock.keep_alive()
+                await run_in_threadpool(buffer.write, chunk)
+                written += len(chunk)
+        finally:
+            # 연결이 끊기거나 오류가 나도 실제로 받은 만큼은 offset에 반영 (다음 요청은 그 지점부터)
+            await run_in_threadpool(buffer.close)
+            key = UPLOAD_SESSION_KEY.format(upload_id=upload_id)
+            updated = await redis_client.eval(
+                SET_OFFSET_SCRIPT, 2, key, lock.key, offset + written, settings.UPLOAD_SESSION_TTL_SECONDS, lock.token
+            )
+            if updated == 0:
+                # 기록 중에 세션이 취소됨
+                raise _session_not_found()
+            if updated < 0:
+                raise _lock_lost()
+
+    session["offset"] = offset + written
+    return _session_response(upload_id, session)
+
+async def complete_upload_session(db: AsyncSession, upload_id: str, user_id: str) -> str:
+    async with _SessionLock(upload_id):
+        session = await _get_session(upload_id, user_id)
+        if int(session["offset"]) != int(session["size"]):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"아직 업로드가 끝나지 않았습니다. (현재 offset: {session['offset']} / {session['size']})"
+            )
+
+        temp_path = session_temp_path(upload_id)
+        try:
+            file_url = await FileService.save_temp_file(db, temp_path, session["file_ext"], sub_dir=session["category"])
+        except HTTPException:
+            # 내용 검증 실패 시 세션도 함께 폐기 (같은 데이터로 재시도해도 결과가 같음)
+            await cancel_upload_session(upload_id, user_id)
+            raise
+
+        await redis_client.delete(UPLOAD_SESSION_KEY.format(upload_id=upload_id))
+    # 업로드한 사용자만 게시글 등에 첨부할 수 있음
+    await FileService.grant_upload(user_id, file_url)
+    return file_url
+
+async def cancel_upload_session(upload_id: str, user_id: str):
+    await _get_session(upload_id, user_id)
+    await redis_client.delete(UPLOAD_SESSION_KEY.format(upload_id=upload_id))
+    temp_path = session_temp_path(upload_id)
+    if os.path.exists(temp_path):
+        await run_in_threadpool(os.remove, temp_path)
@@ -4,6 +4,11 @@ from fastapi import HTTPException
 from app.repository import user_repository
 from app.schemas.user import UserCreate, UserUpdate
 from app.tasks.email_task import send_welcome_email
+from app.tasks.user_task import purge_user
+from app.tasks.image_task import generate_image_variants
+from app.core.redis import redis_client
+from app.core import outbox
+from app.services.file_service import FileService
 
 # [Spring: @Service]
 
@@ -12,16 +17,14 @@ async def create_user(db: AsyncSession, user: UserCreate):
     if db_user:
         raise HTTPException(status_code=400, detail="이미 존재하는 이메일 계정입니다.")
     
-    new_user = await user_repository.create_user(db=db, user=user)
-    
-    # 회원가입 성공 시 웰컴 이메일 발송 (비동기 Task)
-    send_welcome_email.delay(new_user.email)
-    
-    return new_user
+    # 회원가입 성공(커밋) 시 웰컴 이메일 발송 (비동기 Task)
+    await outbox.enqueue(db, send_welcome_email, user.email)
+    return await user_repository.create_user(db=db, user=user)
 
 async def get_user(db: AsyncSession, email: str):
     db_user = await user_repository.get_user(db, email=email)
-    if db_user is None:
+    # 탈퇴 처리(소프트 삭제)된 유저는 purge 완료 전까지 존재하지 않는 것으로 취급
+    if db_user is None or db_user.deleted_at is not None:
         raise HTTPException(status_code=404, detail="해당 Email의 유저가 존재하지 않습니다.")
     return db_user
 
@@ -41,14 +44,27 @@ async def delete_user(db: AsyncSession, email: str):
     # 1. 삭제할 유저가 존재하는지 확인
     db_user = await get_user(db, email) # 없으면 여기서 404 발생
     
-    # 2. 삭제 수행
-    await user_repository.delete_user(db=db, db_user=db_user)
+    # 2. 게시글/댓글/업로드 파일은 Celery가 배치 단위로 정리 (긴 트랜잭션/락 경합 방지)
+    await outbox.enqueue(db, purge_user, email)
+
+    # 3. 소프트 삭제 (즉시 비활성화) 후 세션 만료
+    await user_repository.soft_delete_user(db=db, db_user=db_user)
+    await redis_client.delete(f"session:{email}")
     return {"유저 삭제 완료.": db_user}
 
 # 프로필 이미지 업데이트
 async def update_profile_image(db: AsyncSession, email: str, image_url: str):
     db_user = await get_user(db, email)
+
+    # 기존 이미지 참조 해제 (같은 트랜잭션에서 커밋)
+    if db_user.profile_image_url:
+        await FileService.delete_file(db, db_user.profile_image_url)
+
     db_user.profile_image_url = image_url
+    db_user.profile_image_variants = None
+
+    # 썸네일/WebP 생성은 커밋 이후 Celery 워커에서 처리
+    await outbox.enqueue(db, generate_image_variants, image_url)
     await db.commit()
     await db.refresh(db_user)
     return db_user
\ No newline at end of file
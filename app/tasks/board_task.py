@@ -0,0 +1,34 @@
+import asyncio
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import TaskSessionLocal
+from app.core.logger import logger
+from app.repository import board_repository, comment_repository
+
+async def purge_board_comments(db, board_id: int) -> int:
+    """게시글의 댓글을 PURGE_BATCH_SIZE 단위로 나눠 삭제 (메모리/트랜잭션 크기 고정)"""
+    total_deleted = 0
+    while True:
+        deleted = await comment_repository.delete_comments_batch(
+            db, limit=settings.PURGE_BATCH_SIZE, board_id=board_id
+        )
+        total_deleted += deleted
+        if deleted < settings.PURGE_BATCH_SIZE:
+            return total_deleted
+
+        # 다른 트랜잭션이 comments 테이블 락을 잡을 수 있도록 잠시 양보
+        await asyncio.sleep(settings.PURGE_BATCH_INTERVAL)
+
+async def _purge_board(board_id: int) -> int:
+    async with TaskSessionLocal() as db:
+        total_deleted = await purge_board_comments(db, board_id)
+        await board_repository.delete_board_by_id(db, board_id)
+    return total_deleted
+
+@celery_app.task(acks_late=True)
+def purge_board(board_id: int):
+    """숨김 처리된 게시글과 대량의 댓글을 배치 단위로 영구 삭제"""
+    logger.info(f"🧹 Purging board {board_id}...")
+    total_deleted = asyncio.run(_purge_board(board_id))
+    logger.info(f"✅ Board {board_id} purged ({total_deleted} comments removed)")
+    return total_deleted
@@ -1,16 +1,27 @@
 import smtplib
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from app.core.celery_app import celery_app
-from app.core.logger import setup_logger
 from app.core.config import settings
+from app.core.logger import logger
+from app.core.mailer import smtp_connection
 
-logger = setup_logger()
+def _is_deliverable(email_to: str) -> bool:
+    # 유효하지 않은 도메인 필터링 (testuser@example.com 등)
+    return not ("@example.com" in email_to or email_to.endswith(".test"))
+
+def build_message(email_to: str, subject: str, body: str) -> MIMEMultipart:
+    msg = MIMEMultipart()
+    msg['From'] = settings.SMTP_USER
+    msg['To'] = email_to
+    msg['Subject'] = subject
+    msg.attach(MIMEText(body, 'plain'))
+    return msg
 
 @celery_app.task
 def send_welcome_email(email_to: str):
-    # 유효하지 않은 도메인 필터링 (testuser@example.com 등)
-    if "@example.com" in email_to or email_to.endswith(".test"):
+    if not _is_deliverable(email_to):
         logger.warning(f"⚠️ Skipping email send for invalid domain: {email_to}")
         return f"Skipped: Invalid domain {email_to}"
 
@@ -19,26 +30,43 @@ def send_welcome_email(email_to: str):
     subject = "Welcome to FastAPI MariaDB App!"
     body = f"Hello {email_to},\n\nWelcome to our service! We are glad to have you."
     
-    msg = MIMEMultipart()
-    msg['From'] = settings.SMTP_USER
-    msg['To'] = email_to
-    msg['Subject'] = subject
-    msg.attach(MIMEText(body, 'plain'))
-    
     try:
-        if settings.SMTP_SSL:
-            server = smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT)
-        else:
-            server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
-            if settings.SMTP_TLS:
-                server.starttls()
-        
-        server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-        server.send_message(msg)
-        server.quit()
+        # 워커 프로세스가 유지하는 SMTP 연결 재사용 (매번 연결/TLS/로그인 X)
+        smtp_connection.send(build_message(email_to, subject, body))
         logger.info(f"✅ Email sent to {email_to} successfully!")
         return f"Email sent to {email_to}"
     except Exception as e:
         logger.error(f"❌ Failed to send email to {email_to}: {e}")
         return f"Failed to send email: {e}"
 
+@celery_app.task
+def send_bulk_email(recipients: list[str], subject: str, body: str):
+    """
+    여러 명에게 같은 메일을 하나의 SMTP 세션으로 발송
+    (SMTP_MAX_MESSAGES_PER_SECOND로 발송 속도를 제한해 메일 서버의 rate limit/스팸 판정 회피)
+    """
+    interval = 1 / settings.SMTP_MAX_MESSAGES_PER_SECOND if settings.SMTP_MAX_MESSAGES_PER_SECOND > 0 else 0
+    stats = {"sent": 0, "skipped": 0, "failed": 0}
+    next_send_at = time.monotonic()
+
+    for email_to in recipients:
+        if not _is_deliverable(email_to):
+            stats["skipped"] += 1
+            continue
+
+        # 일정한 간격으로 발송 (앞선 발송이 오래 걸렸다면 기다리지 않음)
+        wait = next_send_at - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        next_send_at = max(next_send_at, time.monotonic()) + interval
+
+        try:
+            smtp_connection.send(build_message(email_to, subject, body))
+            stats["sent"] += 1
+        except (smtplib.SMTPException, OSError) as e:
+            # 한 명의 실패(수신 거부 등)로 나머지 발송이 중단되지 않도록 기록만
+            logger.error(f"❌ Failed to send email to {email_to}: {e}")
+            stats["failed"] += 1
+
+    logger.info(f"📧 Bulk email finished: {stats}")
+    return stats
@@ -0,0 +1,138 @@
+import asyncio
+import os
+import time
+from itertools import islice
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import TaskSessionLocal
+from app.core.logger import logger
+from app.core.storage import get_storage, get_temp_dir
+from app.repository import stored_file_repository
+from app.services.file_service import FileService
+from app.services.image_service import ImageService
+
+async def reclaim_unreferenced_files_batch(db) -> int:
+    """참조 수가 0이고 유예 시간이 지난 파일을 한 배치만큼 디스크와 DB에서 삭제"""
+    stored_files = await stored_file_repository.get_unreferenced_files_for_update(
+        db, grace_seconds=settings.FILE_GC_GRACE_SECONDS, limit=settings.PURGE_BATCH_SIZE
+    )
+    if not stored_files:
+        await db.rollback()
+        return 0
+
+    # 행 잠금을 잡은 상태에서 파일을 먼저 지우고 커밋
+    # (동시에 같은 파일을 업로드하는 요청은 잠금 해제 후 새 행을 만들고 파일을 다시 배치합니다.)
+    for stored_file in stored_files:
+        FileService.remove_from_storage(stored_file.url)
+    await stored_file_repository.delete_stored_files_by_ids(db, [stored_file.id for stored_file in stored_files])
+    return len(stored_files)
+
+async def _reclaim_unreferenced_files() -> int:
+    total_reclaimed = 0
+    async with TaskSessionLocal() as db:
+        while True:
+            reclaimed = await reclaim_unreferenced_files_batch(db)
+            total_reclaimed += reclaimed
+            if reclaimed < settings.PURGE_BATCH_SIZE:
+                return total_reclaimed
+            await asyncio.sleep(settings.PURGE_BATCH_INTERVAL)
+
+@celery_app.task
+def reclaim_unreferenced_files():
+    """[주기 작업] 더 이상 참조되지 않는 업로드 파일 정리"""
+    total_reclaimed = asyncio.run(_reclaim_unreferenced_files())
+    if total_reclaimed:
+        logger.info(f"🧹 Reclaimed {total_reclaimed} unreferenced files")
+    return total_reclaimed
+
+def _original_stem(key: str) -> str | None:
+    # 파생 이미지 key({원본}_{variant}.ext)이면 원본 key의 확장자 제외 부분, 아니면 None
+    stem = os.path.splitext(key)[0]
+    for name in ImageService.variant_specs():
+        if stem.endswith(f"_{name}"):
+            return stem[:-len(name) - 1]
+    return None
+
+async def sweep_orphaned_files_batch(db, keys: list[str]) -> int:
+    """
+    스토리지 key 한 배치 중 어디서도 참조하지 않는 고아 파일을 찾아 GC 대상으로 편입
+    (바로 지우지 않고 참조 수 0으로 등록 -> 같은 파일을 동시에 업로드하는 요청과의 경쟁은
+    reclaim_unreferenced_files의 행 잠금이 처리합니다.)
+    """
+    storage = get_storage()
+    threshold = time.time() - settings.FILE_GC_GRACE_SECONDS
+    found = 0
+
+    candidates = {}
+    for key in keys:
+        original_stem = _original_stem(key)
+        if original_stem is None:
+            candidates[storage.url(key)] = key
+            continue
+        # 파생 이미지는 원본과 함께 삭제되므로, 원본이 이미 없는 경우만 바로 삭제
+        has_original = next(storage.list_keys(prefix=f"{original_stem}."), None) is not None
+        modified_at = storage.modified_at(key)
+        if not has_original and modified_at is not None and modified_at < threshold:
+            storage.delete(key)
+            found += 1
+
+    if not candidates:
+        return found
+
+    referenced = await FileService.get_referenced_urls(db, list(candidates))
+    for url, key in candidates.items():
+        if url in referenced:
+            continue
+        # 업로드 직후(커밋 전)이거나 직접 업로드 완료 전인 파일은 제외
+        modified_at = storage.modified_at(key)
+        if modified_at is None or modified_at > threshold:
+            continue
+        await stored_file_repository.register_stored_file(db, url=url, digest=None, size=storage.size(key) or 0)
+        found += 1
+
+    await db.commit()
+    return found
+
+async def _sweep_orphaned_files() -> int:
+    total_found = 0
+    # list_keys는 제너레이터이므로 파일 수와 관계없이 한 배치만큼만 메모리에 올라감
+    keys = get_storage().list_keys()
+    async with TaskSessionLocal() as db:
+        while batch := list(islice(keys, settings.PURGE_BATCH_SIZE)):
+            total_found += await sweep_orphaned_files_batch(db, batch)
+            await asyncio.sleep(settings.PURGE_BATCH_INTERVAL)
+    return total_found
+
+@celery_app.task
+def sweep_orphaned_files():
+    """[주기 작업] 커밋 실패 등으로 DB 어디에도 기록되지 않은 업로드 파일 정리"""
+    total_found = asyncio.run(_sweep_orphaned_files())
+    if total_found:
+        logger.info(f"🧹 Found {total_found} orphaned files")
+    return total_found
+
+def reclaim_abandoned_temp_files() -> int:
+    """
+    UPLOAD_SESSION_TTL_SECONDS 동안 수정되지 않은 임시 파일 삭제
+    (청크를 받을 때마다 파일이 수정되고 Redis 세션 TTL도 함께 갱신되므로, 이 시점엔 세션도 이미 만료됨)
+    """
+    threshold = time.time() - settings.UPLOAD_SESSION_TTL_SECONDS
+    removed = 0
+    with os.scandir(get_temp_dir()) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < threshold:
+                    os.remove(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                # 완료/취소 요청이 먼저 정리한 경우
+                continue
+    return removed
+
+@celery_app.task
+def reclaim_abandoned_uploads():
+    """[주기 작업] 중단된 이어받기 업로드 세션의 임시 파일 정리"""
+    removed = reclaim_abandoned_temp_files()
+    if removed:
+        logger.info(f"🧹 Removed {removed} abandoned upload temp files")
+    return removed
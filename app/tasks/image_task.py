@@ -0,0 +1,27 @@
+import asyncio
+from app.core.celery_app import celery_app
+from app.core.database import TaskSessionLocal
+from app.core.logger import logger
+from app.repository import board_repository, user_repository
+from app.services.image_service import ImageService
+
+async def record_image_variants(db, image_url: str, variants: dict[str, str]):
+    """원본 이미지를 참조하는 게시글/유저에 파생 이미지 URL 기록"""
+    await board_repository.update_image_variants(db, image_url=image_url, variants=variants)
+    await user_repository.update_profile_image_variants(db, image_url=image_url, variants=variants)
+
+async def _record_image_variants(image_url: str, variants: dict[str, str]):
+    async with TaskSessionLocal() as db:
+        await record_image_variants(db, image_url, variants)
+
+@celery_app.task(acks_late=True)
+def generate_image_variants(image_url: str):
+    """업로드된 이미지의 썸네일/중간 크기/WebP 파생본 생성"""
+    variants = ImageService.generate_variants(image_url)
+    if not variants:
+        logger.warning(f"⚠️ Skipping image variants: original not found ({image_url})")
+        return {}
+
+    asyncio.run(_record_image_variants(image_url, variants))
+    logger.info(f"🖼️ Generated {len(variants)} image variants for {image_url}")
+    return variants
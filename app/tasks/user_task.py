@@ -0,0 +1,68 @@
+import asyncio
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import TaskSessionLocal
+from app.core.logger import logger
+from app.repository import board_repository, comment_repository, user_repository
+from app.services.file_service import FileService
+from app.tasks.board_task import purge_board_comments
+
+async def purge_user_data(db, email: str) -> dict:
+    """탈퇴 유저의 댓글 -> 게시글(+첨부파일) -> 프로필 이미지 -> 유저 순서로 배치 삭제"""
+    stats = {"comments": 0, "boards": 0, "files": 0}
+
+    # 1. 유저가 작성한 댓글 (다른 사람 게시글에 단 댓글 포함)
+    while True:
+        deleted = await comment_repository.delete_comments_batch(
+            db, limit=settings.PURGE_BATCH_SIZE, user_id=email
+        )
+        stats["comments"] += deleted
+        if deleted < settings.PURGE_BATCH_SIZE:
+            break
+        await asyncio.sleep(settings.PURGE_BATCH_INTERVAL)
+
+    # 2. 유저가 작성한 게시글 (게시글에 달린 다른 사람의 댓글도 배치로 먼저 정리)
+    while True:
+        boards = await board_repository.get_boards_batch_by_user(
+            db, user_id=email, limit=settings.PURGE_BATCH_SIZE
+        )
+        if not boards:
+            break
+
+        for board_id, _, _ in boards:
+            stats["comments"] += await purge_board_comments(db, board_id)
+
+        # 게시글 삭제와 이미지 참조 수 감소는 한 트랜잭션으로 커밋
+        # (중간에 워커가 죽으면 둘 다 롤백되고 acks_late로 재실행되므로 감소가 누락되지 않음)
+        await board_repository.delete_boards_by_ids(db, [board_id for board_id, _, _ in boards])
+        for _, image_url, deleted_at in boards:
+            # 숨김 게시글은 delete_existing_board에서 이미 감소시켰으므로 건너뜀
+            # (중복 제거된 파일이라 두 번 줄이면 다른 게시글이 쓰는 파일까지 GC 대상이 됨)
+            if image_url and deleted_at is None:
+                await FileService.delete_file(db, image_url)
+                stats["files"] += 1
+        await db.commit()
+        stats["boards"] += len(boards)
+        await asyncio.sleep(settings.PURGE_BATCH_INTERVAL)
+
+    # 3. 프로필 이미지 및 유저 삭제
+    db_user = await user_repository.get_user(db, email=email)
+    if db_user is not None:
+        if db_user.profile_image_url:
+            await FileService.delete_file(db, db_user.profile_image_url)
+            stats["files"] += 1
+        await user_repository.delete_user_by_email(db, email)
+
+    return stats
+
+async def _purge_user(email: str) -> dict:
+    async with TaskSessionLocal() as db:
+        return await purge_user_data(db, email)
+
+@celery_app.task(acks_late=True)
+def purge_user(email: str):
+    """탈퇴(소프트 삭제)한 유저의 게시글/댓글/업로드 파일을 배치 단위로 영구 삭제"""
+    logger.info(f"🧹 Purging user {email}...")
+    stats = asyncio.run(_purge_user(email))
+    logger.info(f"✅ User {email} purged: {stats}")
+    return stats
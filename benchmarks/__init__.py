@@ -0,0 +1,12 @@
+import os
+
+# 벤치마크(load, micro)는 실제 MariaDB/Redis 없이 실행되므로 필수 설정값은 더미로 채움 (.env나 환경 변수가 있으면 그 값을 사용)
+for _name, _value in {
+    "DB_HOST": "localhost", "DB_PORT": "3306", "DB_USER": "bench", "DB_PASSWORD": "bench", "DB_NAME": "bench",
+    "REDIS_HOST": "localhost", "REDIS_PORT": "6379",
+    "SECRET_KEY": "benchmark-secret-key", "ALGORITHM": "HS256", "ACCESS_TOKEN_EXPIRE_MINUTES": "60",
+    "SMTP_HOST": "localhost", "SMTP_PORT": "25", "SMTP_USER": "bench@example.com", "SMTP_PASSWORD": "bench",
+    # 요청마다 남는 INFO 로그가 측정값에 섞이지 않도록
+    "LOG_LEVEL": "WARNING",
+}.items():
+    os.environ.setdefault(_name, _value)
@@ -0,0 +1,123 @@
+"""
+HTTP 부하 벤치마크 (앱을 같은 프로세스에서 ASGI로 호출)
+
+    python -m benchmarks.load run --out baseline.json
+    python -m benchmarks.load run --scenario read --requests 10000 --concurrency 32 --out after.json
+    python -m benchmarks.load compare baseline.json after.json --threshold 10
+
+compare는 회귀(지연 시간 증가/처리량 감소가 threshold% 이상)가 있으면 종료 코드 1을 반환합니다.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import sys
+from datetime import datetime, timezone
+from dataclasses import asdict
+from benchmarks.load.environment import bench_environment
+from benchmarks.load.report import (
+    DEFAULT_GATE_METRICS, compare as compare_reports, format_comparison, format_summary, summarize,
+)
+from benchmarks.load.seed import SeedConfig, seed
+from benchmarks.load.workload import SCENARIOS, run_workload
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+async def _run(args) -> dict:
+    config = SeedConfig(users=args.users, boards=args.boards, hot_boards=args.hot_boards,
+                        hot_board_comments=args.hot_board_comments)
+    weights = SCENARIOS[args.scenario]
+    async with bench_environment(redis_url=args.redis_url) as (client, session_factory):
+        print(f"🌱 Seeding {config.users} users, {config.boards} boards ...", file=sys.stderr)
+        data = await seed(session_factory, config, random.Random(args.seed))
+
+        if args.warmup:
+            # 첫 요청에만 드는 비용(라우트 정보 구성, 커넥션 생성 등)은 결과에서 제외
+            await run_workload(client, data, weights, requests=args.warmup, concurrency=args.concurrency, seed=args.seed + 1)
+        print(f"🏃 Running '{args.scenario}' ({args.requests} requests, concurrency {args.concurrency}) ...", file=sys.stderr)
+        result = await run_workload(client, data, weights, requests=args.requests, concurrency=args.concurrency, seed=args.seed)
+
+    meta = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenario": args.scenario,
+        "weights": weights,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "redis": "external" if args.redis_url else "fakeredis",
+        "data": asdict(config),
+    }
+    return summarize(result, meta)
+
+def run(args) -> int:
+    report = asyncio.run(_run(args))
+    print(format_summary(report), file=sys.stderr)
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        print(f"💾 Saved to {args.out}", file=sys.stderr)
+    else:
+        print(output)
+    return 0
+
+def compare(args) -> int:
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+
+    rows, regressions = compare_reports(base, current, args.threshold, tuple(args.metrics.split(",")))
+    print(format_comparison(rows))
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) over {args.threshold}%:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    print(f"\n✅ No regression over {args.threshold}%")
+    return 0
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description="v1 API 부하 벤치마크")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="시드 데이터를 만들고 워크로드를 실행해 결과를 JSON으로 출력")
+    run_parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+    run_parser.add_argument("--requests", type=int, default=5000)
+    run_parser.add_argument("--concurrency", type=int, default=16)
+    run_parser.add_argument("--warmup", type=int, default=200)
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--users", type=int, default=200)
+    run_parser.add_argument("--boards", type=int, default=2000)
+    run_parser.add_argument("--hot-boards", type=int, default=20)
+    run_parser.add_argument("--hot-board-comments", type=int, default=500)
+    run_parser.add_argument("--redis-url", help="fakeredis 대신 사용할 Redis (예: redis://localhost:6379/15, 실행 시 FLUSHDB)")
+    run_parser.add_argument("--out", help="결과 JSON 파일 경로 (없으면 stdout)")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="두 결과 JSON을 비교해 회귀가 있으면 종료 코드 1")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 판단할 변화율(%%)")
+    compare_parser.add_argument(
+        "--metrics", default=",".join(DEFAULT_GATE_METRICS), help="회귀 판단 지표 (p50_ms,p95_ms,p99_ms,rps 중 쉼표로 구분)"
+    )
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.core.config import settings
+from app.core.database import Base, get_db
+from app.core.job_runner import job_runner
+from app.core.redis import redis_client
+from app.main import app
+from benchmarks.redis_backend import use_fake_redis, use_redis_url
+
+# [참고] 벤치마크용 앱 환경
+# 앱을 같은 프로세스에서 ASGI로 직접 호출합니다. (네트워크/서버 프로세스 비용 없이 앱 코드만 측정)
+# - DB: 임시 디렉토리의 SQLite 파일 (요청마다 별도 세션/커넥션, 운영과 같은 구조)
+# - Redis: fakeredis (Lua 포함) 또는 --redis-url로 지정한 실제 Redis
+# lifespan은 실행하지 않으므로 outbox 디스패처(Celery 발행)는 동작하지 않고, 후속 작업 러너만 직접 시작합니다.
+
+@asynccontextmanager
+async def bench_environment(redis_url: str | None = None) -> AsyncIterator[tuple[AsyncClient, async_sessionmaker]]:
+    """(ASGI 클라이언트, 시드용 세션 공장)을 만들고 끝나면 정리"""
+    if redis_url:
+        use_redis_url(redis_url)
+    else:
+        use_fake_redis()
+    await redis_client.flushdb()
+
+    with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+        settings.UPLOAD_DIR = os.path.join(workdir, "uploads")
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(workdir, 'bench.db')}",
+            # 동시 쓰기는 SQLite 파일 잠금으로 직렬화되므로 기다릴 시간을 넉넉히
+            connect_args={"timeout": 30},
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+
+        async def override_get_db():
+            async with session_factory() as session:
+                yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        job_runner.start()
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+                yield client, session_factory
+        finally:
+            await job_runner.stop()
+            app.dependency_overrides.pop(get_db, None)
+            await redis_client.close()
+            await engine.dispose()
@@ -0,0 +1,94 @@
+import math
+from benchmarks.load.workload import WorkloadResult
+
+# [참고] 결과 집계 / 비교
+# 결과 JSON 형식: {"meta": {...}, "total": {...}, "endpoints": {endpoint: {requests, errors, rps, p50_ms, ...}}}
+
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+# 회귀 판단 기본 지표 (p99는 요청 수가 적은 엔드포인트에서 흔들림이 커서 표에만 표시)
+DEFAULT_GATE_METRICS = ("p50_ms", "p95_ms", "rps")
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """nearest-rank 백분위수 (q: 0~100)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def _summary(latencies: list[float], statuses: dict[int, int], elapsed: float) -> dict:
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": sum(count for status, count in statuses.items() if status >= 400),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "rps": round(len(values) / elapsed, 1),
+        "mean_ms": round(sum(values) / len(values) * 1000, 3),
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3),
+    }
+
+def summarize(result: WorkloadResult, meta: dict) -> dict:
+    all_latencies = [value for values in result.latencies.values() for value in values]
+    all_statuses: dict[int, int] = {}
+    for statuses in result.statuses.values():
+        for status, count in statuses.items():
+            all_statuses[status] = all_statuses.get(status, 0) + count
+
+    return {
+        "meta": {**meta, "duration_s": round(result.elapsed, 3)},
+        "total": _summary(all_latencies, all_statuses, result.elapsed),
+        "endpoints": {
+            endpoint: _summary(latencies, result.statuses[endpoint], result.elapsed)
+            for endpoint, latencies in sorted(result.latencies.items())
+        },
+    }
+
+def compare(
+    base: dict, current: dict, threshold: float, metrics: tuple[str, ...] = DEFAULT_GATE_METRICS
+) -> tuple[list[dict], list[str]]:
+    """
+    두 실행 결과를 엔드포인트별로 비교
+    - metrics 중 지연 시간이 threshold% 이상 늘거나 처리량(rps)이 threshold% 이상 줄면 회귀
+    - 반환: (비교 행 목록, 회귀 설명 목록)
+    """
+    rows = []
+    regressions = []
+    for endpoint in ["total", *sorted(set(base["endpoints"]) | set(current["endpoints"]))]:
+        before = base["total"] if endpoint == "total" else base["endpoints"].get(endpoint)
+        after = current["total"] if endpoint == "total" else current["endpoints"].get(endpoint)
+        if before is None or after is None:
+            rows.append({"endpoint": endpoint, "note": "only in base" if after is None else "only in current"})
+            continue
+
+        row = {"endpoint": endpoint}
+        for metric in (*LATENCY_METRICS, "rps"):
+            change = (after[metric] - before[metric]) / before[metric] * 100 if before[metric] else 0.0
+            row[metric] = (before[metric], after[metric], round(change, 1))
+            worse = change >= threshold if metric != "rps" else -change >= threshold
+            if worse and metric in metrics:
+                regressions.append(f"{endpoint} {metric}: {before[metric]} -> {after[metric]} ({change:+.1f}%)")
+        if after["errors"] > before["errors"]:
+            regressions.append(f"{endpoint} errors: {before['errors']} -> {after['errors']}")
+        rows.append(row)
+    return rows, regressions
+
+def format_summary(report: dict) -> str:
+    lines = [f"{'endpoint':<45} {'reqs':>6} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}  (ms)"]
+    for endpoint, stats in [*report["endpoints"].items(), ("total", report["total"])]:
+        lines.append(
+            f"{endpoint:<45} {stats['requests']:>6} {stats['errors']:>5} {stats['rps']:>8.1f} "
+            f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}"
+        )
+    return "\n".join(lines)
+
+def format_comparison(rows: list[dict]) -> str:
+    lines = [f"{'endpoint':<45} {'p50':>16} {'p95':>16} {'p99':>16} {'rps':>18}"]
+    for row in rows:
+        if "note" in row:
+            lines.append(f"{row['endpoint']:<45} {row['note']}")
+            continue
+        cells = [f"{after:>8.2f} ({change:+.0f}%)" for _, after, change in (row[m] for m in (*LATENCY_METRICS, "rps"))]
+        lines.append(f"{row['endpoint']:<45} " + " ".join(f"{cell:>16}" for cell in cells))
+    return "\n".join(lines)
@@ -0,0 +1,90 @@
+import random
+from datetime import timedelta
+from dataclasses import dataclass, field
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.core.redis import redis_client
+from app.core.security import create_access_token
+from app.models.board import Board
+from app.models.comment import Comment
+from app.models.user import User, UserRole
+
+# [참고] 벤치마크 시드 데이터
+# 운영 데이터와 비슷한 모양: 본문이 긴 게시글, 일부 게시글에 몰린 대량 댓글(인기 글), 나머지는 소수의 댓글
+
+WORDS = (
+    "FastAPI", "비동기", "트랜잭션", "캐시", "커넥션", "스프링", "마이그레이션", "인덱스", "쿼리", "세션",
+    "배포", "모니터링", "latency", "throughput", "Redis", "MariaDB", "Celery", "워커", "요청", "응답",
+)
+
+@dataclass
+class SeedConfig:
+    users: int = 200
+    boards: int = 2000
+    # 본문 길이 범위 (문자 수)
+    content_chars: tuple[int, int] = (2_000, 8_000)
+    # 댓글이 몰린 게시글 수와 게시글당 댓글 수
+    hot_boards: int = 20
+    hot_board_comments: int = 500
+    # 나머지 게시글의 댓글 수 상한
+    comments_per_board: int = 5
+
+@dataclass
+class SeedData:
+    """워크로드가 사용할 시드 결과 (ID 목록과 로그인 토큰)"""
+    user_emails: list[str]
+    admin_email: str
+    board_ids: list[int]
+    hot_board_ids: list[int]
+    tokens: dict[str, str] = field(default_factory=dict)
+
+def _text(rng: random.Random, chars: int) -> str:
+    words = []
+    length = 0
+    while length < chars:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+async def seed(session_factory: async_sessionmaker, config: SeedConfig, rng: random.Random) -> SeedData:
+    emails = [f"bench_user_{i}@example.com" for i in range(config.users)]
+    admin_email = "bench_admin@example.com"
+
+    async with session_factory() as db:
+        await db.execute(insert(User), [
+            {"email": email, "provider": "google", "role": UserRole.USER, "is_active": True} for email in emails
+        ] + [{"email": admin_email, "provider": "google", "role": UserRole.ADMIN, "is_active": True}])
+
+        await db.execute(insert(Board), [
+            {
+                "title": _text(rng, 40)[:255],
+                "content": _text(rng, rng.randint(*config.content_chars)),
+                "user_id": rng.choice(emails),
+            }
+            for _ in range(config.boards)
+        ])
+        board_ids = list(range(1, config.boards + 1))
+        hot_board_ids = rng.sample(board_ids, config.hot_boards)
+        hot = set(hot_board_ids)
+
+        comments = []
+        for board_id in board_ids:
+            count = config.hot_board_comments if board_id in hot else rng.randint(0, config.comments_per_board)
+            comments.extend(
+                {"content": _text(rng, rng.randint(20, 300)), "board_id": board_id, "user_id": rng.choice(emails)}
+                for _ in range(count)
+            )
+        await db.execute(insert(Comment), comments)
+        await db.commit()
+
+    # 로그인 상태 (JWT + Redis 세션), get_current_user와 같은 형식
+    tokens = {}
+    for email in [*emails, admin_email]:
+        token = create_access_token(data={"sub": email}, expires_delta=timedelta(hours=1))
+        await redis_client.set(f"session:{email}", token)
+        tokens[email] = token
+
+    return SeedData(
+        user_emails=emails, admin_email=admin_email, board_ids=board_ids, hot_board_ids=hot_board_ids, tokens=tokens
+    )
@@ -0,0 +1,104 @@
+import asyncio
+import random
+import time
+from typing import Callable, NamedTuple
+from httpx import AsyncClient
+from benchmarks.load.seed import SeedData
+
+# [참고] 벤치마크 워크로드
+# 작업(operation)마다 요청 하나를 만들고, 시나리오는 작업별 가중치로 정의합니다.
+# 결과는 라우트 템플릿(예: GET /api/v1/boards/{board_id}) 단위로 집계합니다.
+
+class BenchRequest(NamedTuple):
+    endpoint: str  # 집계 키 (메서드 + 라우트 템플릿)
+    method: str
+    url: str
+    headers: dict | None = None
+    json: dict | None = None
+
+def _auth(data: SeedData, email: str) -> dict:
+    return {"Authorization": f"Bearer {data.tokens[email]}"}
+
+def board_list(rng: random.Random, data: SeedData) -> BenchRequest:
+    # 대부분 앞쪽 페이지를 보고 가끔 깊은 페이지까지 넘겨봄
+    page = rng.randint(1, 3) if rng.random() < 0.8 else rng.randint(4, 50)
+    return BenchRequest("GET /api/v1/boards/", "GET", f"/api/v1/boards/?page={page}&size={rng.choice((10, 20))}")
+
+def board_detail(rng: random.Random, data: SeedData) -> BenchRequest:
+    return BenchRequest("GET /api/v1/boards/{board_id}", "GET", f"/api/v1/boards/{rng.choice(data.board_ids)}")
+
+def comment_list(rng: random.Random, data: SeedData) -> BenchRequest:
+    # 댓글이 몰린 인기 글 위주
+    board_id = rng.choice(data.hot_board_ids if rng.random() < 0.7 else data.board_ids)
+    return BenchRequest("GET /api/v1/boards/{board_id}/comments", "GET", f"/api/v1/boards/{board_id}/comments")
+
+def comment_create(rng: random.Random, data: SeedData) -> BenchRequest:
+    email = rng.choice(data.user_emails)
+    return BenchRequest(
+        "POST /api/v1/boards/{board_id}/comments", "POST", f"/api/v1/boards/{rng.choice(data.board_ids)}/comments",
+        headers=_auth(data, email), json={"content": f"벤치마크 댓글 {rng.random():.6f}"},
+    )
+
+def user_detail(rng: random.Random, data: SeedData) -> BenchRequest:
+    # 로그인한 유저가 자기 정보를 조회 (토큰 포함 요청)
+    email = rng.choice(data.user_emails)
+    return BenchRequest("GET /api/v1/users/{email}", "GET", f"/api/v1/users/{email}", headers=_auth(data, email))
+
+def user_list(rng: random.Random, data: SeedData) -> BenchRequest:
+    # 관리자 전용 (JWT 검증 + Redis 세션 확인 + 권한 확인)
+    return BenchRequest("GET /api/v1/users/", "GET", "/api/v1/users/", headers=_auth(data, data.admin_email))
+
+OPERATIONS: dict[str, Callable[[random.Random, SeedData], BenchRequest]] = {
+    "board_list": board_list,
+    "board_detail": board_detail,
+    "comment_list": comment_list,
+    "comment_create": comment_create,
+    "user_detail": user_detail,
+    "user_list": user_list,
+}
+
+# 시나리오별 작업 가중치
+SCENARIOS: dict[str, dict[str, int]] = {
+    "mixed": {"board_list": 30, "board_detail": 30, "comment_list": 10, "comment_create": 10, "user_detail": 15, "user_list": 5},
+    "read": {"board_list": 40, "board_detail": 40, "comment_list": 15, "user_detail": 5},
+    "write": {"comment_create": 70, "board_detail": 30},
+}
+
+class WorkloadResult(NamedTuple):
+    latencies: dict[str, list[float]]  # endpoint -> 초 단위 응답 시간
+    statuses: dict[str, dict[int, int]]  # endpoint -> {상태 코드: 횟수}
+    elapsed: float
+
+async def run_workload(
+    client: AsyncClient,
+    data: SeedData,
+    weights: dict[str, int],
+    *,
+    requests: int,
+    concurrency: int,
+    seed: int,
+) -> WorkloadResult:
+    """동시 사용자 concurrency명이 가중치에 따라 작업을 골라 총 requests건을 보냄"""
+    names = list(weights)
+    weight_values = list(weights.values())
+    latencies: dict[str, list[float]] = {}
+    statuses: dict[str, dict[int, int]] = {}
+    remaining = requests
+
+    async def virtual_user(user_id: int):
+        nonlocal remaining
+        # 사용자마다 고정된 시드를 사용해 같은 옵션이면 같은 요청 순서를 재현
+        rng = random.Random(seed * 1000 + user_id)
+        while remaining > 0:
+            remaining -= 1
+            name = rng.choices(names, weights=weight_values)[0]
+            request = OPERATIONS[name](rng, data)
+            started = time.perf_counter()
+            response = await client.request(request.method, request.url, headers=request.headers, json=request.json)
+            latencies.setdefault(request.endpoint, []).append(time.perf_counter() - started)
+            counts = statuses.setdefault(request.endpoint, {})
+            counts[response.status_code] = counts.get(response.status_code, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(virtual_user(i) for i in range(concurrency)))
+    return WorkloadResult(latencies, statuses, time.perf_counter() - started)
@@ -0,0 +1,36 @@
+import pytest
+from jose import jwt
+from app.core.config import settings
+from app.core.dependencies import authenticate_token
+from app.core.redis import redis_client
+from app.core.security import create_access_token
+from app.models.user import User
+
+EMAIL = "micro_bench@example.com"
+
+@pytest.fixture(scope="module")
+def token(loop, redis_backend, session_factory):
+    token = create_access_token(data={"sub": EMAIL})
+
+    async def prepare():
+        async with session_factory() as db:
+            db.add(User(email=EMAIL, provider="google", is_active=True))
+            await db.commit()
+        await redis_client.set(f"session:{EMAIL}", token)
+
+    loop.run_until_complete(prepare())
+    return token
+
+def bench_jwt_decode(bench, token):
+    """get_current_user 1단계: 서명 검증 + 클레임 파싱"""
+    payload = bench(jwt.decode, token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    assert payload["sub"] == EMAIL
+
+def bench_authenticate_token(bench, run_async, session_factory, token):
+    """get_current_user 전체: JWT 디코딩 + Redis 세션 확인 + 유저 조회 (SQLite)"""
+    async def authenticate():
+        async with session_factory() as db:
+            return await authenticate_token(db, token)
+
+    user = bench(run_async(authenticate))
+    assert user.email == EMAIL
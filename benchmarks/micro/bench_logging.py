@@ -0,0 +1,24 @@
+import io
+import logging
+import pytest
+from loguru import logger
+from app.core.logger import InterceptHandler, _sample_filter
+
+@pytest.fixture
+def null_sink():
+    # 출력 비용은 빼고 emit -> loguru 레코드 생성/포맷까지만 측정
+    handler_id = logger.add(
+        io.StringIO(), format="{time} | {level: <8} | {extra[request_id]} | {name}:{function}:{line} - {message}",
+        level="INFO", filter=_sample_filter,
+    )
+    yield
+    logger.remove(handler_id)
+
+def bench_intercept_handler_emit(bench, null_sink):
+    """표준 logging(uvicorn 접근 로그 등) 1건 -> InterceptHandler.emit -> loguru"""
+    handler = InterceptHandler()
+    record = logging.LogRecord(
+        "uvicorn.access", logging.INFO, __file__, 1, '%s - "%s %s HTTP/1.1" %d',
+        ("127.0.0.1", "GET", "/api/v1/boards/", 200), None,
+    )
+    bench(handler.emit, record)
@@ -0,0 +1,16 @@
+from starlette.requests import Request
+from app.core.rate_limiter import RateLimiter
+
+def _request(path: str) -> Request:
+    return Request({
+        "type": "http", "method": "POST", "path": path, "headers": [], "query_string": b"",
+        "client": ("127.0.0.1", 50000), "server": ("bench", 80), "scheme": "http", "root_path": "",
+    })
+
+def bench_rate_limiter_lua(bench, run_async, redis_backend):
+    """RateLimiter 1회: Lua 스크립트 실행 (ZREMRANGEBYSCORE + ZCARD + ZADD + EXPIRE)"""
+    # 제한에 걸리지 않도록 큰 한도, 윈도우는 짧게 두어 sorted set이 계속 커지지 않도록
+    limiter = RateLimiter(times=1_000_000_000, seconds=1)
+    request = _request("/api/v1/boards/1/comments")
+
+    assert bench(run_async(limiter, request)) is True
@@ -0,0 +1,42 @@
+from app.repository import board_repository, comment_repository
+
+class _EmptyResult:
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+    def scalar(self):
+        return 0
+
+class StatementCapturingSession:
+    """DB에 보내지 않고 마지막 statement만 보관하는 세션 (쿼리 생성 비용만 측정)"""
+
+    def __init__(self):
+        self.last_statement = None
+        self.executed = 0
+
+    async def execute(self, statement):
+        self.last_statement = statement
+        self.executed += 1
+        return _EmptyResult()
+
+def bench_board_list_query_construction(bench, run_async):
+    """board_repository.get_boards + get_boards_count 쿼리 객체 생성"""
+    session = StatementCapturingSession()
+
+    async def build():
+        await board_repository.get_boards(session, skip=20, limit=20)
+        await board_repository.get_boards_count(session)
+
+    bench(run_async(build))
+    assert session.executed >= 2
+
+def bench_comment_list_query_cache_key(bench, run_async):
+    """실행 시마다 계산되는 SQL 컴파일 캐시 키 (같은 모양의 쿼리는 컴파일 결과를 재사용)"""
+    session = StatementCapturingSession()
+    run_async(comment_repository.get_comments_by_board, session, board_id=1, skip=0, limit=100)()
+    statement = session.last_statement
+
+    assert bench(statement._generate_cache_key) is not None
@@ -0,0 +1,44 @@
+import json
+from datetime import datetime, timezone
+import pytest
+from app.models.board import Board
+from app.schemas.board import BoardResponse
+from app.schemas.page import PageResponse
+
+PAGE_SIZE = 20
+
+@pytest.fixture(scope="module")
+def boards() -> list[Board]:
+    now = datetime.now(timezone.utc)
+    return [
+        Board(
+            id=i, title=f"게시글 제목 {i}", content="본문 내용 " * 500, user_id=f"user{i}@example.com",
+            image_url=f"/static/uploads/boards/{i:02x}/{i}.png",
+            image_variants={"thumbnail": f"/static/uploads/boards/{i}_thumbnail.jpg"},
+            created_at=now, updated_at=now,
+        )
+        for i in range(PAGE_SIZE)
+    ]
+
+def _page(boards: list[Board]) -> PageResponse[BoardResponse]:
+    # board_service.get_boards_list의 캐시 Miss 경로와 같은 방식
+    return PageResponse(
+        items=[BoardResponse.model_validate(board) for board in boards],
+        total_count=1000, page=1, size=PAGE_SIZE, total_pages=50,
+    )
+
+def bench_page_response_from_orm(bench, boards):
+    """ORM 객체 20개 -> PageResponse[BoardResponse] 검증"""
+    page = bench(_page, boards)
+    assert len(page.items) == PAGE_SIZE
+
+def bench_page_response_dump_json(bench, boards):
+    """PageResponse[BoardResponse] -> JSON (캐시 저장/응답 직렬화)"""
+    page = _page(boards)
+    assert bench(page.model_dump_json).startswith("{")
+
+def bench_page_response_from_cache(bench, boards):
+    """캐시 Hit 경로: Redis에 저장된 JSON -> PageResponse"""
+    cached = _page(boards).model_dump_json()
+    page = bench(lambda: PageResponse(**json.loads(cached)))
+    assert page.total_count == 1000
@@ -0,0 +1,88 @@
+import asyncio
+import os
+import tracemalloc
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.core.database import Base
+from benchmarks.redis_backend import use_fake_redis, use_redis_url
+
+# [참고] 요청마다 실행되는 기본 연산의 마이크로 벤치마크 (pytest-benchmark)
+# 시간은 pytest-benchmark가, 메모리 할당은 tracemalloc으로 따로 측정해 결과 JSON의 extra_info에 함께 저장합니다.
+# 비동기 함수는 세션 전체에서 하나의 이벤트 루프로 실행합니다. (run_until_complete 비용 포함)
+
+# 할당 측정 시 호출 횟수
+ALLOCATION_ROUNDS = 200
+
+_allocation_results: list[tuple[str, dict]] = []
+
+@pytest.fixture(scope="session")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest.fixture(scope="session")
+def redis_backend():
+    # BENCH_REDIS_URL이 있으면 실제 Redis (예: redis://localhost:6379/15)
+    url = os.environ.get("BENCH_REDIS_URL")
+    if url:
+        use_redis_url(url)
+    else:
+        use_fake_redis()
+
+@pytest.fixture(scope="session")
+def session_factory(loop):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    loop.run_until_complete(create_tables())
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    loop.run_until_complete(engine.dispose())
+
+def measure_allocations(func, rounds: int = ALLOCATION_ROUNDS) -> dict:
+    """호출 1회당 최대 메모리 사용량(peak)과 호출 후에도 남는 메모리(retained)"""
+    func()  # 캐시 등 처음 한 번만 생기는 할당은 제외
+    tracemalloc.start()
+    try:
+        started, _ = tracemalloc.get_traced_memory()
+        peak_total = 0
+        for _ in range(rounds):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            peak_total += tracemalloc.get_traced_memory()[1] - current
+        retained = tracemalloc.get_traced_memory()[0] - started
+    finally:
+        tracemalloc.stop()
+    return {"alloc_peak_bytes": peak_total // rounds, "alloc_retained_bytes": retained // rounds}
+
+@pytest.fixture
+def bench(benchmark, request):
+    """benchmark(func)와 같고, 할당 측정 결과를 extra_info에 추가"""
+    def run(func, *args, **kwargs):
+        result = benchmark(func, *args, **kwargs)
+        allocations = measure_allocations(lambda: func(*args, **kwargs))
+        benchmark.extra_info.update(allocations)
+        _allocation_results.append((request.node.name, allocations))
+        return result
+    return run
+
+@pytest.fixture
+def run_async(loop):
+    """코루틴 함수를 동기 호출로 감쌈 (bench(run_async(fn, ...)))"""
+    def wrap(func, *args, **kwargs):
+        return lambda: loop.run_until_complete(func(*args, **kwargs))
+    return wrap
+
+def pytest_terminal_summary(terminalreporter):
+    if not _allocation_results:
+        return
+    terminalreporter.section("allocations (per call)")
+    terminalreporter.write_line(f"{'name':<50} {'peak':>12} {'retained':>12}")
+    for name, allocations in sorted(_allocation_results):
+        terminalreporter.write_line(
+            f"{name:<50} {allocations['alloc_peak_bytes']:>10} B {allocations['alloc_retained_bytes']:>10} B"
+        )
@@ -0,0 +1,20 @@
+from app.core.redis import redis_client, redis_binary_client
+
+# 앱 모듈들이 redis_client 객체를 직접 import 하므로 객체는 그대로 두고 커넥션 풀만 교체
+# (문자열/바이너리 클라이언트 모두 같은 서버를 보도록)
+
+def use_fake_redis():
+    """같은 프로세스 안의 fakeredis (Lua 스크립트 포함)"""
+    from fakeredis import FakeServer
+    from fakeredis.aioredis import FakeRedis
+
+    server = FakeServer()
+    redis_client.connection_pool = FakeRedis(server=server, decode_responses=True).connection_pool
+    redis_binary_client.connection_pool = FakeRedis(server=server).connection_pool
+
+def use_redis_url(url: str):
+    """실제 Redis (fakeredis와 실제 Redis의 명령 처리 비용이 다르므로 서버 측 비용까지 볼 때 사용)"""
+    import redis.asyncio as redis
+
+    redis_client.connection_pool = redis.ConnectionPool.from_url(url, decode_responses=True)
+    redis_binary_client.connection_pool = redis.ConnectionPool.from_url(url)
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from app.main import app
 from app.core.database import Base, get_db
 from app.core.config import settings
+from app.core.job_runner import job_runner
 
 # 테스트용 SQLite (Memory) DB 설정
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -36,9 +37,58 @@ async def client(db_session) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    # ASGITransport는 lifespan을 실행하지 않으므로 후속 작업 러너는 직접 시작
+    job_runner.start()
     
     # ASGITransport를 사용하여 httpx 클라이언트 생성
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
     
+    await job_runner.stop()
     app.dependency_overrides.clear()
+
+@pytest.fixture(autouse=True)
+async def reset_redis_pool():
+    """테스트마다 이벤트 루프가 새로 만들어지므로, 이전 루프에 묶인 Redis 커넥션을 정리"""
+    from app.core.redis import redis_client, redis_pool, redis_binary_pool
+
+    # 이전 테스트(실행)의 Rate Limit 카운트가 남아 있지 않도록 초기화
+    keys = [key async for key in redis_client.scan_iter(match="ratelimit:*")]
+    if keys:
+        await redis_client.delete(*keys)
+
+    yield
+    await redis_pool.disconnect()
+    await redis_binary_pool.disconnect()
+
+@pytest.fixture
+async def auth_headers(db_session) -> dict:
+    """테스트용 로그인 유저 생성 + JWT 발급 + Redis 세션 등록"""
+    from app.core.security import create_access_token
+    from app.core.redis import redis_client
+    from app.models.user import User
+    from app.repository import user_repository
+
+    email = "board_writer@example.com"
+    if await user_repository.get_user(db_session, email=email) is None:
+        await user_repository.create_user(db_session, User(email=email, provider="google", is_active=True))
+
+    token = create_access_token(data={"sub": email})
+    await redis_client.set(f"session:{email}", token, ex=600)
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+async def outbox_tasks(db_session):
+    """커밋된 outbox 메시지 중 해당 태스크의 인자 목록을 꺼냄 (꺼낸 메시지는 삭제)"""
+    from sqlalchemy import select
+    from app.models.outbox_message import OutboxMessage
+    from app.repository import outbox_repository
+
+    async def pop(task) -> list[tuple]:
+        stmt = select(OutboxMessage).where(OutboxMessage.task_name == task.name).order_by(OutboxMessage.id)
+        messages = (await db_session.execute(stmt)).scalars().all()
+        if messages:
+            await outbox_repository.delete_messages_by_ids(db_session, [message.id for message in messages])
+        return [tuple(message.args) for message in messages]
+
+    return pop
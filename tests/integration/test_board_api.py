@@ -0,0 +1,97 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.core.job_runner import job_runner
+from app.models.comment import Comment
+from app.repository import comment_repository
+from app.tasks import board_task
+
+async def _create_board(client: AsyncClient, auth_headers: dict) -> int:
+    response = await client.post(
+        "/api/v1/boards/", data={"title": "삭제 테스트", "content": "본문"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    return response.json()["id"]
+
+@pytest.mark.asyncio
+async def test_delete_board_api(client: AsyncClient, auth_headers: dict):
+    """댓글이 적은 게시글은 즉시 삭제된다"""
+    board_id = await _create_board(client, auth_headers)
+
+    response = await client.delete(f"/api/v1/boards/{board_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    response = await client.get(f"/api/v1/boards/{board_id}")
+    assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_delete_large_board_is_hidden_and_purged(client: AsyncClient, auth_headers: dict, db_session, outbox_tasks, monkeypatch):
+    """댓글이 많은 게시글은 즉시 숨김 처리되고, 댓글은 purge 태스크가 배치로 삭제한다"""
+    board_id = await _create_board(client, auth_headers)
+    db_session.add_all([
+        Comment(content=f"댓글 {i}", board_id=board_id, user_id="board_writer@example.com") for i in range(7)
+    ])
+    await db_session.commit()
+
+    monkeypatch.setattr(settings, "BOARD_PURGE_INLINE_LIMIT", 5)
+
+    response = await client.delete(f"/api/v1/boards/{board_id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert await outbox_tasks(board_task.purge_board) == [(board_id,)]
+
+    # 숨김 처리되어 상세/목록에서 즉시 사라짐 (목록 캐시 무효화는 응답 이후 실행)
+    await job_runner.join()
+    assert (await client.get(f"/api/v1/boards/{board_id}")).status_code == 404
+    listed_ids = [item["id"] for item in (await client.get("/api/v1/boards/?size=100")).json()["items"]]
+    assert board_id not in listed_ids
+
+    # purge 태스크의 배치 루프 (배치 크기 3 -> 3 + 3 + 1)
+    monkeypatch.setattr(settings, "PURGE_BATCH_SIZE", 3)
+    monkeypatch.setattr(settings, "PURGE_BATCH_INTERVAL", 0)
+    assert await board_task.purge_board_comments(db_session, board_id) == 7
+    assert await comment_repository.count_comments_by_board(db_session, board_id=board_id) == 0
+
+@pytest.mark.asyncio
+async def test_board_list_serves_precompressed_cache(client: AsyncClient, auth_headers: dict, monkeypatch):
+    """목록 캐시에는 인코딩별 본문이 저장되고, 히트 시 요청한 인코딩의 본문을 그대로 응답한다"""
+    from app.core import compression
+    from app.core.redis import redis_binary_client
+    from app.services import board_service
+
+    await _create_board(client, auth_headers)
+    await job_runner.join()
+    await board_service.invalidate_board_list_cache()
+    monkeypatch.setattr(settings, "COMPRESSION_MIN_SIZE", 1)
+
+    miss = await client.get("/api/v1/boards/?page=1&size=5", headers={"Accept-Encoding": "gzip"})
+    cached_fields = await redis_binary_client.hkeys("boards_page_1_size_5")
+
+    # 히트는 압축하지 않음 (캐시를 채울 때 한 번만)
+    monkeypatch.setitem(compression.ENCODERS, "gzip", lambda body: pytest.fail("cache hit must not compress"))
+    hit = await client.get("/api/v1/boards/?page=1&size=5", headers={"Accept-Encoding": "gzip"})
+    identity = await client.get("/api/v1/boards/?page=1&size=5", headers={"Accept-Encoding": "identity"})
+
+    assert {b"identity", b"gzip"} <= set(cached_fields)
+    assert miss.headers["content-encoding"] == hit.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in identity.headers
+    assert miss.json() == hit.json() == identity.json()
+    assert hit.json()["items"][0]["title"] == "삭제 테스트"
+
+@pytest.mark.asyncio
+async def test_board_write_invalidates_tracked_list_keys_without_scan(client: AsyncClient, auth_headers: dict, monkeypatch):
+    """게시글 쓰기는 키스페이스를 SCAN 하지 않고, 채울 때 등록한 목록 캐시 키만 삭제한다"""
+    from app.core.redis import redis_client
+    from app.services import board_service
+
+    await client.get("/api/v1/boards/?page=1&size=3")
+    await client.get("/api/v1/boards/?page=2&size=3")
+    assert await redis_client.smembers(board_service.BOARD_LIST_CACHE_KEYS) >= {
+        "boards_page_1_size_3", "boards_page_2_size_3"
+    }
+
+    monkeypatch.setattr(redis_client, "scan_iter", lambda *args, **kwargs: pytest.fail("must not scan keyspace"))
+    await _create_board(client, auth_headers)
+    await job_runner.join()
+
+    assert await redis_client.exists("boards_page_1_size_3", "boards_page_2_size_3", board_service.BOARD_LIST_CACHE_KEYS) == 0
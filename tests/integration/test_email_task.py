@@ -0,0 +1,88 @@
+import socket
+import time
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.core.config import settings
+from app.core.mailer import smtp_connection
+from app.tasks.email_task import send_bulk_email, send_welcome_email
+
+class _CollectingHandler:
+    def __init__(self):
+        self.recipients = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.recipients.extend(envelope.rcpt_tos)
+        return "250 Message accepted for delivery"
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    """로컬 SMTP 서버 (aiosmtpd)로 실제 SMTP 프로토콜 왕복을 포함해 측정"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    handler = _CollectingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+
+    monkeypatch.setattr(settings, "SMTP_HOST", controller.hostname)
+    monkeypatch.setattr(settings, "SMTP_PORT", port)
+    monkeypatch.setattr(settings, "SMTP_TLS", False)
+    monkeypatch.setattr(settings, "SMTP_SSL", False)
+    monkeypatch.setattr(settings, "SMTP_USER", "noreply@fastapi-enterprise.dev")
+    monkeypatch.setattr(settings, "SMTP_PASSWORD", None)
+    smtp_connection.close()
+    smtp_connection.connections_opened = 0
+    yield handler
+
+    smtp_connection.close()
+    controller.stop()
+
+def test_welcome_emails_reuse_one_smtp_connection(smtp_server):
+    for i in range(5):
+        send_welcome_email(f"user{i}@fastapi-enterprise.dev")
+
+    assert len(smtp_server.recipients) == 5
+    assert smtp_connection.connections_opened == 1
+
+def test_pooled_connection_reconnects_after_server_drop(smtp_server, monkeypatch):
+    """서버가 유휴 연결을 끊어도 건강 검사(NOOP) 후 재연결해서 발송"""
+    monkeypatch.setattr(settings, "SMTP_HEALTHCHECK_IDLE_SECONDS", 0)
+    send_welcome_email("first@fastapi-enterprise.dev")
+    smtp_connection._server.sock.shutdown(socket.SHUT_RDWR)
+
+    send_welcome_email("second@fastapi-enterprise.dev")
+    assert smtp_server.recipients == ["first@fastapi-enterprise.dev", "second@fastapi-enterprise.dev"]
+    assert smtp_connection.connections_opened == 2
+
+def test_bulk_email_reuses_connections(smtp_server, monkeypatch):
+    """메일마다 연결하는 방식 vs 하나의 세션으로 대량 발송 (SMTP 연결 수)"""
+    monkeypatch.setattr(settings, "SMTP_MAX_MESSAGES_PER_SECOND", 0)
+    recipients = [f"user{i}@fastapi-enterprise.dev" for i in range(200)]
+
+    # 이전 방식: 메일마다 연결 -> 발송 -> 종료
+    for email_to in recipients:
+        send_welcome_email(email_to)
+        smtp_connection.close()
+    opened_per_message = smtp_connection.connections_opened
+
+    smtp_connection.connections_opened = 0
+    stats = send_bulk_email(recipients + ["skip@example.com"], "공지", "본문")
+
+    assert stats == {"sent": 200, "skipped": 1, "failed": 0}
+    assert opened_per_message == 200
+    # SMTP_MAX_MESSAGES_PER_CONNECTION(100)마다 재연결
+    assert smtp_connection.connections_opened == 2
+    assert len(smtp_server.recipients) == 400
+
+def test_bulk_email_is_throttled(smtp_server, monkeypatch):
+    monkeypatch.setattr(settings, "SMTP_MAX_MESSAGES_PER_SECOND", 50)
+
+    started = time.perf_counter()
+    stats = send_bulk_email([f"user{i}@fastapi-enterprise.dev" for i in range(11)], "공지", "본문")
+    elapsed = time.perf_counter() - started
+
+    assert stats["sent"] == 11
+    # 11통 = 10번의 간격(20ms)
+    assert elapsed >= 0.19
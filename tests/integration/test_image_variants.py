@@ -0,0 +1,67 @@
+import io
+import os
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+
+from app.core.config import settings
+from app.core.storage import get_storage
+from app.services import board_service
+from app.services.file_service import FileService
+from app.services.image_service import ImageService
+from app.tasks import image_task
+
+def _photo_like_jpeg(width: int = 2400, height: int = 1600) -> bytes:
+    """압축이 잘 되지 않는 노이즈 이미지 (실제 사진과 비슷한 용량)"""
+    image = Image.merge("RGB", [Image.effect_noise((width, height), 48) for _ in range(3)])
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+def _local_path(url: str) -> str:
+    return get_storage().path(FileService.url_to_key(url))
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    get_storage.cache_clear()
+    yield tmp_path
+    get_storage.cache_clear()
+
+@pytest.mark.asyncio
+async def test_board_list_page_bytes_with_thumbnails(client: AsyncClient, auth_headers: dict, db_session, upload_dir, outbox_tasks):
+    """[Benchmark] 게시글 목록 1페이지를 그릴 때 내려받는 이미지 용량 (원본 vs 썸네일)"""
+    page_size = 3
+    image_bytes = _photo_like_jpeg()
+    for i in range(page_size):
+        response = await client.post(
+            "/api/v1/boards/",
+            data={"title": f"사진 {i}", "content": "본문"},
+            files={"file": (f"photo_{i}.jpg", image_bytes, "image/jpeg")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["image_variants"] is None
+
+    # 요청 경로는 이미지 처리 없이 태스크 발행 요청만 기록
+    dispatched = await outbox_tasks(image_task.generate_image_variants)
+    assert len(dispatched) == page_size
+
+    # Celery 워커가 하는 일을 동기로 실행
+    for (image_url,) in dispatched:
+        variants = ImageService.generate_variants(image_url)
+        assert set(variants) == {"thumbnail", "medium", "webp"}
+        await image_task.record_image_variants(db_session, image_url, variants)
+    await board_service.invalidate_board_list_cache()
+
+    response = await client.get(f"/api/v1/boards/?page=1&size={page_size}")
+    items = response.json()["items"]
+
+    def _page_bytes(urls):
+        return sum(os.path.getsize(_local_path(url)) for url in urls)
+
+    original_bytes = _page_bytes(item["image_url"] for item in items)
+    thumbnail_bytes = _page_bytes(item["image_variants"]["thumbnail"] for item in items)
+    assert thumbnail_bytes * 10 < original_bytes
+    with Image.open(_local_path(items[0]["image_variants"]["thumbnail"])) as thumbnail:
+        assert max(thumbnail.size) == settings.IMAGE_THUMBNAIL_SIZE
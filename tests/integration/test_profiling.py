@@ -0,0 +1,55 @@
+import json
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+
+@pytest.fixture
+async def admin_headers(db_session) -> dict:
+    """관리자 유저 생성 + JWT 발급 + Redis 세션 등록"""
+    from app.core.security import create_access_token
+    from app.core.redis import redis_client
+    from app.models.user import User, UserRole
+    from app.repository import user_repository
+
+    email = "profiler_admin@example.com"
+    if await user_repository.get_user(db_session, email=email) is None:
+        await user_repository.create_user(
+            db_session, User(email=email, provider="google", is_active=True, role=UserRole.ADMIN)
+        )
+
+    token = create_access_token(data={"sub": email})
+    await redis_client.set(f"session:{email}", token, ex=600)
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def profiling_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+
+@pytest.mark.asyncio
+async def test_profile_header_returns_speedscope_for_admin(client: AsyncClient, admin_headers, profiling_enabled):
+    response = await client.get("/api/v1/boards/", headers={**admin_headers, "X-Profile": "speedscope"})
+
+    assert response.status_code == 200
+    assert response.headers["X-Profiled-Status"] == "200"
+    assert "speedscope" in json.loads(response.content)["$schema"]
+
+@pytest.mark.asyncio
+async def test_profile_header_is_ignored_for_non_admin(client: AsyncClient, auth_headers, profiling_enabled):
+    response = await client.get("/api/v1/boards/", headers={**auth_headers, "X-Profile": "html"})
+
+    assert "X-Profiled-Status" not in response.headers
+    assert "items" in response.json()
+
+@pytest.mark.asyncio
+async def test_worker_profile_endpoint(client: AsyncClient, admin_headers, auth_headers, monkeypatch):
+    response = await client.post("/api/v1/admin/profile?seconds=0.05", headers=admin_headers)
+    assert response.status_code == 404
+
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    response = await client.post("/api/v1/admin/profile?seconds=0.05", headers=auth_headers)
+    assert response.status_code == 403
+
+    response = await client.post("/api/v1/admin/profile?seconds=0.05", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
@@ -0,0 +1,145 @@
+import io
+import socket
+import httpx
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+from starlette.datastructures import Headers
+from fastapi import HTTPException, UploadFile
+
+from app.core.config import settings
+from app.core.storage import S3StorageBackend, get_storage
+from app.repository import stored_file_repository
+from app.services.file_service import FileService
+from app.services.image_service import ImageService
+
+BUCKET = "test-uploads"
+
+def _png_bytes(size=(640, 480)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 30, 30)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+@pytest.fixture(scope="module")
+def s3_server():
+    """로컬 S3 호환 서버 (moto) - 실제 HTTP로 presigned 업로드까지 검증"""
+    from moto.server import ThreadedMotoServer
+
+    port = _free_port()
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
+
+@pytest.fixture
+def s3_storage(s3_server, tmp_path, monkeypatch) -> S3StorageBackend:
+    monkeypatch.setattr(settings, "STORAGE_BACKEND", "s3")
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "S3_BUCKET", BUCKET)
+    monkeypatch.setattr(settings, "S3_ENDPOINT_URL", s3_server)
+    monkeypatch.setattr(settings, "S3_REGION", "us-east-1")
+    monkeypatch.setattr(settings, "S3_ACCESS_KEY_ID", "testing")
+    monkeypatch.setattr(settings, "S3_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setattr(settings, "S3_PUBLIC_URL", f"{s3_server}/{BUCKET}")
+    get_storage.cache_clear()
+
+    storage = get_storage()
+    storage.client.create_bucket(Bucket=BUCKET)
+    yield storage
+    get_storage.cache_clear()
+
+@pytest.mark.asyncio
+async def test_s3_save_file_deduplicates_and_generates_variants(s3_storage: S3StorageBackend, db_session):
+    """S3 백엔드에서도 내용 해시 기반으로 한 번만 저장하고, 워커가 파생 이미지를 만든다"""
+    content = _png_bytes()
+
+    def _upload():
+        return UploadFile(file=io.BytesIO(content), filename="red.png", headers=Headers({"content-type": "image/png"}))
+
+    first_url = await FileService.save_file(db_session, _upload(), sub_dir="boards")
+    second_url = await FileService.save_file(db_session, _upload(), sub_dir="boards")
+    await db_session.commit()
+
+    assert first_url == second_url
+    assert first_url.startswith(f"{settings.S3_PUBLIC_URL}/boards/")
+    assert list(s3_storage.list_keys(prefix="boards/")) == [FileService.url_to_key(first_url)]
+
+    variants = ImageService.generate_variants(first_url)
+    assert set(variants) == {"thumbnail", "medium", "webp"}
+    assert len(list(s3_storage.list_keys(prefix="boards/"))) == 4
+
+    FileService.remove_from_storage(first_url)
+    assert list(s3_storage.list_keys(prefix="boards/")) == []
+
+@pytest.mark.asyncio
+async def test_presigned_direct_upload_flow(client: AsyncClient, auth_headers: dict, db_session, s3_storage):
+    """presigned 발급 -> 스토리지 직접 업로드 -> 완료 -> 게시글에 첨부 (파일 바이트는 API를 거치지 않음)"""
+    content = _png_bytes()
+
+    response = await client.post(
+        "/api/v1/uploads/presigned",
+        json={"filename": "direct.png", "content_type": "image/png", "size": len(content)},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    presigned = response.json()
+
+    # 클라이언트 -> 스토리지 직접 업로드
+    async with httpx.AsyncClient() as storage_client:
+        upload_response = await storage_client.post(
+            presigned["upload_url"],
+            data=presigned["fields"],
+            files={"file": ("direct.png", content, "image/png")},
+        )
+    assert upload_response.status_code in (200, 204)
+
+    # 발급받지 않은 사용자는 완료 처리할 수 없음
+    with pytest.raises(HTTPException) as exc_info:
+        await FileService.complete_presigned_upload(db_session, key=presigned["key"], user_id="someone_else@example.com")
+    assert exc_info.value.status_code == 404
+
+    response = await client.post("/api/v1/uploads/complete", json={"key": presigned["key"]}, headers=auth_headers)
+    assert response.status_code == 200
+    file_url = response.json()["file_url"]
+    assert file_url == presigned["file_url"]
+
+    response = await client.post(
+        "/api/v1/boards/", data={"title": "직접 업로드", "content": "본문", "image_url": file_url}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["image_url"] == file_url
+
+    stored_file = await stored_file_repository.get_stored_file(db_session, url=file_url)
+    await db_session.refresh(stored_file)
+    assert stored_file.ref_count == 1
+    assert stored_file.size == len(content)
+
+@pytest.mark.asyncio
+async def test_complete_rejects_keys_outside_direct_upload_area(client: AsyncClient, auth_headers: dict, s3_storage):
+    response = await client.post("/api/v1/uploads/complete", json={"key": "boards/ab/abc.png"}, headers=auth_headers)
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_complete_rejects_and_deletes_non_image_content(client: AsyncClient, auth_headers: dict, s3_storage):
+    """확장자/Content-Type만 이미지인 파일은 완료 시 내용 검사로 거절하고 객체도 삭제"""
+    content = b"<html><script>alert(1)</script></html>"
+    response = await client.post(
+        "/api/v1/uploads/presigned",
+        json={"filename": "fake.png", "content_type": "image/png", "size": len(content)},
+        headers=auth_headers,
+    )
+    presigned = response.json()
+    async with httpx.AsyncClient() as storage_client:
+        await storage_client.post(
+            presigned["upload_url"], data=presigned["fields"], files={"file": ("fake.png", content, "image/png")}
+        )
+    assert s3_storage.exists(presigned["key"])
+
+    response = await client.post("/api/v1/uploads/complete", json={"key": presigned["key"]}, headers=auth_headers)
+    assert response.status_code == 400
+    assert not s3_storage.exists(presigned["key"])
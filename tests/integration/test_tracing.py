@@ -0,0 +1,121 @@
+import io
+import time
+import pytest
+from PIL import Image
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import Status, StatusCode
+from sqlalchemy import select
+
+from app.core import tracing
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.outbox import OutboxDispatcher
+from app.core.storage import get_storage
+from app.core.tail_sampling import TailSamplingSpanProcessor
+from app.models.outbox_message import OutboxMessage
+from app.routers.v1 import board_router
+from app.services import board_service
+from app.tasks.image_task import generate_image_variants
+
+def _png_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), "red").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    get_storage.cache_clear()
+    yield tmp_path
+    get_storage.cache_clear()
+
+@pytest.fixture
+async def traced(test_engine, db_session, monkeypatch):
+    """트레이싱을 켠 별도 앱 (메인 앱은 이미 시작되어 미들웨어를 추가할 수 없음)"""
+    monkeypatch.setattr(settings, "OTEL_TAIL_SAMPLE_RATE", 1.0)
+    traced_app = FastAPI()
+    traced_app.include_router(board_router, prefix="/api/v1")
+
+    async def override_get_db():
+        yield db_session
+
+    traced_app.dependency_overrides[get_db] = override_get_db
+    exporter = InMemorySpanExporter()
+    provider = tracing.setup_tracing(traced_app, exporter=exporter, engines=[test_engine])
+
+    async with AsyncClient(transport=ASGITransport(app=traced_app), base_url="http://test") as client:
+        def finished_spans():
+            provider.force_flush()
+            return exporter.get_finished_spans()
+
+        yield client, finished_spans
+    tracing.shutdown_tracing()
+
+@pytest.mark.asyncio
+async def test_request_trace_covers_router_service_repository_redis_and_sql(traced):
+    client, finished_spans = traced
+    await board_service.invalidate_board_list_cache()
+
+    response = await client.get("/api/v1/boards/?page=3&size=4")
+    assert response.status_code == 200
+
+    spans = finished_spans()
+    request_span = next(span for span in spans if span.name == "GET /api/v1/boards/")
+    # 요청 트레이스에 속한 span만 (캐시 초기화 등 테스트 준비 과정 제외)
+    spans = [span for span in spans if span.context.trace_id == request_span.context.trace_id]
+    names = {span.name for span in spans}
+    assert {"board_service.get_boards_list", "board_repository.get_boards", "board_repository.get_boards_count"} <= names
+    assert any(span.attributes.get("db.system") == "redis" for span in spans)
+    assert any(span.name.startswith("SELECT") for span in spans)
+
+@pytest.mark.asyncio
+async def test_trace_context_follows_task_through_outbox(traced, auth_headers, db_session, upload_dir):
+    client, finished_spans = traced
+    response = await client.post(
+        "/api/v1/boards/",
+        data={"title": "트레이스", "content": "본문"},
+        files={"file": ("photo.png", _png_bytes(), "image/png")},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    request_span = next(span for span in finished_spans() if span.name == "POST /api/v1/boards/")
+
+    stmt = select(OutboxMessage).where(OutboxMessage.task_name == generate_image_variants.name)
+    message = (await db_session.execute(stmt)).scalars().all()[-1]
+    assert f"{request_span.context.trace_id:032x}" in message.trace_context["traceparent"]
+
+    # 디스패처가 나중에 발행해도 발행 span은 요청 트레이스에 이어짐
+    try:
+        OutboxDispatcher._publish([message])
+    finally:
+        with celery_app.connection_for_write() as connection:
+            connection.default_channel.queue_purge("celery")
+        await db_session.delete(message)
+        await db_session.commit()
+
+    publish_span = next(span for span in finished_spans() if span.name.startswith("apply_async/"))
+    assert publish_span.context.trace_id == request_span.context.trace_id
+
+def test_tail_sampling_keeps_only_errors_and_slow_traces():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(TailSamplingSpanProcessor(
+        SimpleSpanProcessor(exporter), sample_rate=0, slow_threshold_ms=50
+    ))
+    tracer = provider.get_tracer("test")
+
+    with tracer.start_as_current_span("fast"):
+        with tracer.start_as_current_span("fast.child"):
+            pass
+    with tracer.start_as_current_span("failed"):
+        with tracer.start_as_current_span("failed.child") as child:
+            child.set_status(Status(StatusCode.ERROR))
+    with tracer.start_as_current_span("slow"):
+        time.sleep(0.06)
+
+    assert sorted(span.name for span in exporter.get_finished_spans()) == ["failed", "failed.child", "slow"]
@@ -0,0 +1,165 @@
+import os
+import time
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.core.storage import get_storage
+from app.repository import stored_file_repository
+from app.services import upload_service
+from app.services.file_service import FileService
+from app.tasks.file_task import reclaim_abandoned_temp_files
+
+PNG_CONTENT = b"\x89PNG\r\n\x1a\n" + os.urandom(30_000)
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    get_storage.cache_clear()
+    yield tmp_path
+    get_storage.cache_clear()
+
+async def _create_session(client: AsyncClient, auth_headers: dict, size: int = len(PNG_CONTENT)) -> str:
+    response = await client.post(
+        "/api/v1/uploads/sessions",
+        json={"filename": "big.png", "content_type": "image/png", "size": size},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["offset"] == 0
+    return response.json()["upload_id"]
+
+@pytest.mark.asyncio
+async def test_resumable_upload_resumes_from_server_offset(client: AsyncClient, auth_headers: dict, db_session, upload_dir):
+    """중간에 끊긴 업로드는 서버가 받은 offset부터 이어서 보내고, 완료 후 게시글에 첨부할 수 있다"""
+    upload_id = await _create_session(client, auth_headers)
+    url = f"/api/v1/uploads/sessions/{upload_id}"
+
+    # 첫 청크 전송 후 연결이 끊겼다고 가정 -> 상태 조회로 재개 위치 확인
+    response = await client.put(f"{url}?offset=0", content=PNG_CONTENT[:10_000], headers=auth_headers)
+    assert response.json()["offset"] == 10_000
+    offset = (await client.get(url, headers=auth_headers)).json()["offset"]
+    assert offset == 10_000
+
+    # 잘못된 offset은 거절 (데이터가 섞이지 않음)
+    response = await client.put(f"{url}?offset=0", content=PNG_CONTENT[:10_000], headers=auth_headers)
+    assert response.status_code == 409
+
+    # 끝나기 전 완료 요청 거절
+    assert (await client.post(f"{url}/complete", headers=auth_headers)).status_code == 409
+
+    response = await client.put(f"{url}?offset={offset}", content=PNG_CONTENT[offset:], headers=auth_headers)
+    assert response.json()["offset"] == len(PNG_CONTENT)
+
+    response = await client.post(f"{url}/complete", headers=auth_headers)
+    assert response.status_code == 200
+    file_url = response.json()["file_url"]
+
+    with open(get_storage().path(FileService.url_to_key(file_url)), "rb") as f:
+        assert f.read() == PNG_CONTENT
+    assert not os.path.exists(upload_service.session_temp_path(upload_id))
+    assert (await client.get(url, headers=auth_headers)).status_code == 404
+
+    # 업로드 완료만으로는 참조되지 않으며, 게시글에 첨부할 때 참조 수 증가
+    assert (await stored_file_repository.get_stored_file(db_session, url=file_url)).ref_count == 0
+    response = await client.post(
+        "/api/v1/boards/", data={"title": "첨부", "content": "본문", "image_url": file_url}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    db_session.expire_all()
+    assert (await stored_file_repository.get_stored_file(db_session, url=file_url)).ref_count == 1
+
+@pytest.mark.asyncio
+async def test_chunk_beyond_declared_size_is_rejected(client: AsyncClient, auth_headers: dict, upload_dir):
+    upload_id = await _create_session(client, auth_headers, size=100)
+
+    response = await client.put(
+        f"/api/v1/uploads/sessions/{upload_id}?offset=0", content=PNG_CONTENT[:200], headers=auth_headers
+    )
+    assert response.status_code == 400
+    assert (await client.get(f"/api/v1/uploads/sessions/{upload_id}", headers=auth_headers)).json()["offset"] == 0
+
+@pytest.mark.asyncio
+async def test_abandoned_session_temp_files_are_reclaimed(client: AsyncClient, auth_headers: dict, upload_dir):
+    stale_id = await _create_session(client, auth_headers)
+    active_id = await _create_session(client, auth_headers)
+
+    # 마지막 청크 이후 TTL이 지난 세션
+    expired = time.time() - settings.UPLOAD_SESSION_TTL_SECONDS - 60
+    os.utime(upload_service.session_temp_path(stale_id), (expired, expired))
+
+    assert reclaim_abandoned_temp_files() == 1
+    assert not os.path.exists(upload_service.session_temp_path(stale_id))
+    assert os.path.exists(upload_service.session_temp_path(active_id))
+
+@pytest.mark.asyncio
+async def test_cancel_during_chunk_upload_does_not_revive_session(client: AsyncClient, auth_headers: dict, upload_dir):
+    """기록 중에 취소된 세션은 offset만 있는 Hash로 되살아나지 않고 404"""
+    from fastapi import HTTPException
+    from app.core.redis import redis_client
+
+    upload_id = await _create_session(client, auth_headers)
+    user_id = "board_writer@example.com"
+
+    async def chunks():
+        yield PNG_CONTENT[:1000]
+        await upload_service.cancel_upload_session(upload_id, user_id)
+        yield PNG_CONTENT[1000:2000]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_service.upload_chunk(upload_id, user_id, 0, chunks())
+
+    assert exc_info.value.status_code == 404
+    assert not await redis_client.exists(upload_service.UPLOAD_SESSION_KEY.format(upload_id=upload_id))
+    response = await client.put(
+        f"/api/v1/uploads/sessions/{upload_id}?offset=0", content=PNG_CONTENT[:1000], headers=auth_headers
+    )
+    assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_chunk_upload_does_not_release_lock_taken_over_by_another_request(client: AsyncClient, auth_headers: dict, upload_dir, monkeypatch):
+    """잠금 TTL이 지나 다른 요청이 잠금을 얻었다면 기존 요청은 더 쓰지 않고(409) 그 잠금도 지우지 않음"""
+    from fastapi import HTTPException
+    from app.core.redis import redis_client
+
+    upload_id = await _create_session(client, auth_headers)
+    user_id = "board_writer@example.com"
+    lock_key = upload_service.UPLOAD_SESSION_LOCK_KEY.format(upload_id=upload_id)
+    monkeypatch.setattr(upload_service, "UPLOAD_SESSION_LOCK_EXTEND_INTERVAL", 0)
+
+    async def chunks():
+        yield PNG_CONTENT[:1000]
+        # 느린 클라이언트: 그 사이 잠금이 만료되고 다른 요청이 잠금을 얻음
+        await redis_client.set(lock_key, "other-request", ex=60)
+        yield PNG_CONTENT[1000:2000]
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload_service.upload_chunk(upload_id, user_id, 0, chunks())
+
+    assert exc_info.value.status_code == 409
+    assert await redis_client.get(lock_key) == "other-request"
+    # 잠금을 잃은 요청은 offset을 갱신하지 않음
+    session = await redis_client.hgetall(upload_service.UPLOAD_SESSION_KEY.format(upload_id=upload_id))
+    assert session["offset"] == "0"
+    await redis_client.delete(lock_key)
+
+@pytest.mark.asyncio
+async def test_only_uploader_can_attach_uploaded_file(client: AsyncClient, auth_headers: dict, db_session, upload_dir):
+    """공개 URL만 알고 있는 다른 사용자는 파일을 게시글에 첨부(참조)할 수 없음"""
+    from fastapi import HTTPException
+
+    upload_id = await _create_session(client, auth_headers)
+    url = f"/api/v1/uploads/sessions/{upload_id}"
+    await client.put(f"{url}?offset=0", content=PNG_CONTENT, headers=auth_headers)
+    file_url = (await client.post(f"{url}/complete", headers=auth_headers)).json()["file_url"]
+
+    # 같은 내용의 파일은 다른 테스트에서도 참조하므로 참조 수는 증가분으로 확인
+    ref_count = (await stored_file_repository.get_stored_file(db_session, url=file_url)).ref_count
+    with pytest.raises(HTTPException) as exc_info:
+        await FileService.acquire(db_session, file_url, user_id="someone_else@example.com")
+    assert exc_info.value.status_code == 400
+
+    await FileService.acquire(db_session, file_url, user_id="board_writer@example.com")
+    await db_session.commit()
+    db_session.expire_all()
+    assert (await stored_file_repository.get_stored_file(db_session, url=file_url)).ref_count == ref_count + 1
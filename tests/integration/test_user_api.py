@@ -20,3 +20,102 @@ async def test_create_user_api(client: AsyncClient):
 
 # Note: 소셜 로그인 전용 전환으로 인해 기존 /token API 테스트는 삭제되었습니다.
 # 향후 소셜 로그인 Mock 테스트 등을 추가할 예정입니다.
+
+@pytest.mark.asyncio
+async def test_delete_user_api_soft_deletes_and_purges(client: AsyncClient, db_session, outbox_tasks, monkeypatch):
+    """탈퇴 시 계정은 즉시 비활성화되고, 게시글/댓글은 purge 태스크가 배치로 삭제"""
+    from app.core.config import settings
+    from app.core.redis import redis_client
+    from app.core.security import create_access_token
+    from app.models.board import Board
+    from app.models.comment import Comment
+    from app.repository import board_repository, user_repository
+    from app.services import user_service
+    from app.tasks import user_task
+
+    email = "leaving_user@example.com"
+    response = await client.post("/api/v1/users/", json={"email": email, "password": "testpassword123"})
+    assert response.status_code == 200
+
+    db_board = Board(title="탈퇴 예정", content="본문", user_id=email)
+    db_session.add(db_board)
+    await db_session.commit()
+    db_session.add_all([Comment(content=f"댓글 {i}", board_id=db_board.id, user_id=email) for i in range(5)])
+    await db_session.commit()
+
+    token = create_access_token(data={"sub": email})
+    await redis_client.set(f"session:{email}", token, ex=600)
+    response = await client.delete(f"/api/v1/users/{email}", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert await outbox_tasks(user_service.purge_user) == [(email,)]
+    assert (await client.get(f"/api/v1/users/{email}")).status_code == 404
+    assert await redis_client.get(f"session:{email}") is None
+
+    monkeypatch.setattr(settings, "PURGE_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "PURGE_BATCH_INTERVAL", 0)
+    stats = await user_task.purge_user_data(db_session, email)
+    assert stats["comments"] == 5
+    assert stats["boards"] == 1
+    assert await board_repository.get_boards_batch_by_user(db_session, user_id=email, limit=10) == []
+    assert await user_repository.get_user(db_session, email=email) is None
+
+@pytest.mark.asyncio
+async def test_purge_user_skips_image_of_hidden_board(db_session, monkeypatch):
+    """숨김 게시글의 이미지는 숨길 때 이미 참조 수를 줄였으므로 purge에서 다시 줄이지 않음"""
+    from datetime import datetime, timezone
+    from app.core.config import settings
+    from app.models.board import Board
+    from app.models.stored_file import StoredFile
+    from app.models.user import User
+    from app.repository import stored_file_repository
+    from app.tasks import user_task
+
+    monkeypatch.setattr(settings, "PURGE_BATCH_INTERVAL", 0)
+    email = "hidden_board_owner@example.com"
+    shared_url = f"/static/uploads/boards/{'a' * 64}.png"
+    own_url = f"/static/uploads/boards/{'b' * 64}.png"
+    db_session.add_all([
+        User(email=email, password="x"),
+        # 다른 유저 게시글과 중복 제거로 공유하는 파일 (숨길 때 2 -> 1로 이미 감소)
+        StoredFile(url=shared_url, size=1, ref_count=1),
+        StoredFile(url=own_url, size=1, ref_count=1),
+        Board(title="숨김", content="본문", user_id=email, image_url=shared_url, deleted_at=datetime.now(timezone.utc)),
+        Board(title="일반", content="본문", user_id=email, image_url=own_url),
+    ])
+    await db_session.commit()
+
+    stats = await user_task.purge_user_data(db_session, email)
+    assert stats["boards"] == 2
+    assert stats["files"] == 1
+    assert (await stored_file_repository.get_stored_file(db_session, url=shared_url)).ref_count == 1
+    assert (await stored_file_repository.get_stored_file(db_session, url=own_url)).ref_count == 0
+
+    # DB는 테스트 간 공유되므로 GC 대상(ref_count=0)이 다른 테스트에 남지 않도록 정리
+    await stored_file_repository.delete_stored_files_by_ids(
+        db_session,
+        [(await stored_file_repository.get_stored_file(db_session, url=url)).id for url in (shared_url, own_url)],
+    )
+
+@pytest.mark.asyncio
+async def test_withdrawn_user_cannot_log_in(db_session):
+    """탈퇴(purge 대기 중)한 유저는 비밀번호가 맞아도 토큰/세션을 받지 못함"""
+    from types import SimpleNamespace
+    from fastapi import HTTPException
+    from app.core.redis import redis_client
+    from app.models.user import User
+    from app.repository import user_repository
+    from app.services import auth_service
+
+    email = "withdrawn_login@example.com"
+    db_user = await user_repository.create_user(
+        db_session, User(email=email, password="testpassword123", is_active=True)
+    )
+    form_data = SimpleNamespace(username=email, password="testpassword123")
+    assert (await auth_service.login(db_session, form_data))["access_token"]
+    await auth_service.logout(email)
+
+    await user_repository.soft_delete_user(db_session, db_user)
+    with pytest.raises(HTTPException) as exc_info:
+        await auth_service.login(db_session, form_data)
+    assert exc_info.value.status_code == 401
+    assert await redis_client.get(f"session:{email}") is None
@@ -0,0 +1,97 @@
+import os
+import subprocess
+import sys
+import time
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core import celery_metrics
+from app.core.celery_app import celery_app
+
+@celery_app.task(name="tests.metrics_probe", bind=True, max_retries=1, default_retry_delay=0)
+def metrics_probe(self, mode: str):
+    if mode == "fail":
+        raise ValueError("boom")
+    if mode == "retry" and self.request.retries == 0:
+        raise self.retry()
+    return mode
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, {"task": metrics_probe.name, **labels}) or 0.0
+
+def test_task_outcomes_are_counted():
+    success = _sample("celery_tasks_total", state="success")
+    failure = _sample("celery_tasks_total", state="failure")
+    retry = _sample("celery_tasks_total", state="retry")
+    runs = _sample("celery_task_runtime_seconds_count")
+
+    metrics_probe.apply(args=["ok"])
+    metrics_probe.apply(args=["fail"])
+    metrics_probe.apply(args=["retry"])
+
+    # 재시도 후 성공한 실행은 retry 1회 + success 1회
+    assert _sample("celery_tasks_total", state="success") == success + 2
+    assert _sample("celery_tasks_total", state="failure") == failure + 1
+    assert _sample("celery_tasks_total", state="retry") == retry + 1
+    assert _sample("celery_task_runtime_seconds_count") >= runs + 3
+    assert celery_metrics._started_at == {}
+
+def test_queue_wait_is_measured_from_publish_header():
+    waits = _sample("celery_task_queue_wait_seconds_count")
+    total = _sample("celery_task_queue_wait_seconds_sum")
+
+    metrics_probe.apply(args=["ok"], headers={celery_metrics.PUBLISHED_AT_HEADER: time.time() - 5})
+
+    assert _sample("celery_task_queue_wait_seconds_count") == waits + 1
+    assert _sample("celery_task_queue_wait_seconds_sum") - total == pytest.approx(5, abs=1)
+
+def test_publish_adds_header():
+    headers = {}
+    celery_metrics.add_published_at_header(headers=headers)
+
+    assert headers[celery_metrics.PUBLISHED_AT_HEADER] == pytest.approx(time.time(), abs=1)
+
+def test_results_are_not_stored_by_default():
+    assert celery_app.conf.task_ignore_result is True
+    assert metrics_probe.ignore_result is True
+
+# prometheus_client는 import 시점에 PROMETHEUS_MULTIPROC_DIR을 보므로 새 인터프리터에서 실행
+FORKED_WORKER_SCRIPT = """
+import os
+from app.core import celery_metrics
+from app.core.celery_app import celery_app
+
+@celery_app.task(name="tests.forked_probe")
+def forked_probe():
+    return "ok"
+
+celery_metrics.reset_metrics_dir()
+pid = os.fork()
+if pid == 0:
+    # prefork 풀의 자식: 태스크 실행 후 종료 시그널 핸들러
+    forked_probe.apply()
+    celery_metrics.mark_metrics_process_dead(pid=os.getpid())
+    os._exit(0)
+os.waitpid(pid, 0)
+
+registry = celery_metrics._build_registry()
+labels = {"task": "tests.forked_probe"}
+print(registry.get_sample_value("celery_tasks_total", {**labels, "state": "success"}))
+print(registry.get_sample_value("celery_task_runtime_seconds_count", labels))
+"""
+
+def test_forked_child_task_metrics_are_served_by_parent(tmp_path):
+    """prefork 자식에서 실행한 태스크의 값을 메인 프로세스의 레지스트리에서 읽을 수 있다"""
+    stale = tmp_path / "counter_1.db"
+    stale.write_bytes(b"")
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+
+    result = subprocess.run(
+        [sys.executable, "-c", FORKED_WORKER_SCRIPT], env=env, capture_output=True, text=True, timeout=60
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split()[-2:] == ["1.0", "1.0"]
+    # 이전 실행의 파일은 fork 전에 지워지고, 종료된 자식의 값은 아카이브로 합쳐짐
+    assert not stale.exists()
+    assert sorted(path.name for path in tmp_path.glob("*.db")) == ["counter_archive.db", "histogram_archive.db"]
@@ -0,0 +1,59 @@
+import gzip
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from httpx import AsyncClient, ASGITransport
+
+from app.core.compression import CompressionMiddleware, PrecompressedResponse, negotiate_encoding
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    (None, "identity"),
+    ("gzip, deflate", "gzip"),
+    ("gzip, br, zstd", "br"),
+    ("gzip;q=1.0, br;q=0.5", "gzip"),
+    ("br;q=0, zstd;q=0, *;q=0.1", "gzip"),
+    ("gzip;q=0", "identity"),
+    ("deflate", "identity"),
+])
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding) == expected
+
+@pytest.mark.asyncio
+async def test_middleware_compresses_large_responses_only():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+    large_body = "게시글 본문 " * 500
+
+    @app.get("/large")
+    async def large():
+        return {"content": large_body}
+
+    @app.get("/small")
+    async def small():
+        return {"content": "짧은 본문"}
+
+    @app.get("/text")
+    async def text():
+        return PlainTextResponse(large_body)
+
+    @app.get("/precompressed")
+    async def precompressed():
+        return PrecompressedResponse(gzip.compress(b'{"cached": true}'), "gzip")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        headers = {"Accept-Encoding": "gzip"}
+        large_response = await client.get("/large", headers=headers)
+        small_response = await client.get("/small", headers=headers)
+        text_response = await client.get("/text", headers=headers)
+        precompressed_response = await client.get("/precompressed", headers=headers)
+        identity_response = await client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert large_response.headers["content-encoding"] == "gzip"
+    assert int(large_response.headers["content-length"]) < len(large_body.encode())
+    assert large_response.json() == {"content": large_body}
+    assert "content-encoding" not in small_response.headers
+    assert small_response.headers["vary"] == "Accept-Encoding"
+    assert text_response.headers["content-encoding"] == "gzip"
+    # 이미 압축된 본문은 다시 압축하지 않음
+    assert precompressed_response.json() == {"cached": True}
+    assert "content-encoding" not in identity_response.headers
@@ -0,0 +1,92 @@
+import asyncio
+import time
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import AsyncClient, ASGITransport
+from app.core.config import settings
+from app.core.deadline import DeadlineMiddleware, RouteDeadline, with_deadline, with_statement_time
+
+def test_select_gets_server_side_statement_time():
+    assert with_statement_time("SELECT 1", 1.5, is_mariadb=True) == "SET STATEMENT max_statement_time=1.500 FOR SELECT 1"
+    assert with_statement_time("SELECT 1", 1.5, is_mariadb=False) == "SELECT /*+ MAX_EXECUTION_TIME(1500) */ 1"
+    # MariaDB의 0은 제한 없음 -> 거의 남지 않은 경우에도 최소 1ms
+    assert with_statement_time("SELECT 1", 0.0004, is_mariadb=True) == "SET STATEMENT max_statement_time=0.001 FOR SELECT 1"
+
+@pytest.fixture
+def deadline_app(monkeypatch) -> FastAPI:
+    monkeypatch.setattr(settings, "REQUEST_DEADLINE_CANCEL_GRACE", 0.05)
+    app = FastAPI()
+
+    # 하위 호출이 마감을 알고 있는 경우: 남은 시간이 지나면 DeadlineExceeded(504)
+    @app.get("/aware", dependencies=[Depends(RouteDeadline(seconds=0.1))])
+    async def aware():
+        await with_deadline(asyncio.sleep(10))
+
+    # 마감을 모르는 호출: 마감 + grace 시점에 요청 태스크를 취소하고 504
+    @app.get("/unaware", dependencies=[Depends(RouteDeadline(seconds=0.1))])
+    async def unaware():
+        await asyncio.sleep(10)
+
+    @app.get("/fast", dependencies=[Depends(RouteDeadline(seconds=0.1))])
+    async def fast():
+        async def current_task():
+            return asyncio.current_task()
+
+        # 하위 호출은 별도 태스크 없이 요청 태스크에서 실행
+        assert await with_deadline(current_task()) is asyncio.current_task()
+        return {"ok": True}
+
+    app.add_middleware(DeadlineMiddleware)
+    return app
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/aware", "/unaware"])
+async def test_request_past_deadline_returns_504_promptly(deadline_app, path):
+    async with AsyncClient(transport=ASGITransport(app=deadline_app), base_url="http://test") as client:
+        started = time.perf_counter()
+        response = await client.get(path)
+
+    assert response.status_code == 504
+    assert time.perf_counter() - started < 1
+    # 취소 후에도 같은 태스크에서 다음 요청을 정상 처리
+    async with AsyncClient(transport=ASGITransport(app=deadline_app), base_url="http://test") as client:
+        assert (await client.get("/fast")).status_code == 200
+
+@pytest.mark.asyncio
+async def test_multipart_deadline_starts_after_body_is_received(monkeypatch):
+    from fastapi import File, UploadFile
+
+    monkeypatch.setattr(settings, "REQUEST_DEADLINE_SECONDS", 0.1)
+    monkeypatch.setattr(settings, "REQUEST_DEADLINE_CANCEL_GRACE", 0.05)
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    @app.post("/slow")
+    async def slow(file: UploadFile = File(...)):
+        await asyncio.sleep(10)
+
+    app.add_middleware(DeadlineMiddleware)
+    boundary = "deadline-test"
+
+    async def slow_body():
+        # 본문 전송에만 마감(0.1초)보다 오래 걸리는 느린 클라이언트
+        yield f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="a.bin"\r\n\r\n'.encode()
+        for _ in range(3):
+            await asyncio.sleep(0.1)
+            yield b"x" * 1024
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/upload", content=slow_body(), headers=headers)
+        assert response.status_code == 200
+        assert response.json() == {"size": 3 * 1024}
+
+        # 본문 수신 이후의 처리 시간에는 그대로 마감 적용
+        started = time.perf_counter()
+        response = await client.post("/slow", content=slow_body(), headers=headers)
+        assert response.status_code == 504
+        assert time.perf_counter() - started < 1
@@ -0,0 +1,161 @@
+import hashlib
+import io
+import os
+import time
+import pytest
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+
+from app.core.config import settings
+from app.core.storage import get_storage
+from app.repository import stored_file_repository
+from app.services.file_service import FileService
+from app.models.user import User
+from app.tasks.file_task import reclaim_unreferenced_files_batch, sweep_orphaned_files_batch
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+def _upload(content: bytes, filename: str = "image.png", content_type: str = "image/png", size: int | None = None):
+    return UploadFile(
+        file=io.BytesIO(content),
+        filename=filename,
+        size=size,
+        headers=Headers({"content-type": content_type}),
+    )
+
+def _local_path(url: str) -> str:
+    return get_storage().path(FileService.url_to_key(url))
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    get_storage.cache_clear()
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE", 1024)
+    yield tmp_path
+    get_storage.cache_clear()
+
+@pytest.mark.asyncio
+async def test_save_file_streams_in_chunks(upload_dir, db_session):
+    """청크 크기보다 큰 파일도 온전히 저장되고, 내용 해시가 파일명이 된다"""
+    content = PNG_HEADER + os.urandom(10_000)
+    digest = hashlib.sha256(content).hexdigest()
+
+    url = await FileService.save_file(db_session, _upload(content), sub_dir="boards")
+
+    assert url == f"/static/uploads/boards/{digest[:2]}/{digest}.png"
+    assert open(_local_path(url), "rb").read() == content
+    assert list((upload_dir / ".tmp").iterdir()) == []
+
+@pytest.mark.asyncio
+async def test_save_file_aborts_oversized_upload_while_streaming(upload_dir, db_session, monkeypatch):
+    """크기를 모르는 업로드도 스트리밍 중 제한을 넘으면 중단하고 임시 파일을 남기지 않는다"""
+    monkeypatch.setattr(settings, "UPLOAD_MAX_SIZE", 4096)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await FileService.save_file(db_session, _upload(PNG_HEADER + b"\0" * 8192), sub_dir="boards")
+
+    assert exc_info.value.status_code == 413
+    assert list(get_storage().list_keys()) == []
+    assert list((upload_dir / ".tmp").iterdir()) == []
+
+@pytest.mark.asyncio
+async def test_save_file_rejects_non_image_content(upload_dir, db_session):
+    """확장자가 이미지여도 내용이 이미지가 아니면 거절한다"""
+    with pytest.raises(HTTPException) as exc_info:
+        await FileService.save_file(db_session, _upload(b"#!/bin/sh\nrm -rf /"), sub_dir="boards")
+
+    assert exc_info.value.status_code == 415
+    assert list(get_storage().list_keys()) == []
+    assert list((upload_dir / ".tmp").iterdir()) == []
+
+@pytest.mark.asyncio
+async def test_same_content_is_stored_once_and_reclaimed_after_last_reference(upload_dir, db_session, monkeypatch):
+    """같은 내용은 한 번만 저장되고, 마지막 참조가 해제된 뒤 GC가 파일을 삭제한다"""
+    content = PNG_HEADER + os.urandom(2048)
+
+    first_url = await FileService.save_file(db_session, _upload(content, filename="a.png"), sub_dir="boards")
+    second_url = await FileService.save_file(db_session, _upload(content, filename="b.PNG"), sub_dir="boards")
+    await db_session.commit()
+
+    assert first_url == second_url
+    stored_file = await stored_file_repository.get_stored_file(db_session, url=first_url)
+    assert stored_file.ref_count == 2
+
+    # 참조가 남아 있는 동안에는 파일 유지
+    await FileService.delete_file(db_session, first_url)
+    await db_session.commit()
+    monkeypatch.setattr(settings, "FILE_GC_GRACE_SECONDS", -60)
+    assert await reclaim_unreferenced_files_batch(db_session) == 0
+    assert os.path.exists(_local_path(first_url))
+
+    await FileService.delete_file(db_session, second_url)
+    await db_session.commit()
+    assert await reclaim_unreferenced_files_batch(db_session) == 1
+    assert not os.path.exists(_local_path(first_url))
+    assert await stored_file_repository.get_stored_file(db_session, url=first_url) is None
+
+def _write_old_file(key: str, content: bytes = PNG_HEADER) -> str:
+    path = get_storage().path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+    old = time.time() - settings.FILE_GC_GRACE_SECONDS - 60
+    os.utime(path, (old, old))
+    return path
+
+@pytest.mark.asyncio
+async def test_orphan_sweep_reclaims_files_left_by_failed_commits(upload_dir, db_session, monkeypatch):
+    """커밋 실패로 DB에 기록되지 않은 파일은 스윕이 찾아 GC 대상으로 넘기고, 참조 중인 파일은 유지한다"""
+    # 1. 파일 저장 후 트랜잭션 롤백 -> 어디에도 기록되지 않은 고아 파일
+    orphan_url = await FileService.save_file(db_session, _upload(PNG_HEADER + os.urandom(512)), sub_dir="boards")
+    await db_session.rollback()
+    old = time.time() - settings.FILE_GC_GRACE_SECONDS - 60
+    os.utime(_local_path(orphan_url), (old, old))
+
+    # 2. 메타데이터 없이 유저가 참조 중인 이전 방식의 파일 + 파생 이미지
+    legacy_path = _write_old_file("profiles/legacy.png")
+    variant_path = _write_old_file("profiles/legacy_thumbnail.png")
+    legacy_url = get_storage().url("profiles/legacy.png")
+    db_session.add(User(email="sweep@example.com", provider="google", profile_image_url=legacy_url))
+    await db_session.commit()
+
+    # 3. 방금 올라와 아직 커밋 전일 수 있는 파일
+    fresh_url = await FileService.save_file(db_session, _upload(PNG_HEADER + os.urandom(512)), sub_dir="boards")
+    await db_session.rollback()
+
+    assert await sweep_orphaned_files_batch(db_session, list(get_storage().list_keys())) == 1
+    orphan = await stored_file_repository.get_stored_file(db_session, url=orphan_url)
+    assert orphan.ref_count == 0
+    assert await stored_file_repository.get_stored_file(db_session, url=legacy_url) is None
+
+    monkeypatch.setattr(settings, "FILE_GC_GRACE_SECONDS", -60)
+    await reclaim_unreferenced_files_batch(db_session)
+    assert not os.path.exists(_local_path(orphan_url))
+    assert os.path.exists(legacy_path) and os.path.exists(variant_path) and os.path.exists(_local_path(fresh_url))
+
+    # 이전 방식의 파일도 참조 해제 시 요청 경로에서 바로 지우지 않고 GC에 맡김
+    await FileService.delete_file(db_session, legacy_url)
+    await db_session.commit()
+    assert os.path.exists(legacy_path)
+    await reclaim_unreferenced_files_batch(db_session)
+    assert not os.path.exists(legacy_path) and not os.path.exists(variant_path)
+
+def test_write_semaphore_is_created_per_event_loop(monkeypatch):
+    """동시 쓰기 제한은 실행 중인 루프마다 따로 (다른 루프에서 대기해도 'attached to a different loop'가 나지 않음)"""
+    import asyncio
+    from app.services import file_service
+
+    monkeypatch.setattr(settings, "UPLOAD_MAX_CONCURRENT_WRITES", 1)
+
+    async def contend():
+        async def hold():
+            async with file_service._write_semaphore():
+                await asyncio.sleep(0.01)
+
+        # 자리가 1개라 두 번째는 대기 (대기 Future가 현재 루프에 만들어짐)
+        await asyncio.gather(hold(), hold())
+        return file_service._write_semaphore()
+
+    first = asyncio.run(contend())
+    second = asyncio.run(contend())
+    assert first is not second
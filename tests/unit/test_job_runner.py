@@ -0,0 +1,67 @@
+import asyncio
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.job_runner import JobRunner
+
+def _count(job, state: str) -> float:
+    labels = {"job": f"{job.__module__}.{job.__qualname__}", "state": state}
+    return REGISTRY.get_sample_value("job_runner_jobs_total", labels) or 0.0
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried():
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("redis down")
+
+    runner = JobRunner(max_queue_size=10, concurrency=1, max_retries=2, retry_delay=0)
+    runner.start()
+    retries = _count(flaky, "retry")
+
+    assert runner.submit(flaky) is True
+    await runner.join()
+    await runner.stop()
+
+    assert len(attempts) == 3
+    assert _count(flaky, "retry") == retries + 2
+    assert _count(flaky, "success") == 1
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_without_blocking():
+    release = asyncio.Event()
+
+    async def blocked():
+        await release.wait()
+
+    runner = JobRunner(max_queue_size=1, concurrency=1, max_retries=0, retry_delay=0)
+    runner.start()
+
+    assert runner.submit(blocked) is True
+    await asyncio.sleep(0)  # 워커가 첫 작업을 꺼내 실행 중
+    assert runner.submit(blocked) is True
+    assert runner.submit(blocked) is False
+
+    release.set()
+    await runner.stop()
+
+@pytest.mark.asyncio
+async def test_stop_drains_pending_jobs():
+    done = []
+
+    async def job(i: int):
+        await asyncio.sleep(0.01)
+        done.append(i)
+
+    runner = JobRunner(max_queue_size=100, concurrency=2, max_retries=0, retry_delay=0)
+    runner.start()
+    for i in range(10):
+        runner.submit(job, i)
+
+    await runner.stop(timeout=5)
+
+    assert sorted(done) == list(range(10))
+    # 종료 이후 제출된 작업은 거부
+    assert runner.submit(job, 99) is False
@@ -0,0 +1,20 @@
+from benchmarks.load.report import compare, percentile
+
+def _report(p50: float, p95: float, rps: float, errors: int = 0) -> dict:
+    stats = {"p50_ms": p50, "p95_ms": p95, "p99_ms": p95, "rps": rps, "errors": errors}
+    return {"total": stats, "endpoints": {"GET /api/v1/boards/": stats}}
+
+def test_percentile_uses_nearest_rank():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([3.0], 95) == 3.0
+
+def test_compare_flags_slower_latency_and_lower_throughput():
+    _, regressions = compare(_report(10, 20, 100), _report(10.5, 20, 99), threshold=10)
+    assert regressions == []
+
+    _, regressions = compare(_report(10, 20, 100), _report(10, 25, 80, errors=3), threshold=10)
+    assert "GET /api/v1/boards/ p95_ms: 20 -> 25 (+25.0%)" in regressions
+    assert "GET /api/v1/boards/ rps: 100 -> 80 (-20.0%)" in regressions
+    assert "GET /api/v1/boards/ errors: 0 -> 3" in regressions
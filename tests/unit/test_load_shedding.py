@@ -0,0 +1,116 @@
+import asyncio
+import pytest
+from httpx import AsyncClient, ASGITransport
+from starlette.responses import PlainTextResponse
+from app.core.load_shedding import AdaptiveConcurrencyLimiter, LoadSheddingMiddleware, Priority, request_priority
+
+def test_request_priority_protects_auth_and_reads_before_writes():
+    assert request_priority("POST", "/api/v1/auth/login") == Priority.CRITICAL
+    assert request_priority("GET", "/api/v1/boards/1") == Priority.NORMAL
+    assert request_priority("POST", "/api/v1/boards/1/comments") == Priority.LOW
+    assert request_priority("GET", "/api/v1/uploads/sessions/abc") == Priority.LOW
+
+@pytest.mark.asyncio
+async def test_freed_slot_goes_to_higher_priority_waiter_and_low_priority_times_out():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=1)
+    assert await limiter.acquire(Priority.NORMAL, timeout=0.1)
+    assert await limiter.acquire(Priority.CRITICAL, timeout=0.1)
+
+    normal = asyncio.create_task(limiter.acquire(Priority.NORMAL, timeout=1))
+    critical = asyncio.create_task(limiter.acquire(Priority.CRITICAL, timeout=1))
+    await asyncio.sleep(0)
+    limiter.release(0.01)
+
+    assert await critical is True
+    assert not normal.done()
+    # LOW는 limit의 70%(1.4)까지만 쓸 수 있으므로 자리가 하나 비어도 들어가지 못하고 시간 초과
+    limiter.release(0.01)
+    assert await normal is True
+    assert await limiter.acquire(Priority.LOW, timeout=0.05) is False
+    assert limiter.in_flight == 2
+
+@pytest.mark.asyncio
+async def test_timed_out_waiters_leave_the_queue_for_new_arrivals():
+    """시간 초과/취소된 대기는 대기열에서 빠져, 직후에 온 요청이 대기열 상한에 막히지 않는다"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=1)
+    assert await limiter.acquire(Priority.NORMAL, timeout=0.1)
+    assert await limiter.acquire(Priority.CRITICAL, timeout=0.1)
+
+    burst = [asyncio.create_task(limiter.acquire(Priority.NORMAL, timeout=0.01)) for _ in range(2)]
+    cancelled = asyncio.create_task(limiter.acquire(Priority.CRITICAL, timeout=1))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    assert await asyncio.gather(*burst) == [False, False]
+    assert sum(map(len, limiter._waiters.values())) == 0
+
+    arrival = asyncio.create_task(limiter.acquire(Priority.NORMAL, timeout=1))
+    await asyncio.sleep(0)
+    limiter.release(0.01)
+    assert await arrival is True
+
+def test_limit_shrinks_when_latency_rises_under_load_and_recovers():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=20, min_limit=5, max_limit=100)
+
+    def saturated(rtt: float, samples: int) -> float:
+        for _ in range(samples):
+            limiter.in_flight = int(limiter.limit)
+            limiter._update(rtt)
+        return limiter.limit
+
+    # 응답 시간이 그대로면 limit을 계속 늘려 봄
+    assert saturated(0.02, 100) == 100
+    # 응답 시간이 평소의 10배가 되면 빠르게 줄이고, 회복되면 다시 늘림
+    assert saturated(0.2, 30) < 20
+    assert saturated(0.02, 200) == 100
+
+@pytest.mark.asyncio
+async def test_middleware_sheds_with_503_and_retry_after(monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "LOAD_SHED_QUEUE_TIMEOUT", 0.05)
+    release = asyncio.Event()
+
+    async def slow_app(scope, receive, send):
+        await release.wait()
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    app = LoadSheddingMiddleware(slow_app, limiter=AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=1))
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = asyncio.create_task(client.get("/api/v1/boards/"))
+        await asyncio.sleep(0.01)
+        shed = await client.get("/api/v1/boards/")
+        release.set()
+
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"] == str(settings.LOAD_SHED_RETRY_AFTER)
+        assert (await first).status_code == 200
+
+@pytest.mark.asyncio
+async def test_upload_body_time_is_not_fed_into_the_limit():
+    samples = []
+
+    class RecordingLimiter(AdaptiveConcurrencyLimiter):
+        def release(self, rtt):
+            samples.append(rtt)
+            super().release(rtt)
+
+    async def read_body_app(scope, receive, send):
+        while (await receive()).get("more_body", False):
+            pass
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    async def slow_body():
+        for _ in range(3):
+            await asyncio.sleep(0.1)
+            yield b"x" * 1024
+
+    app = LoadSheddingMiddleware(read_body_app, limiter=RecordingLimiter())
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        # multipart: 본문 수신 이후의 처리 시간만 반영
+        headers = {"Content-Type": "multipart/form-data; boundary=x"}
+        assert (await client.post("/api/v1/boards/", content=slow_body(), headers=headers)).status_code == 200
+        # 이어받기 업로드 청크: 반영하지 않음
+        assert (await client.put("/api/v1/uploads/sessions/abc?offset=0", content=slow_body())).status_code == 200
+
+    assert samples[0] < 0.1
+    assert samples[1] is None
@@ -0,0 +1,119 @@
+import io
+import json
+import logging
+import time
+import pytest
+from httpx import AsyncClient
+from loguru import logger
+
+from app.core import logger as logger_module
+from app.core.config import settings
+
+@pytest.fixture
+def captured():
+    records = []
+    handler_id = logger.add(lambda message: records.append(message.record), level="INFO")
+    yield records
+    logger.remove(handler_id)
+
+@pytest.mark.asyncio
+async def test_logs_carry_request_id_and_route(client: AsyncClient, captured):
+    response = await client.get("/", headers={"X-Request-ID": "req-123"})
+    assert response.headers["X-Request-ID"] == "req-123"
+
+    # 로그에 그대로 찍히면 안 되는 값은 새 ID로 교체
+    response = await client.get("/", headers={"X-Request-ID": "bad id\nINJECTED"})
+    generated_id = response.headers["X-Request-ID"]
+    assert len(generated_id) == 32
+
+    root_logs = [record for record in captured if record["message"] == "Root endpoint called!"]
+    assert [(record["extra"]["request_id"], record["extra"]["route"]) for record in root_logs] == [
+        ("req-123", "/"), (generated_id, "/")
+    ]
+
+def test_stdlib_logs_keep_caller_location(captured):
+    logging.getLogger("uvicorn.error").warning("stdlib warning")
+
+    record = next(record for record in captured if record["message"] == "stdlib warning")
+    assert record["name"] == "uvicorn.error"
+    assert record["function"] == "test_stdlib_logs_keep_caller_location"
+    assert record["extra"]["request_id"] == "-"
+
+def test_json_format_is_one_object_per_line():
+    stream = io.StringIO()
+    handler_id = logger.add(stream, format=logger_module._json_format, level="INFO")
+    try:
+        logger.bind(board_id=7).info("게시글 조회")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("실패")
+    finally:
+        logger.remove(handler_id)
+
+    info, error = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert info["message"] == "게시글 조회"
+    assert info["board_id"] == 7
+    assert info["request_id"] == "-"
+    assert error["level"] == "ERROR"
+    assert "ValueError: boom" in error["exception"]
+
+def test_info_logs_are_sampled(monkeypatch):
+    messages = []
+    handler_id = logger.add(lambda message: messages.append(message.record["message"]), filter=logger_module._sample_filter)
+    monkeypatch.setattr(settings, "LOG_INFO_SAMPLE_RATE", 0)
+    try:
+        logger.info("sampled out")
+        logger.warning("always kept")
+        logger.bind(force=True).info("forced")
+    finally:
+        logger.remove(handler_id)
+
+    assert messages == ["always kept", "forced"]
+
+def test_setup_logger_is_idempotent():
+    root_handlers = logging.getLogger().handlers
+    sink = logger_module._sink
+
+    assert logger_module.setup_logger() is logger
+    assert logging.getLogger().handlers is root_handlers
+    assert logger_module._sink is sink
+
+class SlowStream(io.StringIO):
+    """출력이 밀린 stderr(파이프가 가득 찬 로그 수집기 등)를 흉내"""
+
+    def write(self, message):
+        time.sleep(0.0002)
+        return super().write(message)
+
+def test_background_sink_keeps_slow_output_off_the_caller():
+    """출력이 밀려도 요청 1건(앱 로그 + 접근 로그)의 로깅 비용은 동기 출력보다 작고, 출력 내용은 같다"""
+    access = logging.getLogger("uvicorn.access")
+    requests = 200
+
+    def measure(sink) -> float:
+        handler_id = logger.add(sink, format="{extra[request_id]} | {name}:{function}:{line} - {message}", level="INFO")
+        try:
+            started = time.perf_counter()
+            for i in range(requests):
+                logger.info(f"Board list requested page={i}")
+                access.info('%s - "%s %s HTTP/1.1" %d', "127.0.0.1", "GET", "/api/v1/boards/", 200)
+            return time.perf_counter() - started
+        finally:
+            logger.remove(handler_id)
+
+    sync_stream = SlowStream()
+    sync_elapsed = measure(sync_stream)
+
+    background_stream = SlowStream()
+    background_sink = logger_module.BackgroundSink(background_stream)
+    try:
+        background_elapsed = measure(background_sink)
+    finally:
+        background_sink.stop()
+
+    # 동기 출력은 쓰기마다 0.2ms씩 기다리지만, BackgroundSink는 큐에 넣기만 함
+    assert background_elapsed < sync_elapsed / 2
+    assert not background_sink._thread.is_alive()
+    assert sync_stream.getvalue() == background_stream.getvalue().replace("\r", "")
+    assert background_stream.getvalue().count("\n") == requests * 2
@@ -0,0 +1,50 @@
+import gc
+import time
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.core.loop_monitor import LOOP_LAG, detect_blocking
+
+def _lag_samples() -> float:
+    return next(
+        sample.value for metric in LOOP_LAG.collect() for sample in metric.samples
+        if sample.name == "event_loop_lag_seconds_count"
+    )
+
+@pytest.mark.asyncio
+async def test_blocking_call_is_reported_with_route_and_stack():
+    blocking_app = FastAPI()
+
+    @blocking_app.get("/reports/{report_id}")
+    async def build_report(report_id: int):
+        time.sleep(0.3)  # 이벤트 루프를 막는 동기 호출
+        return {"id": report_id}
+
+    samples_before = _lag_samples()
+    async with AsyncClient(transport=ASGITransport(app=blocking_app), base_url="http://test") as client:
+        async with detect_blocking(threshold=0.1) as events:
+            assert (await client.get("/reports/7")).status_code == 200
+
+    assert len(events) == 1
+    assert events[0].route == "/reports/{report_id}"
+    assert "in build_report" in events[0].stack
+    assert events[0].lag >= 0.1
+    assert _lag_samples() > samples_before
+
+@pytest.mark.asyncio
+async def test_endpoints_do_not_block_event_loop(client: AsyncClient, auth_headers):
+    """회원가입/비밀번호 변경(bcrypt), 게시글 작성/조회가 루프를 막지 않는지 확인"""
+    from app.core.security import get_password_hash
+
+    # 처음 한 번만 드는 비용은 제외 (passlib 백엔드 자체 점검, 라우트 템플릿 계산용 라우트 정보 구성, 이전 테스트의 GC)
+    await get_password_hash("warm-up")
+    await client.get("/api/v1/boards/?size=5")
+    gc.collect()
+    email = "non_blocking@example.com"
+    async with detect_blocking(threshold=0.1) as events:
+        await client.post("/api/v1/users/", json={"email": email, "password": "testpassword123"})
+        await client.post("/api/v1/boards/", data={"title": "루프", "content": "본문"}, headers=auth_headers)
+        await client.get("/api/v1/boards/?size=5")
+
+    assert not events, events
@@ -0,0 +1,29 @@
+import json
+import os
+from prometheus_client import CollectorRegistry
+from prometheus_client.mmap_dict import MmapedDict
+from app.core.metrics import LockedMultiProcessCollector, archive_dead_process
+
+def _write(path: str, filename: str, value: float):
+    key = json.dumps(("api_requests_total", "api_requests_total", {"route": "/api/v1/boards/{board_id}"}, "help"))
+    values = MmapedDict(os.path.join(path, filename))
+    values.write_value(key, value, 0.0)
+    values.close()
+
+def _total(path: str) -> float:
+    registry = CollectorRegistry()
+    LockedMultiProcessCollector(registry, path=path)
+    return registry.get_sample_value("api_requests_total", {"route": "/api/v1/boards/{board_id}"})
+
+def test_dead_worker_files_are_merged_into_archive_without_losing_counts(tmp_path):
+    path = str(tmp_path)
+    _write(path, "counter_101.db", 3)
+    _write(path, "counter_102.db", 4)
+    _write(path, "gauge_livesum_101.db", 1)
+
+    archive_dead_process(101, path)
+    _write(path, "counter_103.db", 5)
+    archive_dead_process(103, path)
+
+    assert sorted(name for name in os.listdir(path) if name.endswith(".db")) == ["counter_102.db", "counter_archive.db"]
+    assert _total(path) == 12
@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core import outbox
+from app.core.config import settings
+from app.models.outbox_message import OutboxMessage
+from app.tasks.email_task import send_welcome_email
+
+@pytest.fixture
+async def dispatcher(test_engine, db_session, monkeypatch):
+    # 다른 테스트(API 호출)가 남긴 메시지 제거
+    await db_session.execute(delete(OutboxMessage))
+    await db_session.commit()
+
+    published = []
+    monkeypatch.setattr(outbox.OutboxDispatcher, "_publish", staticmethod(lambda messages: published.extend(
+        (message.task_name, message.args) for message in messages
+    )))
+    monkeypatch.setattr(
+        outbox.outbox_dispatcher, "session_factory",
+        async_sessionmaker(test_engine, expire_on_commit=False, class_=AsyncSession),
+    )
+    outbox.outbox_dispatcher.published = published
+    return outbox.outbox_dispatcher
+
+async def _pending_count(db_session) -> int:
+    return len((await db_session.execute(select(OutboxMessage))).scalars().all())
+
+@pytest.mark.asyncio
+async def test_rolled_back_transaction_does_not_dispatch(db_session, dispatcher):
+    await outbox.enqueue(db_session, send_welcome_email, "rollback@fastapi-enterprise.dev")
+    await db_session.rollback()
+
+    assert await _pending_count(db_session) == 0
+    assert await dispatcher.dispatch_batch() == 0
+    assert dispatcher.published == []
+
+@pytest.mark.asyncio
+async def test_committed_messages_are_published_in_batches(db_session, dispatcher, monkeypatch):
+    monkeypatch.setattr(settings, "OUTBOX_BATCH_SIZE", 2)
+    for i in range(3):
+        await outbox.enqueue(db_session, send_welcome_email, f"user{i}@fastapi-enterprise.dev")
+    await db_session.commit()
+
+    assert await dispatcher.dispatch_batch() == 2
+    assert await dispatcher.dispatch_batch() == 1
+    assert dispatcher.published == [
+        (send_welcome_email.name, [f"user{i}@fastapi-enterprise.dev"]) for i in range(3)
+    ]
+    assert await _pending_count(db_session) == 0
+
+@pytest.mark.asyncio
+async def test_commit_wakes_up_dispatcher_without_waiting_for_poll(db_session, dispatcher, monkeypatch):
+    """커밋 직후 발행 (폴링 주기를 기다리지 않음)"""
+    monkeypatch.setattr(settings, "OUTBOX_POLL_INTERVAL", 60)
+    dispatcher.start()
+    try:
+        await asyncio.sleep(0.05)
+        await outbox.enqueue(db_session, send_welcome_email, "wakeup@fastapi-enterprise.dev")
+        await db_session.commit()
+
+        for _ in range(50):
+            if dispatcher.published:
+                break
+            await asyncio.sleep(0.01)
+        assert dispatcher.published == [(send_welcome_email.name, ["wakeup@fastapi-enterprise.dev"])]
+    finally:
+        await dispatcher.stop()
@@ -0,0 +1,16 @@
+from app.core.config import settings
+from app.server import ApiServer, ProductionUvicornWorker, build_options, default_workers
+
+def test_server_options_preload_app_and_size_workers_to_cores(monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_WORKERS", 0)
+    server = ApiServer(build_options())
+
+    assert server.cfg.preload_app is True
+    assert server.cfg.workers == default_workers()
+    assert server.cfg.worker_class is ProductionUvicornWorker
+    assert server.cfg.max_requests_jitter == settings.SERVER_MAX_REQUESTS_JITTER
+    assert ProductionUvicornWorker.CONFIG_KWARGS["loop"] == "uvloop"
+    assert ProductionUvicornWorker.CONFIG_KWARGS["http"] == "httptools"
+
+    monkeypatch.setattr(settings, "SERVER_WORKERS", 3)
+    assert ApiServer(build_options()).cfg.workers == 3
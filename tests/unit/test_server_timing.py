@@ -0,0 +1,73 @@
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+from app.services import board_service
+
+def _phases(response) -> dict[str, float]:
+    phases = {}
+    for entry in response.headers["Server-Timing"].split(", "):
+        name, duration = entry.split(";")[:2]
+        phases[name] = float(duration.removeprefix("dur="))
+    return phases
+
+def _observations(route: str, phase: str) -> float:
+    labels = {"route": route, "phase": phase}
+    return REGISTRY.get_sample_value("http_request_phase_duration_seconds_count", labels) or 0.0
+
+@pytest.mark.asyncio
+async def test_board_list_reports_phases(client: AsyncClient):
+    route = "/api/v1/boards/"
+    db_before = _observations(route, "db")
+    await board_service.invalidate_board_list_cache()
+
+    response = await client.get("/api/v1/boards/?page=7&size=3")
+
+    assert response.status_code == 200
+    phases = _phases(response)
+    # 캐시 조회(redis) -> DB 조회(db) -> 직렬화(render)
+    assert {"redis", "db", "render", "total"} <= phases.keys()
+    assert phases["total"] >= phases["db"]
+    assert _observations(route, "db") == db_before + 1
+
+@pytest.mark.asyncio
+async def test_authenticated_write_reports_auth_and_rate_limit(client: AsyncClient, auth_headers: dict):
+    response = await client.post(
+        "/api/v1/boards/", data={"title": "타이밍", "content": "본문"}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert {"auth", "rate_limit", "redis", "db", "render"} <= _phases(response).keys()
+    assert _observations("/api/v1/boards/", "auth") >= 1
+
+@pytest.mark.asyncio
+async def test_unmatched_paths_share_one_label(client: AsyncClient):
+    before = _observations("unmatched", "total")
+
+    await client.get("/wp-admin/setup.php")
+    await client.get("/.env")
+
+    assert _observations("unmatched", "total") == before + 2
+
+@pytest.mark.asyncio
+async def test_failed_statement_does_not_skew_next_query_timing(test_engine):
+    """실패한 문장의 시작 시각이 커넥션에 남아 다음 쿼리의 db 시간으로 잘못 계산되지 않음"""
+    import asyncio
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+    from app.core.timing import RequestTimings, _timings_var
+
+    timings = RequestTimings()
+    token = _timings_var.set(timings)
+    try:
+        async with test_engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                await conn.execute(text("SELECT * FROM no_such_table"))
+            await asyncio.sleep(0.2)
+            await conn.execute(text("SELECT 1"))
+            assert "query_started_at" not in conn.sync_connection.info
+    finally:
+        _timings_var.reset(token)
+
+    assert timings.counts["db"] == 1
+    assert timings.durations["db"] < 0.1
@@ -0,0 +1,43 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.core.config import settings
+from app.core.static_files import CachedStaticFiles, IMMUTABLE_CACHE_CONTROL, setup_static_files
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "uploads" / "boards").mkdir(parents=True)
+    (tmp_path / "uploads" / "boards" / "image.png").write_bytes(b"png")
+    (tmp_path / "robots.txt").write_text("User-agent: *")
+    return tmp_path
+
+@pytest.mark.asyncio
+async def test_app_mode_serves_uploads_with_immutable_cache(static_dir):
+    app = FastAPI()
+    app.mount("/static", CachedStaticFiles(directory=str(static_dir)), name="static")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        upload = await client.get("/static/uploads/boards/image.png")
+        other = await client.get("/static/robots.txt")
+
+    assert upload.status_code == 200
+    assert upload.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert "cache-control" not in other.headers
+
+@pytest.mark.asyncio
+async def test_nginx_mode_returns_x_accel_redirect_without_body(monkeypatch):
+    """nginx 모드에서는 앱이 파일을 읽지 않고 내부 리다이렉트 헤더만 응답"""
+    monkeypatch.setattr(settings, "STATIC_DELIVERY", "nginx")
+    app = FastAPI()
+    setup_static_files(app)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/static/uploads/boards/image.png")
+        traversal = await client.get("/static/uploads/%2E%2E/secret")
+
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["x-accel-redirect"] == f"{settings.STATIC_X_ACCEL_LOCATION}uploads/boards/image.png"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert traversal.status_code == 404